@@ -143,7 +143,15 @@ class ResearchController(QObject):
                 # Wait a bit for the page to load
                 QTimer.singleShot(1500, self._navigate_next_new_chat)
 
-            browser.navigate_to_new_chat(on_new_chat_done)
+            # A browser built just now is still on about:blank; start the new
+            # chat once its platform page has loaded
+            if browser.has_loaded:
+                browser.navigate_to_new_chat(on_new_chat_done)
+            else:
+                browser.pageLoaded.connect(
+                    lambda *_: browser.navigate_to_new_chat(on_new_chat_done),
+                    Qt.ConnectionType.SingleShotConnection,
+                )
         else:
             self._new_chat_index += 1
             QTimer.singleShot(100, self._navigate_next_new_chat)
@@ -1,6 +1,7 @@
 """Research workspace widget that combines prompts, responses, summaries, and management."""
 
 import hashlib
+import re
 from datetime import datetime
 from typing import List, Optional
 
@@ -462,7 +463,6 @@ class ResearchWorkspace(QWidget):
 
     def _strip_references(self, text: str) -> str:
         """Strip bibliography/references section from extracted text."""
-        import re
         lines = text.split("\n")
         # Match various reference section headers:
         # - Optional numbering like "7." or "VII."
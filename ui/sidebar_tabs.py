@@ -1,19 +1,29 @@
 """Sidebar tabs widget with embedded browser views, logs, and markdown notebook."""
 
+import json
+import logging
 import os
 import re
 import subprocess
+import sys
 import time
-from datetime import datetime
-from html import unescape
+import weakref
+from functools import lru_cache
+from html.parser import HTMLParser
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Callable, Dict, List, Optional
 from urllib.parse import urlparse
 
-from PyQt6.QtCore import Qt, QSize, QUrl, pyqtSignal, QTimer, QEvent, QRectF
-from PyQt6.QtGui import QPainter, QPen, QColor
+from PyQt6.QtCore import Qt, QSize, QUrl, pyqtSignal, pyqtSlot, QTimer, QEvent, QRectF, QSignalBlocker
+from PyQt6.QtGui import QPainter, QPen, QColor, QDesktopServices
 from PyQt6.QtWebEngineWidgets import QWebEngineView
-from PyQt6.QtWebEngineCore import QWebEngineDownloadRequest, QWebEngineProfile, QWebEnginePage
+from PyQt6.QtWebEngineCore import (
+    QWebEngineDownloadRequest,
+    QWebEnginePage,
+    QWebEngineProfile,
+    QWebEngineScript,
+    QWebEngineUrlRequestInterceptor,
+)
 from PyQt6.QtWidgets import (
     QFileDialog,
     QFrame,
@@ -35,11 +45,596 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtGui import QColor, QFont, QTextBlockFormat, QTextCharFormat, QTextCursor, QTextFormat, QTextListFormat
 
 from config import CONFIG_DIR, DARK_THEME, PLATFORMS, get_last_dialog_path, save_dialog_path
+from workers.note_save_worker import NoteSaveWorker, note_save_pool
+
+logger = logging.getLogger(__name__)
+
+# Theme colors and status stylesheets used by frequently-called handlers
+_COLOR_OK = DARK_THEME['success']
+_COLOR_WARN = DARK_THEME['warning']
+_COLOR_MUTED = DARK_THEME['text_secondary']
+
+_STYLE_OK = f"color: {_COLOR_OK}; font-size: 11px;"
+_STYLE_WARN = f"color: {_COLOR_WARN}; font-size: 11px;"
+_STYLE_MUTED = f"color: {_COLOR_MUTED}; font-size: 11px;"
+_STYLE_DOWNLOAD_LABEL = f"font-size: 11px; color: {DARK_THEME['text_primary']};"
+
+# Widget stylesheets shared by every tab instance, built once at import
+_STYLE_BUTTON = f"""
+    QPushButton {{
+        background-color: {DARK_THEME['surface_light']};
+        border: 1px solid {DARK_THEME['border']};
+        border-radius: 4px;
+        padding: 4px 12px;
+        color: {DARK_THEME['text_primary']};
+    }}
+    QPushButton:hover {{
+        background-color: {DARK_THEME['accent']};
+    }}
+"""
+_STYLE_CLEAR_BUTTON = """
+    QPushButton {
+        background-color: #FFCDD2;
+        border: none;
+        border-radius: 4px;
+        padding: 4px 12px;
+        color: #C62828;
+    }
+    QPushButton:hover {
+        background-color: #EF9A9A;
+    }
+"""
+_STYLE_URL_INPUT = f"""
+    QLineEdit {{
+        background-color: {DARK_THEME['background']};
+        color: {DARK_THEME['text_primary']};
+        border: 1px solid {DARK_THEME['border']};
+        border-radius: 4px;
+        padding: 4px 8px;
+        font-size: 11px;
+    }}
+    QLineEdit:focus {{
+        border-color: {DARK_THEME['accent']};
+    }}
+"""
+_STYLE_DOWNLOAD_BAR = f"""
+    QFrame {{
+        background-color: {DARK_THEME['surface']};
+        border-top: 1px solid {DARK_THEME['border']};
+    }}
+"""
+_STYLE_DOWNLOAD_CLOSE = f"""
+    QPushButton {{
+        background: transparent;
+        color: {DARK_THEME['text_secondary']};
+        border: none;
+        font-size: 12px;
+        font-weight: bold;
+    }}
+    QPushButton:hover {{
+        color: {DARK_THEME['text_primary']};
+    }}
+"""
+_STYLE_HEADER = f"""
+    QFrame {{
+        background-color: {DARK_THEME['surface']};
+        border-bottom: 1px solid {DARK_THEME['border']};
+    }}
+"""
+_STYLE_SURFACE = f"background-color: {DARK_THEME['surface']};"
+_STYLE_TITLE = f"color: {DARK_THEME['text_primary']}; font-weight: bold;"
+_STYLE_CAPTION = f"color: {DARK_THEME['text_secondary']}; font-size: 12px;"
+_STYLE_STATUS_READY = "color: #4CAF50; font-weight: bold; font-size: 12px;"
+_STYLE_STATUS_BUSY = "color: #FF9800; font-size: 12px;"
+_STYLE_SEPARATOR = f"background-color: {DARK_THEME['border']};"
+_STYLE_PROMPT_BUTTON = f"""
+    QPushButton {{
+        background-color: {DARK_THEME['surface_light']};
+        color: {DARK_THEME['text_primary']};
+        border: 1px solid {DARK_THEME['border']};
+        border-radius: 4px;
+        padding: 2px 10px;
+        font-size: 11px;
+        font-weight: bold;
+    }}
+    QPushButton:hover {{
+        background-color: #9C27B0;
+        color: white;
+        border-color: #9C27B0;
+    }}
+"""
+_STYLE_TITLE_FRAME = f"background-color: {DARK_THEME['surface']}; border-bottom: 1px solid {DARK_THEME['border']};"
+_STYLE_TITLE_INPUT = f"""
+    QLineEdit {{
+        background-color: {DARK_THEME['surface_light']};
+        color: {DARK_THEME['text_primary']};
+        border: 1px solid {DARK_THEME['border']};
+        border-radius: 4px;
+        padding: 6px 12px;
+        font-size: 14px;
+        font-weight: bold;
+    }}
+    QLineEdit:focus {{
+        border-color: {DARK_THEME['accent']};
+    }}
+"""
+_STYLE_EDITOR = f"""
+    QTextEdit {{
+        background-color: {DARK_THEME['background']};
+        color: {DARK_THEME['text_primary']};
+        border: none;
+        padding: 16px;
+        font-size: 14px;
+        line-height: 1.6;
+    }}
+    QScrollBar:vertical {{
+        background-color: {DARK_THEME['surface']};
+        width: 10px;
+        border-radius: 5px;
+    }}
+    QScrollBar::handle:vertical {{
+        background-color: {DARK_THEME['border']};
+        border-radius: 5px;
+        min-height: 20px;
+    }}
+    QScrollBar::handle:vertical:hover {{
+        background-color: {DARK_THEME['text_secondary']};
+    }}
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
+        height: 0px;
+    }}
+"""
+_STYLE_EDITOR_DOCUMENT = f"""
+    body {{ line-height: 1.3; }}
+    hr {{ border: none; border-top: 1px solid {DARK_THEME['border']}; margin: 8px 0; }}
+    blockquote {{
+        border-left: 3px solid {DARK_THEME['border']};
+        padding-left: 12px;
+        color: {DARK_THEME['text_secondary']};
+        font-style: italic;
+        margin: 8px 0;
+    }}
+"""
+_STYLE_FOOTER = f"background-color: {DARK_THEME['surface']}; border-top: 1px solid {DARK_THEME['border']};"
+_STYLE_BACKGROUND = f"background-color: {DARK_THEME['background']};"
+_STYLE_DOWNLOADS_BUTTON = f"""
+    QPushButton {{
+        background-color: {DARK_THEME['surface_light']};
+        color: {DARK_THEME['text_primary']};
+        border: 1px solid {DARK_THEME['border']};
+        border-radius: 4px;
+        padding: 4px 12px;
+        font-size: 11px;
+    }}
+    QPushButton:hover {{
+        background-color: {DARK_THEME['accent']};
+        border-color: {DARK_THEME['accent']};
+    }}
+"""
+_STYLE_DOWNLOADS_FOLDER_FRAME = f"""
+    QFrame {{
+        background-color: {DARK_THEME['background']};
+        border-bottom: 1px solid {DARK_THEME['border']};
+    }}
+"""
+_STYLE_DOWNLOADS_FOLDER_CAPTION = f"font-size: 11px; color: {DARK_THEME['text_secondary']};"
+_STYLE_DOWNLOADS_SCROLL = f"""
+    QScrollArea {{
+        border: none;
+        background-color: {DARK_THEME['background']};
+    }}
+    QScrollBar:vertical {{
+        background-color: {DARK_THEME['surface']};
+        width: 8px;
+        border-radius: 4px;
+    }}
+    QScrollBar::handle:vertical {{
+        background-color: {DARK_THEME['border']};
+        border-radius: 4px;
+        min-height: 20px;
+    }}
+    QScrollBar::handle:vertical:hover {{
+        background-color: {DARK_THEME['text_secondary']};
+    }}
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
+        height: 0px;
+    }}
+"""
+_STYLE_DOWNLOADS_EMPTY = f"color: {DARK_THEME['text_secondary']}; font-size: 12px; padding: 40px;"
+# Horizontal rule inserted into the notebook for --- (typed or loaded)
+_HR_HTML = f'<hr style="border: none; border-top: 1px solid {DARK_THEME["border"]};" />'
+
+# Markdown patterns used by the notebook editor, compiled once at import.
+# Live conversions that fire on the space typed after a block prefix. Each
+# alternative is one named group, so match.lastgroup names the conversion.
+_RE_LIVE_SPACE = re.compile(
+    r'^(?:(?P<header>(?P<hashes>#{1,3})\s+(?P<header_text>.+)\s)'
+    r'|(?P<hr>---\s*)'
+    r'|(?P<quote>>\s+(?P<quote_text>.+)\s)'
+    r'|(?P<bullet>[-*]\s+(?P<bullet_text>.+)\s))$'
+)
+# Live conversions that fire on the space typed after a closed inline span.
+# Anchored at the end so a search bounded by endpos only finds spans that
+# close exactly there.
+_RE_LIVE_CLOSED = re.compile(
+    r'(?:(?P<bold>\*\*(?P<bold_text>[^*]+)\*\*\s)'
+    r'|(?P<italic>(?<!\*)\*(?P<italic_text>[^*]+)\*(?!\*)\s)'
+    r'|(?P<strike>~~(?P<strike_text>[^~]+)~~\s)'
+    r'|(?P<code>`(?P<code_text>[^`]+)`\s))\Z'
+)
+# How far back from the cursor a closed inline span may start
+_LIVE_CLOSED_LOOKBACK = 200
+# Markdown file loading; block lines are classified by _classify_markdown_line
+_RE_INLINE_SYNTAX = re.compile(r'\*\*|__|\*|_|~~|`|<u>|</u>')
+_RE_INLINE_MARKDOWN = re.compile(
+    r'(`([^`]+)`)'            # inline code
+    r'|(\*\*(.+?)\*\*)'      # bold
+    r'|(\*(.+?)\*)'          # italic
+    r'|(~~(.+?)~~)'          # strikethrough
+    r'|(<u>(.+?)</u>)'       # underline
+    r'|([^*~`<]+)'           # plain text
+    r'|([*~`<])'            # leftover markers
+)
+# Document HTML (from toHtml()) back to markdown when saving
+_RE_BODY = re.compile(r'<body[^>]*>(.*)</body>', re.DOTALL)
+# Span style -> inline markdown kind in priority order; a span converts to
+# the first kind its style matches
+_SPAN_STYLE_KINDS = (
+    ("code", re.compile(r'font-family:[^>]*[Cc]ourier')),
+    ("bold", re.compile(r'font-weight:(?:bold|[6-9]\d\d)')),
+    ("italic", re.compile(r'font-style:italic')),
+    ("strike", re.compile(r'text-decoration:[^>]*line-through')),
+    ("underline", re.compile(r'text-decoration:[^>]*underline')),
+)
+_INLINE_TAG_KINDS = {"b": "bold", "strong": "bold", "i": "italic", "em": "italic", "s": "strike", "del": "strike"}
+# Any bold, italic or strikethrough run in the document HTML
+_RE_STYLED_RUN = re.compile(r'font-weight:(?:bold|[6-9]\d\d)|font-style:italic|line-through|<(?:b|strong|i|em|s|del)>')
+_HEADING_TAGS = {f"h{level}": level for level in range(1, 7)}
+_INLINE_MD_MARKERS = {
+    "code": ("`", "`"),
+    "bold": ("**", "**"),
+    "italic": ("*", "*"),
+    "strike": ("~~", "~~"),
+    "underline": ("<u>", "</u>"),
+}
+
+# Shared browser profile storage locations
+_BROWSER_DATA_PATH = str(CONFIG_DIR / "browser_data")
+_BROWSER_CACHE_PATH = str(CONFIG_DIR / "browser_cache")
+_BROWSER_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+
+@lru_cache(maxsize=None)
+def _toolbar_button_style(font_style: str) -> str:
+    """Return the notebook toolbar button stylesheet for a font style variant."""
+    return f"""
+        QPushButton {{
+            background-color: {DARK_THEME['surface_light']};
+            color: {DARK_THEME['text_primary']};
+            border: 1px solid {DARK_THEME['border']};
+            border-radius: 3px;
+            padding: 2px 8px;
+            font-size: 11px;
+            {font_style}
+        }}
+        QPushButton:hover {{
+            background-color: {DARK_THEME['accent']};
+            border-color: {DARK_THEME['accent']};
+        }}
+        QPushButton:checked {{
+            background-color: {DARK_THEME['accent']};
+            border-color: {DARK_THEME['accent']};
+        }}
+    """
+
+
+@lru_cache(maxsize=8)
+def _js_string_literal(text: str) -> str:
+    """Encode text as a JavaScript string literal (JSON is valid JS).
+
+    "</" is escaped as well so the literal can never close a script element.
+    Cached because one prompt is usually filled into every platform in turn.
+    """
+    return json.dumps(text).replace("</", "<\\/")
+
+
+def _classify_markdown_line(line: str) -> tuple:
+    """Classify a stripped, non-empty markdown line as (kind, level, text).
+
+    kind is "heading", "quote", "hr", "bullet", "number" or "paragraph";
+    level is the heading level and 0 otherwise. Scans leading characters
+    directly instead of trying a regex per block syntax.
+    """
+    first = line[0]
+    size = len(line)
+
+    # Heading: # ## ### followed by whitespace
+    if first == '#':
+        level = size - len(line.lstrip('#'))
+        if level <= 3 and level < size and line[level].isspace():
+            return "heading", level, line[level:].lstrip()
+
+    # Blockquote: > text
+    elif first == '>':
+        return "quote", 0, line[1:].lstrip()
+
+    # Horizontal rule: --- or longer
+    elif first == '-' and size >= 3 and not line.strip('-'):
+        return "hr", 0, ""
+
+    # Unordered list: - or * item
+    if first in '-*':
+        if size > 1 and line[1].isspace():
+            return "bullet", 0, line[1:].lstrip()
+
+    # Ordered list: 1. item
+    elif first.isdecimal():
+        dot = 1
+        while dot < size and line[dot].isdecimal():
+            dot += 1
+        if dot + 1 < size and line[dot] == '.' and line[dot + 1].isspace():
+            return "number", 0, line[dot + 1:].lstrip()
+
+    return "paragraph", 0, line
+
+
+def _char_format(point_size: float = 0, bold: bool = False, italic: bool = False, strike: bool = False,
+                 underline: bool = False, family: str = "", foreground=None, background=None) -> QTextCharFormat:
+    """Build a char format setting only the given properties, for merging."""
+    fmt = QTextCharFormat()
+    if point_size:
+        fmt.setFontPointSize(point_size)
+    if bold:
+        fmt.setFontWeight(QFont.Weight.Bold)
+    if italic:
+        fmt.setFontItalic(True)
+    if strike:
+        fmt.setFontStrikeOut(True)
+    if underline:
+        fmt.setFontUnderline(True)
+    if family:
+        fmt.setFontFamily(family)
+    if foreground is not None:
+        fmt.setForeground(foreground)
+    if background is not None:
+        fmt.setBackground(background)
+    return fmt
+
+
+def _heading_block_format(level: int) -> QTextBlockFormat:
+    """Build the block format merged into heading blocks of the given level."""
+    fmt = QTextBlockFormat()
+    fmt.setHeadingLevel(level)
+    fmt.setTopMargin(16)
+    fmt.setBottomMargin(8)
+    fmt.setLineHeight(150, 1)
+    return fmt
+
+
+def _quote_block_format() -> QTextBlockFormat:
+    """Build the block format merged into blockquote blocks."""
+    fmt = QTextBlockFormat()
+    fmt.setProperty(QTextFormat.Property.BlockQuoteLevel, 1)
+    fmt.setLeftMargin(20)
+    return fmt
+
+
+def _merged_char_formats(bases: dict, overlays: tuple) -> dict:
+    """Map each key of bases to copies of its format merged with each overlay."""
+    table = {}
+    for key, base in bases.items():
+        merged = []
+        for overlay in overlays:
+            fmt = QTextCharFormat(base)
+            fmt.merge(overlay)
+            merged.append(fmt)
+        table[key] = tuple(merged)
+    return table
+
+
+def _unstyled_char_format() -> QTextCharFormat:
+    """Build the char format set on spaces trimmed out of styled runs."""
+    fmt = QTextCharFormat()
+    fmt.setFontWeight(QFont.Weight.Normal)
+    fmt.setFontItalic(False)
+    fmt.setFontStrikeOut(False)
+    return fmt
+
+
+
+class _MarkdownHtmlParser(HTMLParser):
+    """Convert the body of QTextDocument.toHtml() to markdown lines in one pass.
+
+    Block tags (headings, paragraphs, blockquote paragraphs, list items and
+    rules) each add a line to ``lines``; formatting spans inside a block
+    become markdown markers. Other tags inside a block are kept as written,
+    except within a formatting span.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.lines = []
+        self._block = None      # Tag of the block being collected
+        self._prefix = ""       # Markdown prefix of the block's line
+        self._skip = ()         # Inline kinds the block's own style implies
+        self._parts = []        # Markdown of the block so far
+        self._plain = []        # Text of the block without markers
+        self._closers = []      # Closing marker per open span or inline tag
+        self._lists = []        # [tag, items so far] per open list
+        self._quote = False
+        self._quote_paragraphs = False
+
+    def _begin(self, tag, prefix="", skip=()):
+        self._block = tag
+        self._prefix = prefix
+        self._skip = skip
+        self._parts = []
+        self._plain = []
+        self._closers = []
+
+    def _end(self):
+        text = "".join(self._parts).strip()
+        tag = self._block
+        self._block = None
+        if tag in _HEADING_TAGS or tag == "li":
+            self.lines.append(self._prefix + text)
+        elif self._quote:
+            if text:
+                self.lines.append(self._prefix + text)
+            # Text between a blockquote's paragraphs is dropped
+            self._begin("blockquote", "> ", ("italic",))
+        elif not text:
+            self.lines.append("")  # Empty paragraph = blank line
+        else:
+            plain = "".join(self._plain).strip()
+            if plain and all(c in '\u2500\u2501\u2502\u2503' for c in plain):
+                self.lines.append("---")  # Horizontal rule unicode
+            else:
+                self.lines.append(text)
+
+    def handle_startendtag(self, tag, attrs):
+        # <br />, <hr /> and the like have no end tag to handle
+        self.handle_starttag(tag, attrs)
+
+    def handle_starttag(self, tag, attrs):
+        if tag in ("ul", "ol"):
+            self._lists.append([tag, 0])
+        elif tag == "blockquote":
+            self._quote = True
+            self._quote_paragraphs = False
+            self._begin(tag, "> ", ("italic",))
+        elif self._quote and tag == "p":
+            self._quote_paragraphs = True
+            self._begin(tag, "> ", ("italic",))
+        elif self._block is None:
+            if tag in _HEADING_TAGS:
+                self._begin(tag, "#" * _HEADING_TAGS[tag] + " ", ("bold",))
+            elif tag == "p":
+                self._begin(tag)
+            elif tag == "li":
+                prefix = "- "
+                if self._lists:
+                    current = self._lists[-1]
+                    current[1] += 1
+                    if current[0] == "ol":
+                        prefix = f"{current[1]}. "
+                self._begin(tag, prefix)
+            elif tag == "hr":
+                self.lines.append("---")
+        elif tag == "span" or tag in _INLINE_TAG_KINDS:
+            if tag == "span":
+                style = self.get_starttag_text()
+                kind = next((kind for kind, pattern in _SPAN_STYLE_KINDS
+                             if kind not in self._skip and pattern.search(style)), None)
+            else:
+                kind = _INLINE_TAG_KINDS[tag]
+                if kind in self._skip:
+                    kind = None
+            if kind:
+                opener, closer = _INLINE_MD_MARKERS[kind]
+                self._parts.append(opener)
+                self._closers.append(closer)
+            else:
+                self._closers.append("")
+        elif tag != "br" and not any(self._closers):
+            self._parts.append(self.get_starttag_text())
+
+    def handle_endtag(self, tag):
+        if tag in ("ul", "ol"):
+            if self._lists:
+                self._lists.pop()
+        elif tag == "blockquote":
+            if self._quote and not self._quote_paragraphs:
+                self._end()
+            self._quote = False
+            self._block = None
+        elif tag == self._block:
+            self._end()
+        elif self._block is None:
+            return
+        elif tag == "span" or tag in _INLINE_TAG_KINDS:
+            if self._closers:
+                self._parts.append(self._closers.pop())
+        elif tag != "br" and not any(self._closers):
+            self._parts.append(f"</{tag}>")
+
+    def handle_data(self, data):
+        if self._block is not None:
+            self._parts.append(data)
+            self._plain.append(data)
+
+
+class TrackerBlocker(QWebEngineUrlRequestInterceptor):
+    """Blocks requests to known analytics and ad hosts for the shared profile."""
+
+    BLOCKED_HOSTS = frozenset({
+        "google-analytics.com",
+        "googletagmanager.com",
+        "doubleclick.net",
+        "googlesyndication.com",
+        "segment.io",
+        "cdn.segment.com",
+        "hotjar.com",
+        "mixpanel.com",
+        "fullstory.com",
+        "browser-intake-datadoghq.com",
+    })
+
+    def interceptRequest(self, info):
+        host = info.requestUrl().host()
+        # Check the host and each parent domain against the block list
+        while host:
+            if host in self.BLOCKED_HOSTS:
+                info.block(True)
+                return
+            host = host.partition(".")[2]
 
 
 class BrowserPage(QWebEnginePage):
     """Custom page that handles new window requests and enables PDF viewing."""
 
+    # Hosts owned by each AI platform; link clicks elsewhere open in the Google tab
+    _PLATFORM_DOMAINS = {
+        "chatgpt": ("chat.openai.com", "chatgpt.com", "openai.com"),
+        "gemini": ("gemini.google.com",),
+        "perplexity": ("perplexity.ai",),
+        "claude": ("claude.ai", "anthropic.com"),
+    }
+
+    # Substrings marking auth/login URLs that must stay in the platform tab
+    _AUTH_URL_MARKERS = (
+        "accounts.google.com",
+        "auth0.com",
+        "login.microsoftonline.com",
+        "appleid.apple.com",
+        "github.com/login",
+        "github.com/sessions",
+        "openai.com",
+        "anthropic.com",
+        "perplexity.ai",
+        "auth.perplexity",
+        "login.",
+        "signin.",
+        "signup.",
+        "logout.",
+        "oauth",
+        "/auth/",
+        "/login",
+        "/logout",
+        "/signin",
+        "/signup",
+        "/sso/",
+    )
+
+    # Domains that mark a sign-in popup as finished for each platform
+    _POPUP_RETURN_DOMAINS = {
+        "chatgpt": ("chat.openai.com", "chatgpt.com"),
+        "gemini": ("gemini.google.com",),
+        "perplexity": ("perplexity.ai",),
+        "claude": ("claude.ai",),
+        "google": ("google.com",),
+    }
+
     def __init__(self, profile, browser_view, parent=None):
         super().__init__(profile, parent)
         self._browser_view = browser_view
@@ -50,7 +645,7 @@ class BrowserPage(QWebEnginePage):
 
     def createWindow(self, _window_type):
         """Handle popup windows (account switcher, OAuth) in a dialog."""
-        print(f"[POPUP] createWindow called from {self._browser_view.platform}, type={_window_type}")
+        logger.debug("[POPUP] createWindow called from %s, type=%s", self._browser_view.platform, _window_type)
         dialog = QDialog(self._browser_view.window())
         dialog.setWindowTitle("Sign In")
         dialog.resize(QSize(500, 700))
@@ -76,16 +671,10 @@ class BrowserPage(QWebEnginePage):
 
         nav_timer.timeout.connect(do_navigate)
 
+        match_domains = self._POPUP_RETURN_DOMAINS.get(self._browser_view.platform, ())
+
         def on_url_changed(url):
             url_str = url.toString()
-            platform_domains = {
-                "chatgpt": ["chat.openai.com", "chatgpt.com"],
-                "gemini": ["gemini.google.com"],
-                "perplexity": ["perplexity.ai"],
-                "claude": ["claude.ai"],
-                "google": ["google.com"],
-            }
-            match_domains = platform_domains.get(self._browser_view.platform, [])
             if any(d in url_str for d in match_domains):
                 pending_url[0] = url_str
                 nav_timer.start()  # Reset the 500ms timer on each matching URL
@@ -97,50 +686,28 @@ class BrowserPage(QWebEnginePage):
 
     def acceptNavigationRequest(self, url, nav_type, is_main_frame):
         """Accept all navigation requests. Redirect external links to Google tab for AI platforms."""
-        url_str = url.toString()
         platform = self._browser_view.platform
 
         # For AI platforms, intercept external link clicks and open in Google tab
-        if platform != "google" and is_main_frame:
-            print(f"[NAV] {platform}: {nav_type} -> {url_str[:120]}")
+        if platform != "google" and is_main_frame and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[NAV] %s: %s -> %s", platform, nav_type, url.toString()[:120])
         if platform != "google" and is_main_frame and nav_type == QWebEnginePage.NavigationType.NavigationTypeLinkClicked:
-            platform_domains = {
-                "chatgpt": ["chat.openai.com", "chatgpt.com", "openai.com"],
-                "gemini": ["gemini.google.com"],
-                "perplexity": ["perplexity.ai"],
-                "claude": ["claude.ai", "anthropic.com"],
-            }
-            domains = platform_domains.get(platform, [])
-            # Allow auth/login domains to stay in the platform tab
-            auth_domains = [
-                "accounts.google.com",
-                "auth0.com",
-                "login.microsoftonline.com",
-                "appleid.apple.com",
-                "github.com/login",
-                "github.com/sessions",
-                "openai.com",
-                "anthropic.com",
-                "perplexity.ai",
-                "auth.perplexity",
-                "login.",
-                "signin.",
-                "signup.",
-                "logout.",
-                "oauth",
-                "/auth/",
-                "/login",
-                "/logout",
-                "/signin",
-                "/signup",
-                "/sso/",
-            ]
-            is_auth = any(auth in url_str for auth in auth_domains)
-            is_own_domain = any(d in url_str for d in domains)
-            if domains and not is_own_domain and not is_auth:
-                print(f"[NAV] Redirecting to Google tab: {platform} -> {url_str[:100]}")
-                self._browser_view.openInGoogleTab.emit(url_str)
-                return False
+            domains = self._PLATFORM_DOMAINS.get(platform)
+            if not domains:
+                return True
+
+            host = url.host()
+            if any(host == d or host.endswith("." + d) for d in domains):
+                return True
+
+            # Allow auth/login URLs to stay in the platform tab
+            url_str = url.toString()
+            if any(marker in url_str for marker in self._AUTH_URL_MARKERS):
+                return True
+
+            logger.debug("[NAV] Redirecting to Google tab: %s -> %s", platform, url_str[:100])
+            self._browser_view.openInGoogleTab.emit(url_str)
+            return False
 
         return True
 
@@ -154,37 +721,155 @@ class PlatformBrowser(QWebEngineView):
 
     # Shared profile for persistent cookies across all browsers
     _shared_profile = None
+    _request_interceptor = None
 
     def __init__(self, platform: str, parent=None):
         super().__init__(parent)
         self.platform = platform
+        self._response_text = ""  # Reply text rebuilt from page deltas
+        self.has_loaded = False  # Set once pageLoaded has fired for the first page
         self._setup_browser()
 
-    # Class-level list of listeners for download events
-    _download_listeners = []
+    # Class-level registry of download event listeners, held weakly so closed
+    # widgets are not kept alive by the shared profile. Each entry is
+    # (listener ref, page ref or None); a listener tied to a page only hears
+    # about downloads that page started.
+    _download_listeners: Dict[tuple, tuple] = {}
+    _listeners_version = 0  # Bumped whenever the registry changes
+    _download_handler_connected = False
     _download_directory = str(Path.home() / "Downloads")
+    _PROGRESS_INTERVAL = 0.1  # Minimum seconds between progress notifications
+    _READY_POLL_MS = 50  # Interval for polling page-side flags and results
+
+    # Page-side helper name -> class attribute holding its JS function source
+    _PAGE_HELPERS = (
+        ("__rb_set_field_value", "_SET_FIELD_VALUE_SCRIPT"),
+        ("__rb_caret_to_end", "_CARET_TO_END_SCRIPT"),
+        ("__rb_fill_gemini", "_GEMINI_FILL_SCRIPT"),
+        ("__rb_send_gemini", "_GEMINI_SEND_SCRIPT"),
+        ("__rb_fill_perplexity", "_PERPLEXITY_FILL_SCRIPT"),
+        ("__rb_send_perplexity", "_PERPLEXITY_SEND_SCRIPT"),
+        ("__rb_fill_chatgpt", "_CHATGPT_FILL_SCRIPT"),
+        ("__rb_send_chatgpt", "_CHATGPT_SEND_SCRIPT"),
+        ("__rb_fill_claude", "_CLAUDE_FILL_SCRIPT"),
+        ("__rb_send_claude", "_CLAUDE_SEND_SCRIPT"),
+        ("__rb_response_cache", "_RESPONSE_CACHE_SCRIPT"),
+        ("__rb_response_delta", "_RESPONSE_DELTA_SCRIPT"),
+        ("__rb_response_gemini", "_GEMINI_RESPONSE_SCRIPT"),
+        ("__rb_response_perplexity", "_PERPLEXITY_RESPONSE_SCRIPT"),
+        ("__rb_response_chatgpt", "_CHATGPT_RESPONSE_SCRIPT"),
+        ("__rb_response_claude", "_CLAUDE_RESPONSE_SCRIPT"),
+        ("__rb_generating", "_GENERATING_SCRIPT"),
+    )
+
+    # Standard context menu entries (lowercased) hidden from the embedded views
+    _CONTEXT_MENU_REMOVE_PHRASES = ("new tab", "new window", "page source", "view source")
 
     @classmethod
     def get_shared_profile(cls):
         """Get or create shared profile with persistent storage."""
         if cls._shared_profile is None:
-            storage_path = str(CONFIG_DIR / "browser_data")
-
             cls._shared_profile = QWebEngineProfile("ResearchBot", None)
-            cls._shared_profile.setPersistentStoragePath(storage_path)
-            cls._shared_profile.setCachePath(str(CONFIG_DIR / "browser_cache"))
+            cls._shared_profile.setPersistentStoragePath(_BROWSER_DATA_PATH)
+            cls._shared_profile.setCachePath(_BROWSER_CACHE_PATH)
+            # Keep platform JS bundles on disk so warm starts skip refetching
+            cls._shared_profile.setHttpCacheType(QWebEngineProfile.HttpCacheType.DiskHttpCache)
+            cls._shared_profile.setHttpCacheMaximumSize(_BROWSER_CACHE_MAX_BYTES)
+            cls._install_page_helpers(cls._shared_profile)
+
+            # Keep a reference; the profile does not take ownership of the interceptor
+            cls._request_interceptor = TrackerBlocker()
+            cls._shared_profile.setUrlRequestInterceptor(cls._request_interceptor)
             cls._shared_profile.setPersistentCookiesPolicy(
                 QWebEngineProfile.PersistentCookiesPolicy.AllowPersistentCookies
             )
-
-            # Connect download handler so file downloads work
-            cls._shared_profile.downloadRequested.connect(cls._on_download_requested)
         return cls._shared_profile
 
     @classmethod
-    def add_download_listener(cls, listener):
-        """Register a callback for download events: listener(filename, state)."""
-        cls._download_listeners.append(listener)
+    def _install_page_helpers(cls, profile):
+        """Install the platform page functions into every document of the profile.
+
+        Sends and response polls then only ship a short call (plus the prompt
+        literal) over IPC instead of the full multi-KB script, and V8 compiles
+        each helper once per page load.
+        """
+        scripts = profile.scripts()
+        for name, attr in cls._PAGE_HELPERS:
+            script = QWebEngineScript()
+            script.setName(name)
+            script.setSourceCode(f"window.{name} = {getattr(cls, attr)};")
+            script.setInjectionPoint(QWebEngineScript.InjectionPoint.DocumentReady)
+            script.setWorldId(QWebEngineScript.ScriptWorldId.MainWorld)
+            script.setRunsOnSubFrames(False)
+            scripts.insert(script)
+
+    @classmethod
+    def add_download_listener(cls, listener, browser: Optional["PlatformBrowser"] = None):
+        """Register a callback for download events: listener(filename, state, percent).
+
+        With a browser, only downloads started from that browser's page are
+        reported (downloads from pages no listener claims, such as popups,
+        still go to everyone).
+        """
+        # Connect the download handler on first use so the profile does no
+        # download work until something wants to hear about it
+        if not cls._download_handler_connected:
+            cls.get_shared_profile().downloadRequested.connect(cls._on_download_requested)
+            cls._download_handler_connected = True
+
+        key = cls._download_listener_key(listener)
+        if hasattr(listener, "__self__"):
+            ref = weakref.WeakMethod(listener)
+            # Unregister with the owning widget, so the handler is
+            # disconnected as soon as the last listener goes away
+            destroyed = getattr(listener.__self__, "destroyed", None)
+            if destroyed is not None and key not in cls._download_listeners:
+                destroyed.connect(lambda *_: cls._discard_download_listener(key))
+        else:
+            ref = lambda: listener
+        source = weakref.ref(browser.page()) if browser is not None else None
+        cls._download_listeners[key] = (ref, source)
+        cls._listeners_version += 1
+
+    @classmethod
+    def remove_download_listener(cls, listener):
+        """Unregister a download callback, disconnecting the handler when none remain."""
+        cls._discard_download_listener(cls._download_listener_key(listener))
+
+    @staticmethod
+    def _download_listener_key(listener) -> tuple:
+        """Key a listener by its owner and function, so bound methods compare equal."""
+        if hasattr(listener, "__self__"):
+            return (id(listener.__self__), listener.__func__)
+        return (id(listener), None)
+
+    @classmethod
+    def _discard_download_listener(cls, key: tuple):
+        """Drop a registry entry, disconnecting the handler when none remain."""
+        if cls._download_listeners.pop(key, None) is not None:
+            cls._listeners_version += 1
+        cls._disconnect_download_handler_if_idle()
+
+    @classmethod
+    def _disconnect_download_handler_if_idle(cls):
+        """Disconnect the profile's download handler once no listeners remain."""
+        if not cls._download_listeners and cls._download_handler_connected:
+            cls.get_shared_profile().downloadRequested.disconnect(cls._on_download_requested)
+            cls._download_handler_connected = False
+
+    @classmethod
+    def _live_download_listeners(cls, wants: Callable) -> list:
+        """Resolve listeners whose source passes wants(), pruning collected ones."""
+        listeners = []
+        for key, (ref, source) in list(cls._download_listeners.items()):
+            listener = ref()
+            if listener is None:
+                del cls._download_listeners[key]
+                cls._listeners_version += 1
+            elif wants(source):
+                listeners.append(listener)
+        cls._disconnect_download_handler_if_idle()
+        return listeners
 
     @classmethod
     def set_download_directory(cls, path: str):
@@ -205,46 +890,111 @@ class PlatformBrowser(QWebEngineView):
         suggested_name = download.downloadFileName()
         save_path = downloads_dir / suggested_name
 
-        # Avoid overwriting by appending a number
+        # Avoid overwriting by appending a number. Each candidate costs one
+        # O_CREAT|O_EXCL open instead of separate exists() stats. The probe
+        # file is removed again since Qt creates its own, so this is not a
+        # reservation: a download started before Qt writes the file can
+        # still pick the same name.
         counter = 1
         stem = save_path.stem
         suffix = save_path.suffix
-        while save_path.exists():
-            save_path = downloads_dir / f"{stem} ({counter}){suffix}"
-            counter += 1
+        while True:
+            try:
+                fd = os.open(str(save_path), os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600)
+            except FileExistsError:
+                save_path = downloads_dir / f"{stem} ({counter}){suffix}"
+                counter += 1
+                continue
+            except OSError:
+                break  # Let Qt report the failure through the download state
+            os.close(fd)
+            os.unlink(str(save_path))
+            break
 
         download.setDownloadDirectory(str(downloads_dir))
         download.setDownloadFileName(save_path.name)
 
         filename = save_path.name
 
+        # Route to the tab whose page started the download; listeners without
+        # a page, and downloads from pages no listener owns, go to everyone
+        origin = download.page()
+        owned = origin is not None and any(
+            source is not None and source() is origin
+            for _ref, source in cls._download_listeners.values()
+        )
+
+        def wants(source):
+            return source is None or not owned or source() is origin
+
+        def matching_refs():
+            return tuple(ref for ref, source in cls._download_listeners.values() if wants(source))
+
         # Notify listeners of download start
-        for listener in cls._download_listeners:
+        for listener in cls._live_download_listeners(wants):
             listener(filename, "started", 0)
 
-        def on_progress(bytes_received, bytes_total):
+        # (version, weak refs) snapshot of the matching listeners, rebuilt only
+        # when a listener is added or pruned rather than on every tick
+        snapshot = [cls._listeners_version, matching_refs()]
+
+        def notify(state, percent):
+            if snapshot[0] != cls._listeners_version:
+                snapshot[0] = cls._listeners_version
+                snapshot[1] = matching_refs()
+            for ref in snapshot[1]:
+                cb = ref()
+                if cb is not None:
+                    cb(filename, state, percent)
+
+        # Last notified (time, percent); progress is coalesced to ~10Hz or 1% steps
+        last_emit = [0.0, 0]
+        # Total size rarely changes after headers arrive, so cache it and only
+        # refresh on totalBytesChanged instead of querying it every tick
+        total_bytes = [download.totalBytes()]
+
+        def on_total_changed():
+            total_bytes[0] = download.totalBytes()
+
+        def on_progress():
+            bytes_received = download.receivedBytes()
+            bytes_total = total_bytes[0]
             if bytes_total > 0:
                 percent = int(bytes_received * 100 / bytes_total)
             else:
                 percent = -1  # Unknown total size
-            for cb in cls._download_listeners:
-                cb(filename, "progress", percent)
+
+            now = time.monotonic()
+            if (now - last_emit[0] < cls._PROGRESS_INTERVAL
+                    and abs(percent - last_emit[1]) < 1
+                    and bytes_received != bytes_total):
+                return
+            last_emit[0] = now
+            last_emit[1] = percent
+
+            notify("progress", percent)
 
         def on_state_changed(state):
             if state == QWebEngineDownloadRequest.DownloadState.DownloadCompleted:
-                for cb in cls._download_listeners:
-                    cb(filename, "completed", 100)
+                notify("completed", 100)
             elif state == QWebEngineDownloadRequest.DownloadState.DownloadCancelled:
-                for cb in cls._download_listeners:
-                    cb(filename, "cancelled", 0)
+                notify("cancelled", 0)
             elif state == QWebEngineDownloadRequest.DownloadState.DownloadInterrupted:
-                for cb in cls._download_listeners:
-                    cb(filename, "failed", 0)
+                notify("failed", 0)
+            else:
+                return
 
-        download.receivedBytesChanged.connect(
-            lambda: on_progress(download.receivedBytes(), download.totalBytes())
+            # Terminal state: drop our connections so the profile-owned request
+            # stops dispatching to (and keeping alive) these closures
+            download.totalBytesChanged.disconnect(connections[0])
+            download.receivedBytesChanged.disconnect(connections[1])
+            download.stateChanged.disconnect(connections[2])
+
+        connections = (
+            download.totalBytesChanged.connect(on_total_changed),
+            download.receivedBytesChanged.connect(on_progress),
+            download.stateChanged.connect(on_state_changed),
         )
-        download.stateChanged.connect(on_state_changed)
         download.accept()
 
     def _setup_browser(self):
@@ -252,16 +1002,30 @@ class PlatformBrowser(QWebEngineView):
         profile = self.get_shared_profile()
         page = BrowserPage(profile, self, self)
         page.renderProcessTerminated.connect(
-            lambda status, code: print(f"[RENDERER] {self.platform} terminated: status={status}, code={code}")
+            lambda status, code: logger.warning(
+                "[RENDERER] %s terminated: status=%s, code=%s", self.platform, status, code
+            )
         )
         self.setPage(page)
+        self._page = page
+
+        # SPAs fire several loadFinished events per navigation; only report the last
+        self._page_loaded_timer = QTimer(self)
+        self._page_loaded_timer.setSingleShot(True)
+        self._page_loaded_timer.setInterval(250)
+        self._page_loaded_timer.timeout.connect(self._emit_page_loaded)
 
         self.loadFinished.connect(self._on_load_finished)
 
     def _on_load_finished(self, ok: bool):
         """Handle page load completion."""
         if ok:
-            self.pageLoaded.emit(self.platform)
+            self._page_loaded_timer.start()
+
+    def _emit_page_loaded(self):
+        """Report the settled page load, marking the browser as loaded."""
+        self.has_loaded = True
+        self.pageLoaded.emit(self.platform)
 
     def contextMenuEvent(self, event):
         """Custom right-click context menu."""
@@ -270,9 +1034,7 @@ class PlatformBrowser(QWebEngineView):
         for action in menu.actions():
             text = action.text().lower()
             # Remove open in new tab/window and view page source
-            if any(phrase in text for phrase in [
-                "new tab", "new window", "page source", "view source"
-            ]):
+            if any(phrase in text for phrase in self._CONTEXT_MENU_REMOVE_PHRASES):
                 actions_to_remove.append(action)
 
         for action in actions_to_remove:
@@ -297,9 +1059,41 @@ class PlatformBrowser(QWebEngineView):
     def execute_js(self, script: str, callback=None):
         """Execute JavaScript on the page."""
         if callback:
-            self.page().runJavaScript(script, callback)
+            self._page.runJavaScript(script, callback)
         else:
-            self.page().runJavaScript(script)
+            self._page.runJavaScript(script)
+
+    def _call_page_helper(self, name: str, callback, arg_literal: str = "",
+                          fallback_literal: str = "'page not ready'"):
+        """Invoke a helper installed by _install_page_helpers() with a JS literal argument.
+
+        fallback_literal is the JS value returned when the helper is not installed yet.
+        """
+        self.execute_js(f"window.{name} ? {name}({arg_literal}) : {fallback_literal}", callback)
+
+    def _wait_for_page_value(self, expression: str, callback, max_wait_ms: int):
+        """Poll a JS expression until it is truthy, then call callback with its value.
+
+        callback receives None instead if max_wait_ms passes first.
+        """
+        deadline = time.monotonic() + max_wait_ms / 1000
+
+        def poll():
+            def on_value(value):
+                if value:
+                    callback(value)
+                elif time.monotonic() >= deadline:
+                    callback(None)
+                else:
+                    QTimer.singleShot(self._READY_POLL_MS, poll)
+
+            self.execute_js(expression, on_value)
+
+        poll()
+
+    def _when_ready_to_send(self, send, max_wait_ms: int):
+        """Call send() once the fill script flags the page ready, or after max_wait_ms."""
+        self._wait_for_page_value("window._readyToSend === true", lambda _ready: send(), max_wait_ms)
 
     def fill_input_and_send(self, text: str, callback=None):
         """Fill input field and send query based on platform."""
@@ -315,24 +1109,44 @@ class PlatformBrowser(QWebEngineView):
             if callback:
                 callback("unknown platform")
 
-    def _fill_gemini(self, text: str, callback=None):
-        """Fill and send query for Google Gemini."""
-        # Debug: log the text being sent
-        print(f"Gemini: Text length: {len(text)}, Full text: {repr(text[:200])}")
-        # Escape text for JavaScript string literal - preserve newlines
-        escaped_text = (text.replace("\\", "\\\\")
-                           .replace("'", "\\'")
-                           .replace("\n", "\\n")
-                           .replace("\r", "\\r")
-                           .replace("</script>", "<\\/script>"))
+    _SET_FIELD_VALUE_SCRIPT = """
+        function(el, text) {
+            // Text fields get the value through the native setter of their own
+            // prototype (textarea and input differ), so React-style wrappers
+            // see the change; anything else is left to the caller
+            if (!el.matches('textarea, input')) {
+                return false;
+            }
+            const setter = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(el), 'value').set;
+            setter.call(el, text);
+            if (el._valueTracker) {
+                el._valueTracker.setValue('');
+            }
+            el.dispatchEvent(new Event('input', { bubbles: true }));
+            return true;
+        }
+    """
+
+    _CARET_TO_END_SCRIPT = """
+        (() => {
+            // One Range object per document, re-pointed at the input on each fill
+            const range = document.createRange();
+
+            return function(el) {
+                const sel = window.getSelection();
+                range.selectNodeContents(el);
+                range.collapse(false);
+                sel.removeAllRanges();
+                sel.addRange(range);
+            };
+        })()
+    """
+
+    _GEMINI_FILL_SCRIPT = """
+        function(text) {
+            try {
+                window._readyToSend = false;
 
-        # Use a unique ID for this operation
-        op_id = f"gemini_{int(time.time() * 1000)}"
-        
-        # Step 1: Fill the input
-        fill_script = f"""
-        (function() {{
-            try {{
                 const selectors = [
                     'div.ql-editor[contenteditable="true"]',
                     'rich-textarea div[contenteditable="true"]',
@@ -346,31 +1160,27 @@ class PlatformBrowser(QWebEngineView):
                 ];
 
                 let input = null;
-                for (const sel of selectors) {{
+                for (const sel of selectors) {
                     const el = document.querySelector(sel);
-                    if (el && el.offsetParent !== null) {{
+                    if (el && el.offsetParent !== null) {
                         input = el;
                         console.log('Gemini: Found input with selector:', sel);
                         break;
-                    }}
-                }}
+                    }
+                }
 
-                if (!input) {{
+                if (!input) {
                     window._geminiResult = 'input not found';
                     return 'input not found';
-                }}
+                }
 
                 // Focus the element
                 input.focus();
                 input.click();
 
-                const text = '{escaped_text}';
-
-                if (input.tagName === 'TEXTAREA') {{
-                    input.value = text;
-                    input.dispatchEvent(new Event('input', {{ bubbles: true }}));
-                    input.dispatchEvent(new Event('change', {{ bubbles: true }}));
-                }} else {{
+                if (window.__rb_set_field_value(input, text)) {
+                    input.dispatchEvent(new Event('change', { bubbles: true }));
+                } else {
                     // For contenteditable, clear and set content directly
                     input.focus();
 
@@ -378,135 +1188,132 @@ class PlatformBrowser(QWebEngineView):
                     input.textContent = text;
 
                     // Move cursor to end
-                    const range = document.createRange();
-                    const sel = window.getSelection();
-                    range.selectNodeContents(input);
-                    range.collapse(false);
-                    sel.removeAllRanges();
-                    sel.addRange(range);
+                    window.__rb_caret_to_end(input);
 
                     // Trigger input events
-                    input.dispatchEvent(new InputEvent('input', {{
+                    input.dispatchEvent(new InputEvent('input', {
                         bubbles: true,
                         cancelable: true,
                         inputType: 'insertText',
                         data: text
-                    }}));
+                    }));
 
                     console.log('Gemini: Inserted text length:', input.textContent ? input.textContent.length : 0, 'Expected:', text.length);
-                }}
+                }
 
                 window._geminiInput = input;
                 window._geminiText = text;
+                // Flag readiness once the framework has had a task to reconcile;
+                // a timer, since requestAnimationFrame never fires in a hidden tab
+                setTimeout(() => { window._readyToSend = true; }, 0);
                 return 'filled';
-            }} catch (error) {{
+            } catch (error) {
                 console.error('Gemini fill error:', error);
                 window._geminiResult = 'error: ' + error.message;
                 return 'error: ' + error.message;
-            }}
-        }})();
-        """
+            }
+        }
+    """
 
+    _GEMINI_SEND_SCRIPT = """
+        function() {
+            try {
+                const input = window._geminiInput;
+                if (!input) {
+                    return 'no input';
+                }
+
+                // One combined selector = one tree walk for all candidates
+                const candidates = document.querySelectorAll(
+                    'button[aria-label*="Send"], button[data-at="send"], ' +
+                    'button.send-button, button[mattooltip*="Send"], ' +
+                    'button[jsaction*="send"], button[class*="send"]'
+                );
+
+                let sendBtn = null;
+                for (const btn of candidates) {
+                    if (!btn.disabled && btn.offsetParent !== null) {
+                        sendBtn = btn;
+                        console.log('Gemini: Found send button');
+                        break;
+                    }
+                }
+
+                // Position scan (forces layout) only when no candidate exists at all
+                if (!sendBtn && candidates.length === 0) {
+                    const buttons = document.querySelectorAll('button');
+                    for (const btn of buttons) {
+                        if (btn.querySelector('svg') && !btn.disabled) {
+                            const rect = btn.getBoundingClientRect();
+                            if (rect.bottom > window.innerHeight - 200) {
+                                sendBtn = btn;
+                                console.log('Gemini: Found send button by position');
+                                break;
+                            }
+                        }
+                    }
+                }
+
+                if (sendBtn) {
+                    console.log('Gemini: Clicking send button');
+                    sendBtn.click();
+                    return 'sent';
+                } else {
+                    console.log('Gemini: No button found, trying Enter key');
+                    input.dispatchEvent(new KeyboardEvent('keydown', {
+                        key: 'Enter',
+                        code: 'Enter',
+                        keyCode: 13,
+                        which: 13,
+                        bubbles: true,
+                        cancelable: true
+                    }));
+                    return 'sent via enter';
+                }
+            } catch (e) {
+                console.error('Gemini send error:', e);
+                return 'error: ' + e.message;
+            }
+        }
+    """
+
+    def _fill_gemini(self, text: str, callback=None):
+        """Fill and send query for Google Gemini."""
+        # Debug: log the text being sent
+        logger.debug("Gemini send: len=%d preview=%r", len(text), text[:200])
+        text_literal = _js_string_literal(text)
+
+        # Use a unique ID for this operation
+        op_id = f"gemini_{int(time.time() * 1000)}"
+        
         def on_fill_result(result):
             # Debug: log the result
-            print(f"Gemini fill result: {result}")
+            logger.debug("Gemini fill result: %s", result)
             if result and result != 'filled':
                 # If there's an error, pass it to callback
                 if callback:
                     callback(result)
                 return
             
-            # Step 2: Wait a bit, then click send
+            # Step 2: Click send once the page has picked up the input
             def click_send():
-                send_script = """
-                (function() {
-                    try {
-                        const input = window._geminiInput;
-                        if (!input) {
-                            return 'no input';
-                        }
-
-                        const sendSelectors = [
-                            'button[aria-label*="Send message"]',
-                            'button[aria-label*="Send"]',
-                            'button[data-at="send"]',
-                            'button.send-button',
-                            'button[mattooltip*="Send"]',
-                            'button[jsaction*="send"]',
-                            'button[class*="send"]'
-                        ];
-
-                        let sendBtn = null;
-                        for (const sel of sendSelectors) {
-                            const btn = document.querySelector(sel);
-                            if (btn && !btn.disabled && btn.offsetParent !== null) {
-                                sendBtn = btn;
-                                console.log('Gemini: Found send button with selector:', sel);
-                                break;
-                            }
-                        }
-
-                        if (!sendBtn) {
-                            const buttons = document.querySelectorAll('button');
-                            for (const btn of buttons) {
-                                if (btn.querySelector('svg') && !btn.disabled) {
-                                    const rect = btn.getBoundingClientRect();
-                                    if (rect.bottom > window.innerHeight - 200) {
-                                        sendBtn = btn;
-                                        console.log('Gemini: Found send button by position');
-                                        break;
-                                    }
-                                }
-                            }
-                        }
-
-                        if (sendBtn) {
-                            console.log('Gemini: Clicking send button');
-                            sendBtn.click();
-                            return 'sent';
-                        } else {
-                            console.log('Gemini: No button found, trying Enter key');
-                            input.dispatchEvent(new KeyboardEvent('keydown', {
-                                key: 'Enter',
-                                code: 'Enter',
-                                keyCode: 13,
-                                which: 13,
-                                bubbles: true,
-                                cancelable: true
-                            }));
-                            return 'sent via enter';
-                        }
-                    } catch (e) {
-                        console.error('Gemini send error:', e);
-                        return 'error: ' + e.message;
-                    }
-                })();
-                """
-                
                 def on_send_result(result):
-                    print(f"Gemini send result: {result}")
+                    logger.debug("Gemini send result: %s", result)
                     if callback:
                         callback(result if result else 'sent')
                 
-                self.execute_js(send_script, on_send_result)
+                self._call_page_helper("__rb_send_gemini", on_send_result)
             
-            QTimer.singleShot(500, click_send)
+            self._when_ready_to_send(click_send, 500)
 
-        self.execute_js(fill_script, on_fill_result)
+        # Step 1: Fill the input
+        self._call_page_helper("__rb_fill_gemini", on_fill_result, text_literal)
 
-    def _fill_perplexity(self, text: str, callback=None):
-        """Fill and send query for Perplexity AI."""
-        # Escape text for JavaScript string literal
-        escaped_text = (text.replace("\\", "\\\\")
-                           .replace("'", "\\'")
-                           .replace("\n", "\\n")
-                           .replace("\r", "\\r")
-                           .replace("</script>", "<\\/script>"))
+    _PERPLEXITY_FILL_SCRIPT = """
+        function(text) {
+            try {
+                window._readyToSend = false;
 
-        # Step 1: Fill the input
-        fill_script = f"""
-        (function() {{
-            try {{
                 const selectors = [
                     'textarea[placeholder*="Ask"]',
                     'textarea[placeholder*="ask"]',
@@ -522,305 +1329,392 @@ class PlatformBrowser(QWebEngineView):
                 ];
 
                 let textarea = null;
-                for (const sel of selectors) {{
+                for (const sel of selectors) {
                     const elements = document.querySelectorAll(sel);
-                    for (const el of elements) {{
-                        const style = window.getComputedStyle(el);
+                    for (const el of elements) {
+                        // offsetParent is null for display:none elements and their
+                        // descendants, so computed style is only needed for the
+                        // visibility check, and only on elements that are rendered
                         if (el.offsetParent !== null &&
-                            style.display !== 'none' &&
-                            style.visibility !== 'hidden') {{
+                            window.getComputedStyle(el).visibility !== 'hidden') {
                             textarea = el;
                             console.log('Perplexity: Found input with selector:', sel);
                             break;
-                        }}
-                    }}
+                        }
+                    }
                     if (textarea) break;
-                }}
+                }
 
-                if (!textarea) {{
+                if (!textarea) {
                     return 'input not found';
-                }}
-
-                const text = '{escaped_text}';
+                }
 
                 // Focus the textarea first
                 textarea.focus();
                 textarea.click();
 
                 // For React apps, use native setter with tracker reset
-                if (textarea.tagName === 'TEXTAREA' || textarea.tagName === 'INPUT') {{
-                    const nativeTextAreaValueSetter = Object.getOwnPropertyDescriptor(
-                        window.HTMLTextAreaElement.prototype, 'value'
-                    ).set;
-                    nativeTextAreaValueSetter.call(textarea, text);
-
-                    // Reset React's value tracker to force change detection
-                    const tracker = textarea._valueTracker;
-                    if (tracker) {{
-                        tracker.setValue('');
-                    }}
-
-                    // Dispatch input event
-                    textarea.dispatchEvent(new Event('input', {{ bubbles: true }}));
-                    textarea.dispatchEvent(new Event('change', {{ bubbles: true }}));
-                }} else {{
+                if (window.__rb_set_field_value(textarea, text)) {
+                    textarea.dispatchEvent(new Event('change', { bubbles: true }));
+                } else {
                     // For contenteditable divs
                     textarea.textContent = text;
-                    textarea.dispatchEvent(new InputEvent('input', {{
+                    textarea.dispatchEvent(new InputEvent('input', {
                         bubbles: true,
                         cancelable: true,
                         inputType: 'insertText',
                         data: text
-                    }}));
-                }}
+                    }));
+                }
 
                 console.log('Perplexity: Set text length:', textarea.value ? textarea.value.length : textarea.textContent.length);
 
                 window._perplexityTextarea = textarea;
                 window._perplexityForm = textarea.closest('form');
+                // Flag readiness once the framework has had a task to reconcile;
+                // a timer, since requestAnimationFrame never fires in a hidden tab
+                setTimeout(() => { window._readyToSend = true; }, 0);
                 return 'filled';
-            }} catch (error) {{
+            } catch (error) {
                 console.error('Perplexity fill error:', error);
                 return 'error: ' + error.message;
-            }}
-        }})();
-        """
+            }
+        }
+    """
+
+    _PERPLEXITY_SEND_SCRIPT = """
+        function() {
+            try {
+                const textarea = window._perplexityTextarea;
+                if (!textarea) {
+                    return 'no textarea';
+                }
+
+                textarea.focus();
+
+                // Try to find and click submit button
+                const form = window._perplexityForm;
+                if (form) {
+                    const submitBtn = form.querySelector('button[type="submit"], button[aria-label*="Submit"], button[aria-label*="Send"]');
+                    if (submitBtn && !submitBtn.disabled) {
+                        submitBtn.click();
+                        return 'sent via button';
+                    }
+                }
+
+                // Fallback to Enter key
+                const enterEvent = new KeyboardEvent('keydown', {
+                    key: 'Enter',
+                    code: 'Enter',
+                    keyCode: 13,
+                    which: 13,
+                    bubbles: true,
+                    cancelable: true
+                });
+                textarea.dispatchEvent(enterEvent);
+
+                return 'sent via enter';
+            } catch (e) {
+                console.error('Perplexity send error:', e);
+                return 'error: ' + e.message;
+            }
+        }
+    """
+
+    def _fill_perplexity(self, text: str, callback=None):
+        """Fill and send query for Perplexity AI."""
+        text_literal = _js_string_literal(text)
 
         def on_fill_result(result):
-            print(f"Perplexity fill result: {result}")
+            logger.debug("Perplexity fill result: %s", result)
             if result and result != 'filled':
                 if callback:
                     callback(result)
                 return
 
-            # Step 2: Wait a bit, then send
+            # Step 2: Send once the page has picked up the input
             def click_send():
-                send_script = """
-                (function() {
-                    try {
-                        const textarea = window._perplexityTextarea;
-                        if (!textarea) {
-                            return 'no textarea';
-                        }
-
-                        textarea.focus();
-
-                        // Try to find and click submit button
-                        const form = window._perplexityForm;
-                        if (form) {
-                            const submitBtn = form.querySelector('button[type="submit"], button[aria-label*="Submit"], button[aria-label*="Send"]');
-                            if (submitBtn && !submitBtn.disabled) {
-                                submitBtn.click();
-                                return 'sent via button';
-                            }
-                        }
-
-                        // Fallback to Enter key
-                        const enterEvent = new KeyboardEvent('keydown', {
-                            key: 'Enter',
-                            code: 'Enter',
-                            keyCode: 13,
-                            which: 13,
-                            bubbles: true,
-                            cancelable: true
-                        });
-                        textarea.dispatchEvent(enterEvent);
-
-                        return 'sent via enter';
-                    } catch (e) {
-                        console.error('Perplexity send error:', e);
-                        return 'error: ' + e.message;
-                    }
-                })();
-                """
-
                 def on_send_result(result):
-                    print(f"Perplexity send result: {result}")
+                    logger.debug("Perplexity send result: %s", result)
                     if callback:
                         callback(result if result else 'sent')
 
-                self.execute_js(send_script, on_send_result)
+                self._call_page_helper("__rb_send_perplexity", on_send_result)
 
-            QTimer.singleShot(800, click_send)
+            self._when_ready_to_send(click_send, 800)
 
-        self.execute_js(fill_script, on_fill_result)
+        # Step 1: Fill the input
+        self._call_page_helper("__rb_fill_perplexity", on_fill_result, text_literal)
 
-    def _fill_chatgpt(self, text: str, callback=None):
-        """Fill and send query for ChatGPT."""
-        # Escape text for JavaScript string literal
-        escaped_text = (text.replace("\\", "\\\\")
-                           .replace("'", "\\'")
-                           .replace("\n", "\\n")
-                           .replace("\r", "\\r")
-                           .replace("</script>", "<\\/script>"))
+    _CHATGPT_FILL_SCRIPT = """
+        function(text) {
+            try {
+                window._readyToSend = false;
+
+                // ChatGPT now uses contenteditable div with id prompt-textarea;
+                // the id lookup is a hash hit, so try it before any selector
+                const byId = document.getElementById('prompt-textarea');
+                let input = byId && byId.offsetParent !== null ? byId : null;
 
-        # Step 1: Fill the input
-        fill_script = f"""
-        (function() {{
-            try {{
-                // ChatGPT now uses contenteditable div with id prompt-textarea
                 const selectors = [
-                    '#prompt-textarea',
-                    'div[id="prompt-textarea"]',
                     'div[contenteditable="true"][data-id="root"]',
                     'div[contenteditable="true"][role="textbox"]',
-                    'textarea[id="prompt-textarea"]',
                     'textarea[placeholder*="Message"]',
                     'textarea[data-id="root"]'
                 ];
 
-                let input = null;
-                for (const sel of selectors) {{
-                    const el = document.querySelector(sel);
-                    if (el && el.offsetParent !== null) {{
-                        input = el;
-                        console.log('ChatGPT: Found input with selector:', sel);
-                        break;
-                    }}
-                }}
+                if (!input) {
+                    for (const sel of selectors) {
+                        const el = document.querySelector(sel);
+                        if (el && el.offsetParent !== null) {
+                            input = el;
+                            console.log('ChatGPT: Found input with selector:', sel);
+                            break;
+                        }
+                    }
+                }
 
-                if (!input) {{
+                if (!input) {
                     return 'input not found';
-                }}
+                }
 
                 // Focus the element
                 input.focus();
                 input.click();
 
-                const text = '{escaped_text}';
-
-                if (input.tagName === 'TEXTAREA') {{
-                    // For textarea
-                    const nativeInputValueSetter = Object.getOwnPropertyDescriptor(
-                        window.HTMLTextAreaElement.prototype, 'value'
-                    ).set;
-                    nativeInputValueSetter.call(input, text);
-                    input.dispatchEvent(new Event('input', {{ bubbles: true }}));
-                }} else {{
+                if (!window.__rb_set_field_value(input, text)) {
                     // Convert newlines to <p> elements to preserve formatting
                     const lines = text.split('\\n');
-                    const html = lines.map(line => {{
+                    const html = lines.map(line => {
                         const escaped = line
                             .replace(/&/g, '&amp;')
                             .replace(/</g, '&lt;')
                             .replace(/>/g, '&gt;');
                         return '<p>' + (escaped || '<br>') + '</p>';
-                    }}).join('');
+                    }).join('');
                     input.innerHTML = html;
 
-                    input.dispatchEvent(new InputEvent('input', {{
+                    input.dispatchEvent(new InputEvent('input', {
                         bubbles: true,
                         cancelable: true,
                         inputType: 'insertText',
                         data: text
-                    }}));
+                    }));
 
                     // Move cursor to end
-                    const range = document.createRange();
-                    const sel = window.getSelection();
-                    range.selectNodeContents(input);
-                    range.collapse(false);
-                    sel.removeAllRanges();
-                    sel.addRange(range);
-                }}
+                    window.__rb_caret_to_end(input);
+                }
 
                 window._chatgptInput = input;
                 console.log('ChatGPT: Filled text length:', input.textContent ? input.textContent.length : (input.value ? input.value.length : 0));
+                // Flag readiness once the framework has had a task to reconcile;
+                // a timer, since requestAnimationFrame never fires in a hidden tab
+                setTimeout(() => { window._readyToSend = true; }, 0);
                 return 'filled';
-            }} catch (error) {{
+            } catch (error) {
                 console.error('ChatGPT fill error:', error);
                 return 'error: ' + error.message;
-            }}
-        }})();
-        """
+            }
+        }
+    """
+
+    _CHATGPT_SEND_SCRIPT = """
+        function() {
+            try {
+                const input = window._chatgptInput;
+                if (!input) {
+                    return 'no input';
+                }
+
+                const sendSelectors = [
+                    'button[data-testid="send-button"]',
+                    'button[aria-label*="Send message"]',
+                    'button[aria-label*="Send prompt"]',
+                    'button[aria-label*="Send"]',
+                    'form button[type="submit"]'
+                ];
+
+                let sendBtn = null;
+                for (const sel of sendSelectors) {
+                    const btn = document.querySelector(sel);
+                    if (btn && !btn.disabled && btn.offsetParent !== null) {
+                        sendBtn = btn;
+                        console.log('ChatGPT: Found send button with selector:', sel);
+                        break;
+                    }
+                }
+
+                if (sendBtn) {
+                    console.log('ChatGPT: Clicking send button');
+                    sendBtn.click();
+                    return 'sent';
+                } else {
+                    // Try Enter key
+                    console.log('ChatGPT: No button found, trying Enter key');
+                    input.dispatchEvent(new KeyboardEvent('keydown', {
+                        key: 'Enter',
+                        code: 'Enter',
+                        keyCode: 13,
+                        which: 13,
+                        bubbles: true,
+                        cancelable: true
+                    }));
+                    return 'sent via enter';
+                }
+            } catch (e) {
+                console.error('ChatGPT send error:', e);
+                return 'error: ' + e.message;
+            }
+        }
+    """
+
+    def _fill_chatgpt(self, text: str, callback=None):
+        """Fill and send query for ChatGPT."""
+        text_literal = _js_string_literal(text)
 
         def on_fill_result(result):
-            print(f"ChatGPT fill result: {result}")
+            logger.debug("ChatGPT fill result: %s", result)
             if result and result != 'filled':
                 if callback:
                     callback(result)
                 return
 
-            # Step 2: Wait a bit, then click send
+            # Step 2: Click send once the page has picked up the input
             def click_send():
-                send_script = """
-                (function() {
-                    try {
-                        const input = window._chatgptInput;
-                        if (!input) {
-                            return 'no input';
-                        }
-
-                        const sendSelectors = [
-                            'button[data-testid="send-button"]',
-                            'button[aria-label*="Send message"]',
-                            'button[aria-label*="Send prompt"]',
-                            'button[aria-label*="Send"]',
-                            'form button[type="submit"]'
-                        ];
-
-                        let sendBtn = null;
-                        for (const sel of sendSelectors) {
-                            const btn = document.querySelector(sel);
-                            if (btn && !btn.disabled && btn.offsetParent !== null) {
-                                sendBtn = btn;
-                                console.log('ChatGPT: Found send button with selector:', sel);
-                                break;
-                            }
-                        }
-
-                        if (sendBtn) {
-                            console.log('ChatGPT: Clicking send button');
-                            sendBtn.click();
-                            return 'sent';
-                        } else {
-                            // Try Enter key
-                            console.log('ChatGPT: No button found, trying Enter key');
-                            input.dispatchEvent(new KeyboardEvent('keydown', {
-                                key: 'Enter',
-                                code: 'Enter',
-                                keyCode: 13,
-                                which: 13,
-                                bubbles: true,
-                                cancelable: true
-                            }));
-                            return 'sent via enter';
-                        }
-                    } catch (e) {
-                        console.error('ChatGPT send error:', e);
-                        return 'error: ' + e.message;
-                    }
-                })();
-                """
-
                 def on_send_result(result):
-                    print(f"ChatGPT send result: {result}")
+                    logger.debug("ChatGPT send result: %s", result)
                     if callback:
                         callback(result if result else 'sent')
 
-                self.execute_js(send_script, on_send_result)
+                self._call_page_helper("__rb_send_chatgpt", on_send_result)
 
-            QTimer.singleShot(500, click_send)
+            self._when_ready_to_send(click_send, 500)
 
-        self.execute_js(fill_script, on_fill_result)
+        # Step 1: Fill the input
+        self._call_page_helper("__rb_fill_chatgpt", on_fill_result, text_literal)
 
     def get_response_text(self, callback):
-        """Extract response text from the page."""
-        if self.platform == "gemini":
-            self._get_gemini_response(callback)
-        elif self.platform == "perplexity":
-            self._get_perplexity_response(callback)
-        elif self.platform == "chatgpt":
-            self._get_chatgpt_response(callback)
-        elif self.platform == "claude":
-            self._get_claude_response(callback)
-        else:
+        """Extract response text from the page.
+
+        The page only sends the text appended since the previous call (or the
+        whole text when it changed in any other way); the reply is rebuilt here.
+        """
+        if self.platform not in ("gemini", "perplexity", "chatgpt", "claude"):
             callback('')
+            return
 
-    def _get_gemini_response(self, callback):
-        """Extract response from Gemini."""
-        script = """
-        (function() {
+        def on_result(result):
+            if not result:  # Page helpers not installed yet
+                callback('')
+                return
+            appended, text = result
+            self._response_text = self._response_text + text if appended else text
+            callback(self._response_text)
+
+        self._call_page_helper(
+            "__rb_response_delta", on_result,
+            _js_string_literal(f"__rb_response_{self.platform}"), fallback_literal="null"
+        )
+
+    _RESPONSE_CACHE_SCRIPT = """
+        {
+            // Last reply node found by the response selectors, so steady polls
+            // re-read one node instead of querying the whole conversation. A
+            // MutationObserver on that node marks the text dirty, so polls after
+            // the reply settles return the stored string without touching the DOM.
+            // Its parent is watched too: a node inserted after the cached one is
+            // a newer reply, so the cache is dropped and the next poll re-queries.
+            entry: null,
+            observer: null,
+            // Set once a selector match has produced real text for the current
+            // turn; from then on the broad container fallbacks are skipped.
+            // Cleared by newTurn() whenever a new turn may have started.
+            primaryHit: false,
+
+            text() {
+                const entry = this.entry;
+                if (entry && entry.href !== location.href) {
+                    // SPA route change, e.g. a new chat
+                    this.newTurn();
+                    return null;
+                }
+                if (!entry || !entry.node.isConnected) {
+                    this.reset();
+                    return null;
+                }
+                if (entry.dirty) {
+                    entry.text = (entry.node.innerText || entry.node.textContent || '').trim();
+                    entry.dirty = false;
+                }
+                return entry.text;
+            },
+
+            set(node, length) {
+                if (!this.observer) {
+                    this.observer = new MutationObserver((records) => {
+                        const entry = this.entry;
+                        if (!entry) return;
+                        for (const record of records) {
+                            if (record.target === entry.parent) {
+                                for (const added of record.addedNodes) {
+                                    if (entry.node.compareDocumentPosition(added) & Node.DOCUMENT_POSITION_FOLLOWING) {
+                                        this.newTurn();
+                                        return;
+                                    }
+                                }
+                            } else {
+                                entry.dirty = true;
+                            }
+                        }
+                    });
+                    // A click or Enter press may start a new turn
+                    document.addEventListener('click', () => this.newTurn(), true);
+                    document.addEventListener('keydown', (e) => {
+                        if (e.key === 'Enter') this.newTurn();
+                    }, true);
+                }
+                this.reset();
+                if (node && length === undefined) {
+                    length = (node.textContent || '').trim().length;
+                }
+                // Short matches may be placeholders picked before the reply renders
+                if (node && length >= 50) {
+                    const parent = node.parentElement;
+                    this.entry = { node: node, parent: parent, href: location.href, text: '', dirty: true };
+                    this.primaryHit = true;
+                    this.observer.observe(node, { subtree: true, childList: true, characterData: true });
+                    if (parent) this.observer.observe(parent, { childList: true });
+                }
+            },
+
+            reset() {
+                if (this.observer) this.observer.disconnect();
+                this.entry = null;
+            },
+
+            newTurn() {
+                this.reset();
+                this.primaryHit = false;
+            }
+        }
+    """
+
+    _RESPONSE_DELTA_SCRIPT = """
+        function(name) {
+            // Reply streaming only appends, so usually just the new tail has to
+            // cross the bridge; any other change resends the whole text
+            const text = window[name]();
+            const sent = window.__rb_response_sent || '';
+            window.__rb_response_sent = text;
+            if (sent.length > 0 && text.startsWith(sent)) {
+                return [true, text.slice(sent.length)];
+            }
+            return [false, text];
+        }
+    """
+
+    _GEMINI_RESPONSE_SCRIPT = """
+        (() => {
             // Gemini response selectors - looking for model/assistant messages
             const selectors = [
                 'message-content.model-response-text',
@@ -834,40 +1728,54 @@ class PlatformBrowser(QWebEngineView):
                 'div.conversation-container div[class*="message-text"]'
             ];
 
-            let responseText = '';
+            return function() {
+                // Reuse the reply found by an earlier poll while it is still current
+                const cached = window.__rb_response_cache.text();
+                if (cached !== null) {
+                    return cached;
+                }
 
-            for (const sel of selectors) {
-                const responses = document.querySelectorAll(sel);
-                if (responses.length > 0) {
-                    // Get the last response (most recent)
-                    const last = responses[responses.length - 1];
-                    const text = last.innerText || last.textContent || '';
-                    if (text.trim().length > responseText.length) {
-                        responseText = text.trim();
+                // Candidates are compared by textContent, which needs no layout;
+                // innerText (which keeps line breaks) is read once for the winner
+                let best = null;
+                let bestLength = 0;
+
+                // Selectors are ordered most specific first: stop at the first one
+                // whose most recent match has real text, so the common case costs a
+                // single traversal; otherwise keep the longest of the last matches
+                for (const sel of selectors) {
+                    const matches = document.querySelectorAll(sel);
+                    if (matches.length === 0) continue;
+                    const last = matches[matches.length - 1];
+                    const length = (last.textContent || '').trim().length;
+                    if (length > bestLength) {
+                        best = last;
+                        bestLength = length;
                     }
+                    if (length >= 50) break;
                 }
-            }
-
-            // Also try looking for any response containers
-            if (responseText.length < 50) {
-                const containers = document.querySelectorAll('[class*="response"], [class*="answer"]');
-                for (const container of containers) {
-                    const text = container.innerText || container.textContent || '';
-                    if (text.trim().length > responseText.length && text.trim().length > 50) {
-                        responseText = text.trim();
+                // Only selector matches are cached; the fallbacks are broad containers
+                window.__rb_response_cache.set(best, bestLength);
+
+                // Also try looking for any response containers
+                if (bestLength < 50 && !window.__rb_response_cache.primaryHit) {
+                    const containers = document.querySelectorAll('[class*="response"], [class*="answer"]');
+                    for (const container of containers) {
+                        const length = (container.textContent || '').trim().length;
+                        if (length > bestLength && length > 50) {
+                            best = container;
+                            bestLength = length;
+                        }
                     }
                 }
-            }
 
-            return responseText;
-        })();
-        """
-        self.execute_js(script, callback)
+                return best ? (best.innerText || best.textContent || '').trim() : '';
+            };
+        })()
+    """
 
-    def _get_perplexity_response(self, callback):
-        """Extract response from Perplexity."""
-        script = """
-        (function() {
+    _PERPLEXITY_RESPONSE_SCRIPT = """
+        (() => {
             // Perplexity uses prose class for formatted responses
             const selectors = [
                 'div.prose',
@@ -879,45 +1787,58 @@ class PlatformBrowser(QWebEngineView):
                 'div[class*="result-content"]'
             ];
 
-            let responseText = '';
+            return function() {
+                // Reuse the reply found by an earlier poll while it is still current
+                const cached = window.__rb_response_cache.text();
+                if (cached !== null) {
+                    return cached;
+                }
 
-            for (const sel of selectors) {
-                const responses = document.querySelectorAll(sel);
-                if (responses.length > 0) {
-                    // Get the last response
-                    const last = responses[responses.length - 1];
-                    const text = last.innerText || last.textContent || '';
-                    if (text.trim().length > responseText.length) {
-                        responseText = text.trim();
+                // Candidates are compared by textContent, which needs no layout;
+                // innerText (which keeps line breaks) is read once for the winner
+                let best = null;
+                let bestLength = 0;
+
+                // Selectors are ordered most specific first: stop at the first one
+                // whose most recent match has real text, so the common case costs a
+                // single traversal; otherwise keep the longest of the last matches
+                for (const sel of selectors) {
+                    const matches = document.querySelectorAll(sel);
+                    if (matches.length === 0) continue;
+                    const last = matches[matches.length - 1];
+                    const length = (last.textContent || '').trim().length;
+                    if (length > bestLength) {
+                        best = last;
+                        bestLength = length;
                     }
+                    if (length >= 50) break;
                 }
-            }
-
-            // Try to find the main answer container
-            if (responseText.length < 50) {
-                // Look for answer sections
-                const answerDivs = document.querySelectorAll('[class*="answer"], [class*="response"]');
-                for (const div of answerDivs) {
-                    const text = div.innerText || div.textContent || '';
-                    // Filter out input areas and short text
-                    if (text.trim().length > 100 && text.trim().length > responseText.length) {
-                        // Make sure this isn't an input field container
-                        if (!div.querySelector('textarea') && !div.querySelector('input')) {
-                            responseText = text.trim();
+                window.__rb_response_cache.set(best, bestLength);
+
+                // Try to find the main answer container
+                if (bestLength < 50 && !window.__rb_response_cache.primaryHit) {
+                    // Look for answer sections
+                    const answerDivs = document.querySelectorAll('[class*="answer"], [class*="response"]');
+                    for (const div of answerDivs) {
+                        const length = (div.textContent || '').trim().length;
+                        // Filter out input areas and short text
+                        if (length > 100 && length > bestLength) {
+                            // Make sure this isn't an input field container
+                            if (!div.querySelector('textarea') && !div.querySelector('input')) {
+                                best = div;
+                                bestLength = length;
+                            }
                         }
                     }
                 }
-            }
 
-            return responseText;
-        })();
-        """
-        self.execute_js(script, callback)
+                return best ? (best.innerText || best.textContent || '').trim() : '';
+            };
+        })()
+    """
 
-    def _get_chatgpt_response(self, callback):
-        """Extract response from ChatGPT."""
-        script = """
-        (function() {
+    _CHATGPT_RESPONSE_SCRIPT = """
+        (() => {
             // ChatGPT uses data-message-author-role attribute
             const selectors = [
                 'div[data-message-author-role="assistant"]',
@@ -928,79 +1849,80 @@ class PlatformBrowser(QWebEngineView):
                 'article[data-testid*="conversation-turn"] div[class*="markdown"]'
             ];
 
-            let responseText = '';
+            return function() {
+                // Reuse the reply found by an earlier poll while it is still current
+                const cached = window.__rb_response_cache.text();
+                if (cached !== null) {
+                    return cached;
+                }
 
-            for (const sel of selectors) {
-                const responses = document.querySelectorAll(sel);
-                if (responses.length > 0) {
-                    // Get the last response
-                    const last = responses[responses.length - 1];
-                    const text = last.innerText || last.textContent || '';
-                    if (text.trim().length > responseText.length) {
-                        responseText = text.trim();
+                // Candidates are compared by textContent, which needs no layout;
+                // innerText (which keeps line breaks) is read once for the winner
+                let best = null;
+                let bestLength = 0;
+
+                // Selectors are ordered most specific first: stop at the first one
+                // whose most recent match has real text, so the common case costs a
+                // single traversal; otherwise keep the longest of the last matches
+                for (const sel of selectors) {
+                    const matches = document.querySelectorAll(sel);
+                    if (matches.length === 0) continue;
+                    const last = matches[matches.length - 1];
+                    const length = (last.textContent || '').trim().length;
+                    if (length > bestLength) {
+                        best = last;
+                        bestLength = length;
                     }
+                    if (length >= 50) break;
                 }
-            }
-
-            // Also look for assistant message containers
-            if (responseText.length < 50) {
-                const messages = document.querySelectorAll('[data-message-author-role="assistant"]');
-                if (messages.length > 0) {
-                    const last = messages[messages.length - 1];
-                    const text = last.innerText || last.textContent || '';
-                    if (text.trim().length > responseText.length) {
-                        responseText = text.trim();
+                window.__rb_response_cache.set(best, bestLength);
+
+                // Also look for assistant message containers
+                if (bestLength < 50 && !window.__rb_response_cache.primaryHit) {
+                    const messages = document.querySelectorAll('[data-message-author-role="assistant"]');
+                    if (messages.length > 0) {
+                        const last = messages[messages.length - 1];
+                        const length = (last.textContent || '').trim().length;
+                        if (length > bestLength) {
+                            best = last;
+                            bestLength = length;
+                        }
                     }
                 }
-            }
 
-            return responseText;
-        })();
-        """
-        self.execute_js(script, callback)
+                return best ? (best.innerText || best.textContent || '').trim() : '';
+            };
+        })()
+    """
+
+    _GENERATING_SCRIPT = """
+        function(platform) {
+            // Stop buttons with a fixed test id are the cheap, common-case probe
+            const stopButton = {
+                chatgpt: '[data-testid="stop-button"]',
+                claude: '[data-testid="stop-button"]'
+            }[platform];
+            if (stopButton && document.querySelector(stopButton) !== null) {
+                return true;
+            }
+            // Loading/generating indicators and stop buttons for each platform
+            const indicators = {
+                gemini: 'mat-spinner, .loading, div[class*="loading"], div[class*="generating"], ' +
+                        'button[aria-label*="Stop"], button[class*="stop"]',
+                perplexity: 'div[class*="loading"], div[class*="generating"], svg[class*="animate"], ' +
+                            'button[aria-label*="Stop"]',
+                chatgpt: 'div[class*="result-streaming"], button[aria-label*="Stop"]',
+                claude: 'div[class*="streaming"], button[aria-label*="Stop"], button[class*="stop"]'
+            }[platform];
+            return indicators ? document.querySelector(indicators) !== null : false;
+        }
+    """
 
     def check_if_generating(self, callback):
         """Check if the AI is still generating a response."""
-        if self.platform == "gemini":
-            script = """
-            (function() {
-                // Check for loading/generating indicators in Gemini
-                const loading = document.querySelector('mat-spinner, .loading, div[class*="loading"], div[class*="generating"]');
-                const stopBtn = document.querySelector('button[aria-label*="Stop"], button[class*="stop"]');
-                return loading !== null || stopBtn !== null;
-            })();
-            """
-        elif self.platform == "perplexity":
-            script = """
-            (function() {
-                // Check for loading indicators in Perplexity
-                const loading = document.querySelector('div[class*="loading"], div[class*="generating"], svg[class*="animate"]');
-                const stopBtn = document.querySelector('button[aria-label*="Stop"]');
-                return loading !== null || stopBtn !== null;
-            })();
-            """
-        elif self.platform == "chatgpt":
-            script = """
-            (function() {
-                // Check for loading indicators in ChatGPT
-                const loading = document.querySelector('div[class*="result-streaming"], button[aria-label*="Stop"]');
-                const stopBtn = document.querySelector('button[data-testid="stop-button"]');
-                return loading !== null || stopBtn !== null;
-            })();
-            """
-        elif self.platform == "claude":
-            script = """
-            (function() {
-                // Check for loading indicators in Claude
-                const loading = document.querySelector('div[class*="streaming"], button[aria-label*="Stop"]');
-                const stopBtn = document.querySelector('button[data-testid="stop-button"], button[class*="stop"]');
-                return loading !== null || stopBtn !== null;
-            })();
-            """
-        else:
-            script = "return false;"
-
-        self.execute_js(script, callback)
+        self._call_page_helper(
+            "__rb_generating", callback, _js_string_literal(self.platform), fallback_literal="false"
+        )
 
     def navigate_to_new_chat(self, callback=None):
         """Navigate to a new chat page for the platform."""
@@ -1037,7 +1959,7 @@ class PlatformBrowser(QWebEngineView):
 
         if self.platform in new_chat_scripts:
             def on_result(result):
-                print(f"{self.platform}: New chat result: {result}")
+                logger.debug("%s: New chat result: %s", self.platform, result)
                 if callback:
                     callback(result)
             self.execute_js(new_chat_scripts[self.platform], on_result)
@@ -1091,11 +2013,7 @@ class PlatformBrowser(QWebEngineView):
 
     def _fill_only_gemini(self, text: str, callback=None):
         """Fill input for Gemini without sending."""
-        escaped_text = (text.replace("\\", "\\\\")
-                           .replace("'", "\\'")
-                           .replace("\n", "\\n")
-                           .replace("\r", "\\r")
-                           .replace("</script>", "<\\/script>"))
+        text_literal = _js_string_literal(text)
 
         fill_script = f"""
         (function() {{
@@ -1128,22 +2046,14 @@ class PlatformBrowser(QWebEngineView):
                 input.focus();
                 input.click();
 
-                const text = '{escaped_text}';
+                const text = {text_literal};
 
-                if (input.tagName === 'TEXTAREA') {{
-                    input.value = text;
-                    input.dispatchEvent(new Event('input', {{ bubbles: true }}));
-                }} else {{
+                if (!window.__rb_set_field_value(input, text)) {{
                     // Clear and set content directly
                     input.textContent = text;
 
                     // Move cursor to end
-                    const range = document.createRange();
-                    const sel = window.getSelection();
-                    range.selectNodeContents(input);
-                    range.collapse(false);
-                    sel.removeAllRanges();
-                    sel.addRange(range);
+                    window.__rb_caret_to_end(input);
 
                     input.dispatchEvent(new InputEvent('input', {{
                         bubbles: true,
@@ -1163,11 +2073,7 @@ class PlatformBrowser(QWebEngineView):
 
     def _fill_only_perplexity(self, text: str, callback=None):
         """Fill input for Perplexity without sending."""
-        escaped_text = (text.replace("\\", "\\\\")
-                           .replace("'", "\\'")
-                           .replace("\n", "\\n")
-                           .replace("\r", "\\r")
-                           .replace("</script>", "<\\/script>"))
+        text_literal = _js_string_literal(text)
 
         fill_script = f"""
         (function() {{
@@ -1190,10 +2096,11 @@ class PlatformBrowser(QWebEngineView):
                 for (const sel of selectors) {{
                     const elements = document.querySelectorAll(sel);
                     for (const el of elements) {{
-                        const style = window.getComputedStyle(el);
+                        // offsetParent is null for display:none elements and their
+                        // descendants, so computed style is only needed for the
+                        // visibility check, and only on elements that are rendered
                         if (el.offsetParent !== null &&
-                            style.display !== 'none' &&
-                            style.visibility !== 'hidden') {{
+                            window.getComputedStyle(el).visibility !== 'hidden') {{
                             textarea = el;
                             break;
                         }}
@@ -1205,24 +2112,12 @@ class PlatformBrowser(QWebEngineView):
                     return 'input not found';
                 }}
 
-                const text = '{escaped_text}';
+                const text = {text_literal};
 
                 textarea.focus();
                 textarea.click();
 
-                if (textarea.tagName === 'TEXTAREA' || textarea.tagName === 'INPUT') {{
-                    const nativeTextAreaValueSetter = Object.getOwnPropertyDescriptor(
-                        window.HTMLTextAreaElement.prototype, 'value'
-                    ).set;
-                    nativeTextAreaValueSetter.call(textarea, text);
-
-                    const tracker = textarea._valueTracker;
-                    if (tracker) {{
-                        tracker.setValue('');
-                    }}
-
-                    textarea.dispatchEvent(new Event('input', {{ bubbles: true }}));
-                }} else {{
+                if (!window.__rb_set_field_value(textarea, text)) {{
                     textarea.textContent = text;
                     textarea.dispatchEvent(new InputEvent('input', {{
                         bubbles: true,
@@ -1242,31 +2137,28 @@ class PlatformBrowser(QWebEngineView):
 
     def _fill_only_chatgpt(self, text: str, callback=None):
         """Fill input for ChatGPT without sending."""
-        escaped_text = (text.replace("\\", "\\\\")
-                           .replace("'", "\\'")
-                           .replace("\n", "\\n")
-                           .replace("\r", "\\r")
-                           .replace("</script>", "<\\/script>"))
+        text_literal = _js_string_literal(text)
 
         fill_script = f"""
         (function() {{
             try {{
+                const byId = document.getElementById('prompt-textarea');
+                let input = byId && byId.offsetParent !== null ? byId : null;
+
                 const selectors = [
-                    '#prompt-textarea',
-                    'div[id="prompt-textarea"]',
                     'div[contenteditable="true"][data-id="root"]',
                     'div[contenteditable="true"][role="textbox"]',
-                    'textarea[id="prompt-textarea"]',
                     'textarea[placeholder*="Message"]',
                     'textarea[data-id="root"]'
                 ];
 
-                let input = null;
-                for (const sel of selectors) {{
-                    const el = document.querySelector(sel);
-                    if (el && el.offsetParent !== null) {{
-                        input = el;
-                        break;
+                if (!input) {{
+                    for (const sel of selectors) {{
+                        const el = document.querySelector(sel);
+                        if (el && el.offsetParent !== null) {{
+                            input = el;
+                            break;
+                        }}
                     }}
                 }}
 
@@ -1277,15 +2169,9 @@ class PlatformBrowser(QWebEngineView):
                 input.focus();
                 input.click();
 
-                const text = '{escaped_text}';
+                const text = {text_literal};
 
-                if (input.tagName === 'TEXTAREA') {{
-                    const nativeInputValueSetter = Object.getOwnPropertyDescriptor(
-                        window.HTMLTextAreaElement.prototype, 'value'
-                    ).set;
-                    nativeInputValueSetter.call(input, text);
-                    input.dispatchEvent(new Event('input', {{ bubbles: true }}));
-                }} else {{
+                if (!window.__rb_set_field_value(input, text)) {{
                     // Convert newlines to <p> elements to preserve formatting
                     const lines = text.split('\\n');
                     const html = lines.map(line => {{
@@ -1305,12 +2191,7 @@ class PlatformBrowser(QWebEngineView):
                     }}));
 
                     // Move cursor to end
-                    const range = document.createRange();
-                    const sel = window.getSelection();
-                    range.selectNodeContents(input);
-                    range.collapse(false);
-                    sel.removeAllRanges();
-                    sel.addRange(range);
+                    window.__rb_caret_to_end(input);
                 }}
 
                 return 'filled';
@@ -1321,17 +2202,11 @@ class PlatformBrowser(QWebEngineView):
         """
         self.execute_js(fill_script, callback)
 
-    def _fill_claude(self, text: str, callback=None):
-        """Fill and send query for Claude."""
-        escaped_text = (text.replace("\\", "\\\\")
-                           .replace("'", "\\'")
-                           .replace("\n", "\\n")
-                           .replace("\r", "\\r")
-                           .replace("</script>", "<\\/script>"))
+    _CLAUDE_FILL_SCRIPT = """
+        function(text, send) {
+            try {
+                window._claudeSendResult = null;
 
-        fill_script = f"""
-        (function() {{
-            try {{
                 const selectors = [
                     'div[contenteditable="true"].ProseMirror',
                     'div[contenteditable="true"][data-placeholder]',
@@ -1342,70 +2217,106 @@ class PlatformBrowser(QWebEngineView):
                 ];
 
                 let input = null;
-                for (const sel of selectors) {{
+                for (const sel of selectors) {
                     const el = document.querySelector(sel);
-                    if (el && el.offsetParent !== null) {{
+                    if (el && el.offsetParent !== null) {
                         input = el;
                         console.log('Claude: Found input with selector:', sel);
                         break;
-                    }}
-                }}
+                    }
+                }
 
-                if (!input) {{
+                if (!input) {
                     return 'input not found';
-                }}
+                }
 
                 input.focus();
                 input.click();
 
-                const text = '{escaped_text}';
-
-                if (input.tagName === 'TEXTAREA') {{
-                    const nativeInputValueSetter = Object.getOwnPropertyDescriptor(
-                        window.HTMLTextAreaElement.prototype, 'value'
-                    ).set;
-                    nativeInputValueSetter.call(input, text);
-                    input.dispatchEvent(new Event('input', {{ bubbles: true }}));
-                }} else {{
+                if (!window.__rb_set_field_value(input, text)) {
                     input.innerHTML = '';
                     input.focus();
-                    document.execCommand('insertText', false, text);
-                    if (!input.textContent || input.textContent.length < 10) {{
+                    // One synthetic paste lets ProseMirror insert the whole prompt in
+                    // a single transaction instead of execCommand's per-edit reflows
+                    const data = new DataTransfer();
+                    data.setData('text/plain', text);
+                    input.dispatchEvent(new ClipboardEvent('paste', {
+                        bubbles: true,
+                        cancelable: true,
+                        clipboardData: data
+                    }));
+                    if (!input.textContent || input.textContent.length < 10) {
                         const p = document.createElement('p');
                         p.textContent = text;
                         input.innerHTML = '';
                         input.appendChild(p);
-                        input.dispatchEvent(new InputEvent('input', {{
+                        input.dispatchEvent(new InputEvent('input', {
                             bubbles: true,
                             cancelable: true,
                             inputType: 'insertText',
                             data: text
-                        }}));
-                    }}
-                }}
+                        }));
+                    }
+                }
 
                 window._claudeInput = input;
+
+                if (send) {
+                    // Click send as soon as the editor enables the button. Timers
+                    // rather than requestAnimationFrame, which never fires while
+                    // the view sits in a hidden tab; after 500ms the send helper
+                    // takes over with its own button scan and Enter fallback.
+                    const deadline = performance.now() + 500;
+                    const trySend = () => {
+                        // Python has abandoned the wait and sent on its own
+                        if (window._claudeSendResult !== null) return;
+                        const button = document.querySelector(
+                            'button[aria-label*="Send"]:not([disabled]), ' +
+                            'button[data-testid="send-button"]:not([disabled])'
+                        );
+                        if (button) {
+                            button.click();
+                            window._claudeSendResult = 'sent';
+                        } else if (performance.now() < deadline) {
+                            setTimeout(trySend, 16);
+                        } else {
+                            window._claudeSendResult = window.__rb_send_claude();
+                        }
+                    };
+                    setTimeout(trySend, 0);
+                }
                 return 'filled';
-            }} catch (error) {{
+            } catch (error) {
                 console.error('Claude fill error:', error);
                 return 'error: ' + error.message;
-            }}
-        }})();
-        """
+            }
+        }
+    """
+
+    def _fill_claude(self, text: str, callback=None):
+        """Fill and send query for Claude."""
+        text_literal = _js_string_literal(text)
+
+        def on_send_result(result):
+            logger.debug("Claude send result: %s", result)
+            if result is None:
+                # The page never reported; send directly as a last resort
+                self._send_claude_message(callback)
+            elif callback:
+                callback(result)
 
         def on_fill_result(result):
-            print(f"Claude fill result: {{result}}")
+            logger.debug("Claude fill result: %s", result)
             if result == "filled":
-                QTimer.singleShot(300, lambda: self._send_claude_message(callback))
+                # The fill helper sends on its own; only its outcome is collected
+                self._wait_for_page_value("window._claudeSendResult", on_send_result, 2000)
             elif callback:
                 callback(result)
 
-        self.execute_js(fill_script, on_fill_result)
+        self._call_page_helper("__rb_fill_claude", on_fill_result, f"{text_literal}, true")
 
-    def _send_claude_message(self, callback=None):
-        """Send message in Claude after filling."""
-        send_script = """
-        (function() {
+    _CLAUDE_SEND_SCRIPT = """
+        function() {
             try {
                 const sendSelectors = [
                     'button[aria-label*="Send"]',
@@ -1452,20 +2363,31 @@ class PlatformBrowser(QWebEngineView):
                 console.error('Claude send error:', e);
                 return 'error: ' + e.message;
             }
-        })();
-        """
+        }
+    """
+
+    def _send_claude_message(self, callback=None):
+        """Send message in Claude after filling.
 
+        The fill helper's own send loop may still be pending on throttled
+        timers, so the result slot is claimed in the same script: the loop
+        then stops, and if it already sent, its result is reported instead
+        of sending twice.
+        """
         def on_send_result(result):
-            print(f"Claude send result: {{result}}")
+            logger.debug("Claude send result: %s", result)
             if callback:
                 callback(result)
 
-        self.execute_js(send_script, on_send_result)
+        self.execute_js(
+            "window._claudeSendResult != null ? window._claudeSendResult"
+            " : (window._claudeSendResult = 'abandoned',"
+            " window.__rb_send_claude ? __rb_send_claude() : 'page not ready')",
+            on_send_result
+        )
 
-    def _get_claude_response(self, callback):
-        """Extract response from Claude."""
-        script = """
-        (function() {
+    _CLAUDE_RESPONSE_SCRIPT = """
+        (() => {
             // Claude response selectors
             const selectors = [
                 'div[data-testid="assistant-message"]',
@@ -1475,109 +2397,48 @@ class PlatformBrowser(QWebEngineView):
                 'div[class*="markdown"]'
             ];
 
-            let lastResponse = null;
-            let lastResponseText = '';
-
-            for (const sel of selectors) {
-                const messages = document.querySelectorAll(sel);
-                if (messages.length > 0) {
-                    lastResponse = messages[messages.length - 1];
-                    break;
+            return function() {
+                // Reuse the reply found by an earlier poll while it is still current
+                const cached = window.__rb_response_cache.text();
+                if (cached !== null) {
+                    return cached;
                 }
-            }
 
-            if (!lastResponse) {
-                // Try finding by looking at conversation structure
-                const allMessages = document.querySelectorAll('[data-testid*="message"], div[class*="message"]');
-                for (let i = allMessages.length - 1; i >= 0; i--) {
-                    const msg = allMessages[i];
-                    if (msg.getAttribute('data-testid')?.includes('assistant') ||
-                        msg.className?.includes('assistant') ||
-                        msg.className?.includes('response')) {
-                        lastResponse = msg;
+                let lastResponse = null;
+
+                // Take the most recent match of the first selector that matches
+                for (const sel of selectors) {
+                    const messages = document.querySelectorAll(sel);
+                    if (messages.length > 0) {
+                        lastResponse = messages[messages.length - 1];
                         break;
                     }
                 }
-            }
 
-            if (lastResponse) {
-                lastResponseText = lastResponse.innerText || lastResponse.textContent || '';
-            }
+                window.__rb_response_cache.set(lastResponse);
+
+                if (!lastResponse) {
+                    // Try finding by looking at conversation structure
+                    const allMessages = document.querySelectorAll('[data-testid*="message"], div[class*="message"]');
+                    for (let i = allMessages.length - 1; i >= 0; i--) {
+                        const msg = allMessages[i];
+                        if (msg.getAttribute('data-testid')?.includes('assistant') ||
+                            msg.className?.includes('assistant') ||
+                            msg.className?.includes('response')) {
+                            lastResponse = msg;
+                            break;
+                        }
+                    }
+                }
 
-            return lastResponseText.trim();
-        })();
-        """
-        self.execute_js(script, callback)
+                return lastResponse ? (lastResponse.innerText || lastResponse.textContent || '').trim() : '';
+            };
+        })()
+    """
 
     def _fill_only_claude(self, text: str, callback=None):
         """Fill input for Claude without sending."""
-        escaped_text = (text.replace("\\", "\\\\")
-                           .replace("'", "\\'")
-                           .replace("\n", "\\n")
-                           .replace("\r", "\\r")
-                           .replace("</script>", "<\\/script>"))
-
-        fill_script = f"""
-        (function() {{
-            try {{
-                const selectors = [
-                    'div[contenteditable="true"].ProseMirror',
-                    'div[contenteditable="true"][data-placeholder]',
-                    'div.ProseMirror[contenteditable="true"]',
-                    'div[contenteditable="true"]',
-                    'textarea[placeholder*="message"]',
-                    'textarea[placeholder*="Message"]'
-                ];
-
-                let input = null;
-                for (const sel of selectors) {{
-                    const el = document.querySelector(sel);
-                    if (el && el.offsetParent !== null) {{
-                        input = el;
-                        break;
-                    }}
-                }}
-
-                if (!input) {{
-                    return 'input not found';
-                }}
-
-                input.focus();
-                input.click();
-
-                const text = '{escaped_text}';
-
-                if (input.tagName === 'TEXTAREA') {{
-                    const nativeInputValueSetter = Object.getOwnPropertyDescriptor(
-                        window.HTMLTextAreaElement.prototype, 'value'
-                    ).set;
-                    nativeInputValueSetter.call(input, text);
-                    input.dispatchEvent(new Event('input', {{ bubbles: true }}));
-                }} else {{
-                    input.innerHTML = '';
-                    input.focus();
-                    document.execCommand('insertText', false, text);
-                    if (!input.textContent || input.textContent.length < 10) {{
-                        const p = document.createElement('p');
-                        p.textContent = text;
-                        input.innerHTML = '';
-                        input.appendChild(p);
-                        input.dispatchEvent(new InputEvent('input', {{
-                            bubbles: true,
-                            cancelable: true,
-                            inputType: 'insertText',
-                            data: text
-                        }}));
-                    }}
-                }}
-
-                return 'filled';
-            }} catch (error) {{
-                return 'error: ' + error.message;
-            }}
-        }})();
-        """
-        self.execute_js(fill_script, callback)
+        self._call_page_helper("__rb_fill_claude", callback, _js_string_literal(text))
 
 
 class SpinnerWidget(QWidget):
@@ -1620,11 +2481,37 @@ class PlatformTab(QWidget):
 
     openInGoogleTab = pyqtSignal(str)  # URL to open in Google tab
 
+    # Download bar per state: (icon style, label style, text template, auto-hide ms).
+    # A hide time of None keeps the bar up until a later state arrives.
+    _DOWNLOAD_STATES = {
+        "started": (
+            "background-color: #2196F3; border-radius: 8px;", _STYLE_DOWNLOAD_LABEL,
+            "Downloading: {filename} (0%)", None,
+        ),
+        "progress": (
+            "background-color: #2196F3; border-radius: 8px;", _STYLE_DOWNLOAD_LABEL,
+            "Downloading: {filename} ({percent}%)", None,
+        ),
+        "completed": (
+            "background-color: #4CAF50; border-radius: 8px;", "font-size: 11px; color: #4CAF50;",
+            "Downloaded: {filename}", 5000,
+        ),
+        "failed": (
+            "background-color: #F44336; border-radius: 8px;", "font-size: 11px; color: #F44336;",
+            "Download failed: {filename}", 8000,
+        ),
+        "cancelled": (
+            "background-color: #FF9800; border-radius: 8px;", "font-size: 11px; color: #FF9800;",
+            "Download cancelled: {filename}", 5000,
+        ),
+    }
+
     def __init__(self, platform: str, url: str, parent=None):
         super().__init__(parent)
         self.platform = platform
         self.url = url
         self.browser: Optional[PlatformBrowser] = None
+        self.url_input: Optional[QLineEdit] = None  # Only the Google tab has a URL bar
 
         self._setup_ui()
 
@@ -1635,17 +2522,13 @@ class PlatformTab(QWidget):
 
         # Header with status and buttons
         header = QFrame()
-        header.setStyleSheet(f"""
-            QFrame {{
-                background-color: {DARK_THEME['surface']};
-                border-bottom: 1px solid {DARK_THEME['border']};
-            }}
-        """)
+        header.setStyleSheet(_STYLE_HEADER)
         header_layout = QHBoxLayout(header)
         header_layout.setContentsMargins(12, 6, 12, 6)
 
         self.status_label = QLabel("Loading...")
-        self.status_label.setStyleSheet(f"color: {DARK_THEME['text_secondary']}; font-size: 12px;")
+        self.status_label.setStyleSheet(_STYLE_CAPTION)
+        self._status_style = _STYLE_CAPTION
         header_layout.addWidget(self.status_label)
 
         header_layout.addStretch()
@@ -1661,36 +2544,25 @@ class PlatformTab(QWidget):
 
         # Back button
         back_btn = QPushButton("Back")
-        back_btn.setStyleSheet(self._button_style())
+        back_btn.setStyleSheet(_STYLE_BUTTON)
         back_btn.clicked.connect(self._go_back)
         header_layout.addWidget(back_btn)
 
         # Refresh button
         refresh_btn = QPushButton("Refresh")
-        refresh_btn.setStyleSheet(self._button_style())
+        refresh_btn.setStyleSheet(_STYLE_BUTTON)
         refresh_btn.clicked.connect(self._refresh_browser)
         header_layout.addWidget(refresh_btn)
 
         # Home button
         home_btn = QPushButton("Home")
-        home_btn.setStyleSheet(self._button_style())
+        home_btn.setStyleSheet(_STYLE_BUTTON)
         home_btn.clicked.connect(self._go_home)
         header_layout.addWidget(home_btn)
 
         # Clear data button
         clear_btn = QPushButton("Clear Data")
-        clear_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #FFCDD2;
-                border: none;
-                border-radius: 4px;
-                padding: 4px 12px;
-                color: #C62828;
-            }
-            QPushButton:hover {
-                background-color: #EF9A9A;
-            }
-        """)
+        clear_btn.setStyleSheet(_STYLE_CLEAR_BUTTON)
         clear_btn.clicked.connect(self._clear_browser_data)
         header_layout.addWidget(clear_btn)
 
@@ -1699,37 +2571,41 @@ class PlatformTab(QWidget):
         # URL bar - only for Google tab
         if self.platform == "google":
             url_bar = QFrame()
-            url_bar.setStyleSheet(f"background-color: {DARK_THEME['surface']};")
+            url_bar.setStyleSheet(_STYLE_SURFACE)
             url_layout = QHBoxLayout(url_bar)
             url_layout.setContentsMargins(12, 4, 12, 4)
             url_layout.setSpacing(8)
 
             self.url_input = QLineEdit()
             self.url_input.setPlaceholderText("Enter URL...")
-            self.url_input.setStyleSheet(f"""
-                QLineEdit {{
-                    background-color: {DARK_THEME['background']};
-                    color: {DARK_THEME['text_primary']};
-                    border: 1px solid {DARK_THEME['border']};
-                    border-radius: 4px;
-                    padding: 4px 8px;
-                    font-size: 11px;
-                }}
-                QLineEdit:focus {{
-                    border-color: {DARK_THEME['accent']};
-                }}
-            """)
+            self.url_input.setStyleSheet(_STYLE_URL_INPUT)
             self.url_input.returnPressed.connect(self._navigate_to_url)
             url_layout.addWidget(self.url_input)
 
             go_btn = QPushButton("Go")
             go_btn.setFixedWidth(56)
-            go_btn.setStyleSheet(self._button_style())
+            go_btn.setStyleSheet(_STYLE_BUTTON)
             go_btn.clicked.connect(self._navigate_to_url)
             url_layout.addWidget(go_btn)
 
             layout.addWidget(url_bar)
 
+    # The browser and download bar are built on first show (or first
+    # programmatic use), so tabs that are never opened don't start a
+    # QWebEngineView at all
+    def showEvent(self, event):
+        self.ensure_browser()
+        super().showEvent(event)
+
+    def ensure_browser(self) -> PlatformBrowser:
+        """Return this tab's browser, building it on first use."""
+        if self.browser is None:
+            self._setup_browser()
+        return self.browser
+
+    def _setup_browser(self):
+        layout = self.layout()
+
         # Create and add the browser
         self.browser = PlatformBrowser(self.platform)
         self.browser.pageLoaded.connect(self._on_page_loaded)
@@ -1743,12 +2619,7 @@ class PlatformTab(QWidget):
         # Download notification bar (hidden by default)
         self.download_bar = QFrame()
         self.download_bar.setFixedHeight(32)
-        self.download_bar.setStyleSheet(f"""
-            QFrame {{
-                background-color: {DARK_THEME['surface']};
-                border-top: 1px solid {DARK_THEME['border']};
-            }}
-        """)
+        self.download_bar.setStyleSheet(_STYLE_DOWNLOAD_BAR)
         download_bar_layout = QHBoxLayout(self.download_bar)
         download_bar_layout.setContentsMargins(12, 4, 12, 4)
         download_bar_layout.setSpacing(8)
@@ -1756,26 +2627,17 @@ class PlatformTab(QWidget):
         self.download_icon = QLabel()
         self.download_icon.setFixedSize(16, 16)
         download_bar_layout.addWidget(self.download_icon)
+        self._download_icon_style = ""
 
         self.download_label = QLabel("")
-        self.download_label.setStyleSheet(f"font-size: 11px; color: {DARK_THEME['text_primary']};")
+        self.download_label.setStyleSheet(_STYLE_DOWNLOAD_LABEL)
         download_bar_layout.addWidget(self.download_label, 1)
+        self._download_label_style = _STYLE_DOWNLOAD_LABEL
 
         self.download_close_btn = QPushButton("x")
         self.download_close_btn.setFixedSize(20, 20)
         self.download_close_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.download_close_btn.setStyleSheet(f"""
-            QPushButton {{
-                background: transparent;
-                color: {DARK_THEME['text_secondary']};
-                border: none;
-                font-size: 12px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                color: {DARK_THEME['text_primary']};
-            }}
-        """)
+        self.download_close_btn.setStyleSheet(_STYLE_DOWNLOAD_CLOSE)
         self.download_close_btn.clicked.connect(self.download_bar.hide)
         download_bar_layout.addWidget(self.download_close_btn)
 
@@ -1783,35 +2645,29 @@ class PlatformTab(QWidget):
         layout.addWidget(self.download_bar)
 
         # Register for download notifications
-        PlatformBrowser.add_download_listener(self._on_download_event)
+        PlatformBrowser.add_download_listener(self._on_download_event, self.browser)
 
         # Timer to auto-hide download bar
         self._download_hide_timer = QTimer()
         self._download_hide_timer.setSingleShot(True)
         self._download_hide_timer.timeout.connect(self.download_bar.hide)
 
+        # Timer coalescing bursts of progress ticks into one bar update
+        self._pending_progress = None
+        self._progress_flush_timer = QTimer()
+        self._progress_flush_timer.setSingleShot(True)
+        self._progress_flush_timer.timeout.connect(self._flush_download_progress)
+
         # Navigate to the platform URL
         self.browser.navigate(self.url)
 
-    def _button_style(self):
-        return f"""
-            QPushButton {{
-                background-color: {DARK_THEME['surface_light']};
-                border: 1px solid {DARK_THEME['border']};
-                border-radius: 4px;
-                padding: 4px 12px;
-                color: {DARK_THEME['text_primary']};
-            }}
-            QPushButton:hover {{
-                background-color: {DARK_THEME['accent']};
-            }}
-        """
-
+    @pyqtSlot()
     def _go_back(self):
         """Go back in browser history."""
         if self.browser:
             self.browser.back()
 
+    @pyqtSlot()
     def _go_home(self):
         """Navigate to the platform's home page, preserving account context."""
         if self.browser:
@@ -1827,14 +2683,16 @@ class PlatformTab(QWidget):
             else:
                 self.browser.navigate(self.url)
 
+    @pyqtSlot()
     def _refresh_browser(self):
         """Refresh the browser."""
         if self.browser:
             self.browser.reload()
 
+    @pyqtSlot()
     def _navigate_to_url(self):
         """Navigate to the URL in the URL bar."""
-        if not hasattr(self, 'url_input'):
+        if self.url_input is None:
             return
         url = self.url_input.text().strip()
         if url:
@@ -1843,45 +2701,75 @@ class PlatformTab(QWidget):
             if self.browser:
                 self.browser.navigate(url)
 
+    @pyqtSlot(QUrl)
     def _on_url_changed(self, url):
         """Update URL bar when browser URL changes."""
-        if hasattr(self, 'url_input'):
-            self.url_input.setText(url.toString())
+        if self.url_input is None:
+            return
+        # Redirects re-announce the same URL; setText would reset the field
+        # (and any edit in progress) for nothing
+        text = url.toString()
+        if text != self.url_input.text():
+            with QSignalBlocker(self.url_input):
+                self.url_input.setText(text)
 
     def _on_download_event(self, filename: str, state: str, percent: int):
         """Show download status in the notification bar."""
-        if state == "started":
-            self.download_icon.setStyleSheet("background-color: #2196F3; border-radius: 8px;")
-            self.download_label.setText(f"Downloading: {filename} (0%)")
-            self.download_label.setStyleSheet(f"font-size: 11px; color: {DARK_THEME['text_primary']};")
+        if state == "progress":
+            # Only the latest tick matters; show it at most every 100ms
+            self._pending_progress = (filename, percent)
+            if not self._progress_flush_timer.isActive():
+                self._progress_flush_timer.start(100)
+            return
+
+        # A newer state supersedes any progress still waiting to be shown
+        self._progress_flush_timer.stop()
+        self._pending_progress = None
+        self._show_download_state(filename, state, percent)
+
+    @pyqtSlot()
+    def _flush_download_progress(self):
+        """Show the most recent coalesced progress tick."""
+        if self._pending_progress is not None:
+            filename, percent = self._pending_progress
+            self._pending_progress = None
+            self._show_download_state(filename, "progress", percent)
+
+    def _show_download_state(self, filename: str, state: str, percent: int):
+        """Apply one download state to the notification bar."""
+        entry = self._DOWNLOAD_STATES.get(state)
+        if entry is None:
+            return
+        icon_style, label_style, text, hide_ms = entry
+
+        # Restyling makes Qt re-polish the widget, so skip it when unchanged
+        if icon_style != self._download_icon_style:
+            self._download_icon_style = icon_style
+            self.download_icon.setStyleSheet(icon_style)
+        if label_style != self._download_label_style:
+            self._download_label_style = label_style
+            self.download_label.setStyleSheet(label_style)
+
+        if state == "progress":
+            if percent < 0:
+                text = "Downloading: {filename}..."
+            self.download_label.setText(text.format(filename=filename, percent=percent))
+            return
+
+        self.download_label.setText(text.format(filename=filename, percent=percent))
+        self.download_bar.show()
+        if hide_ms is None:
             self._download_hide_timer.stop()
-            self.download_bar.show()
-        elif state == "progress":
-            self.download_icon.setStyleSheet("background-color: #2196F3; border-radius: 8px;")
-            if percent >= 0:
-                self.download_label.setText(f"Downloading: {filename} ({percent}%)")
-            else:
-                self.download_label.setText(f"Downloading: {filename}...")
-            self.download_label.setStyleSheet(f"font-size: 11px; color: {DARK_THEME['text_primary']};")
-        elif state == "completed":
-            self.download_icon.setStyleSheet("background-color: #4CAF50; border-radius: 8px;")
-            self.download_label.setText(f"Downloaded: {filename}")
-            self.download_label.setStyleSheet("font-size: 11px; color: #4CAF50;")
-            self.download_bar.show()
-            self._download_hide_timer.start(5000)
-        elif state == "failed":
-            self.download_icon.setStyleSheet("background-color: #F44336; border-radius: 8px;")
-            self.download_label.setText(f"Download failed: {filename}")
-            self.download_label.setStyleSheet("font-size: 11px; color: #F44336;")
-            self.download_bar.show()
-            self._download_hide_timer.start(8000)
-        elif state == "cancelled":
-            self.download_icon.setStyleSheet("background-color: #FF9800; border-radius: 8px;")
-            self.download_label.setText(f"Download cancelled: {filename}")
-            self.download_label.setStyleSheet("font-size: 11px; color: #FF9800;")
-            self.download_bar.show()
-            self._download_hide_timer.start(5000)
+        else:
+            self._download_hide_timer.start(hide_ms)
 
+    @pyqtSlot()
+    def _reload_start_url(self):
+        """Navigate back to the platform's start URL."""
+        if self.browser:
+            self.browser.navigate(self.url)
+
+    @pyqtSlot()
     def _clear_browser_data(self):
         """Clear cookies and browser data for this profile."""
         reply = QMessageBox.question(
@@ -1892,37 +2780,67 @@ class PlatformTab(QWidget):
         )
 
         if reply == QMessageBox.StandardButton.Yes:
-            profile = PlatformBrowser.get_shared_profile()
-            profile.cookieStore().deleteAllCookies()
-            profile.clearHttpCache()
+            # Show progress first; the clear itself runs from the event loop
+            # once the dialog has closed and the label has repainted
+            self.status_label.setText("Clearing...")
+            self._set_status_style(_STYLE_STATUS_BUSY)
+            QTimer.singleShot(0, self._clear_profile_data)
+
+    @pyqtSlot()
+    def _clear_profile_data(self):
+        """Clear the shared profile's cache and cookies, then reload."""
+        profile = PlatformBrowser.get_shared_profile()
+        # Reload only once the cache clear has finished, so the reload
+        # cannot repopulate the cache mid-clear
+        profile.clearHttpCacheCompleted.connect(
+            self._on_profile_data_cleared, Qt.ConnectionType.SingleShotConnection
+        )
+        profile.clearHttpCache()
+        profile.cookieStore().deleteAllCookies()
 
-            # Reload the page
-            if self.browser:
-                self.browser.navigate(self.url)
+        self.status_label.setText("Clearing data...")
 
-            self.status_label.setText("Data cleared")
-            self.status_label.setStyleSheet("color: #FF9800; font-size: 12px;")
+    @pyqtSlot()
+    def _on_profile_data_cleared(self):
+        """Reload the start page after the shared profile's cache is cleared."""
+        if self.browser:
+            self._reload_start_url()
+        self.status_label.setText("Data cleared")
 
+    @pyqtSlot(str)
     def _on_page_loaded(self, platform: str):
         """Handle page load."""
         self.loading_spinner.setVisible(False)
         self.status_label.setText("Ready")
-        self.status_label.setStyleSheet("color: #4CAF50; font-weight: bold; font-size: 12px;")
+        self._set_status_style(_STYLE_STATUS_READY)
 
     def set_status(self, status: str, is_ready: bool = False):
         """Update the status label."""
         self.status_label.setText(status)
-        if is_ready:
-            self.status_label.setStyleSheet("color: #4CAF50; font-weight: bold; font-size: 12px;")
-        else:
-            self.status_label.setStyleSheet("color: #FF9800; font-size: 12px;")
+        self._set_status_style(_STYLE_STATUS_READY if is_ready else _STYLE_STATUS_BUSY)
+
+    def _set_status_style(self, style: str):
+        """Restyle the status label, skipping the re-polish when unchanged."""
+        if style != self._status_style:
+            self._status_style = style
+            self.status_label.setStyleSheet(style)
 
 
 class LogTab(QWidget):
     """Widget for the logs tab."""
 
+    _MAX_LINES = 5000  # Oldest lines are dropped past this
+    _FLUSH_MS = 50  # Lines logged within this window are appended together
+
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._pending_lines = []
+        # Timestamp text is reused until the clock reaches the next second
+        self._last_ts_sec = 0
+        self._last_ts_str = ""
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.timeout.connect(self._flush_logs)
         self._setup_ui()
 
     def _setup_ui(self):
@@ -1930,29 +2848,18 @@ class LogTab(QWidget):
         layout.setContentsMargins(0, 0, 0, 0)
 
         header = QFrame()
-        header.setStyleSheet(f"background-color: {DARK_THEME['surface']};")
+        header.setStyleSheet(_STYLE_SURFACE)
         header_layout = QHBoxLayout(header)
         header_layout.setContentsMargins(12, 8, 12, 8)
 
         title = QLabel("Logs")
-        title.setStyleSheet(f"color: {DARK_THEME['text_primary']}; font-weight: bold;")
+        title.setStyleSheet(_STYLE_TITLE)
         header_layout.addWidget(title)
 
         header_layout.addStretch()
 
         clear_btn = QPushButton("Clear")
-        clear_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {DARK_THEME['surface_light']};
-                color: {DARK_THEME['text_primary']};
-                border-radius: 4px;
-                padding: 4px 12px;
-                border: 1px solid {DARK_THEME['border']};
-            }}
-            QPushButton:hover {{
-                background-color: {DARK_THEME['accent']};
-            }}
-        """)
+        clear_btn.setStyleSheet(_STYLE_BUTTON)
         clear_btn.clicked.connect(self.clear)
         header_layout.addWidget(clear_btn)
 
@@ -1970,30 +2877,38 @@ class LogTab(QWidget):
                 padding: 8px;
             }
         """)
+        self.log_output.setMaximumBlockCount(self._MAX_LINES)
         layout.addWidget(self.log_output, 1)
 
     def append_log(self, message: str, level: str = "INFO"):
         """Append a log message."""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-
-        # Color coding based on level
-        color_map = {
-            "INFO": "#D4D4D4",
-            "WARNING": "#FFA500",
-            "ERROR": "#FF6B6B",
-            "SUCCESS": "#4CAF50",
-            "DEBUG": "#9E9E9E"
-        }
-        color = color_map.get(level, "#D4D4D4")
-
-        formatted = f"[{timestamp}] [{level}] {message}"
-        self.log_output.appendPlainText(formatted)
+        sec = int(time.time())
+        if sec != self._last_ts_sec:
+            self._last_ts_sec = sec
+            self._last_ts_str = time.strftime("%H:%M:%S", time.localtime(sec))
+
+        self._pending_lines.append("[" + self._last_ts_str + "] [" + level + "] " + message)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start(self._FLUSH_MS)
+
+    @pyqtSlot()
+    def _flush_logs(self):
+        """Append buffered lines in one edit and scroll to the newest."""
+        if not self._pending_lines:
+            return
+        # Only the newest lines can survive the block limit anyway
+        lines = self._pending_lines[-self._MAX_LINES:]
+        self._pending_lines = []
+        self.log_output.appendPlainText("\n".join(lines))
 
         scrollbar = self.log_output.verticalScrollBar()
         scrollbar.setValue(scrollbar.maximum())
 
+    @pyqtSlot()
     def clear(self):
         """Clear the log output."""
+        self._flush_timer.stop()
+        self._pending_lines = []
         self.log_output.clear()
 
 
@@ -2002,12 +2917,85 @@ class MarkdownNotebookTab(QWidget):
 
     createPromptRequested = pyqtSignal(str, str)  # title, markdown content
 
+    # Colors and formats reused by every reformat and markdown load
+    _QUOTE_COLOR = QColor(DARK_THEME['text_secondary'])
+    _CODE_BACKGROUND = QColor(DARK_THEME['surface_light'])
+    _PLAIN_CHAR_FORMAT = QTextCharFormat()
+    _PLAIN_BLOCK_FORMAT = QTextBlockFormat()
+    _BOLD_FORMAT = _char_format(bold=True)
+    _ITALIC_FORMAT = _char_format(italic=True)
+    _STRIKE_FORMAT = _char_format(strike=True)
+    _UNDERLINE_FORMAT = _char_format(underline=True)
+    _CODE_FORMAT = _char_format(family="Courier New", background=_CODE_BACKGROUND)
+    _QUOTE_FORMAT = _char_format(italic=True, foreground=_QUOTE_COLOR)
+    _QUOTE_LOAD_FORMAT = _char_format(point_size=14, italic=True, foreground=_QUOTE_COLOR)
+    _QUOTE_BLOCK_FORMAT = _quote_block_format()
+    _UNSTYLED_FORMAT = _unstyled_char_format()
+    # Keyed by heading level; levels past 3 keep the body size
+    _HEADING_FORMATS = {level: _char_format(point_size=size, bold=True)
+                        for level, size in ((1, 24), (2, 20), (3, 16), (4, 14), (5, 14), (6, 14))}
+    _HEADING_BLOCK_FORMATS = {level: _heading_block_format(level) for level in range(1, 7)}
+    # (code, bold, italic, strike, underline) formats for inline markdown over
+    # body text (level 0) and each heading level
+    _INLINE_FORMATS = _merged_char_formats(
+        {0: _PLAIN_CHAR_FORMAT, **_HEADING_FORMATS},
+        (_CODE_FORMAT, _BOLD_FORMAT, _ITALIC_FORMAT, _STRIKE_FORMAT, _UNDERLINE_FORMAT),
+    )
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._current_file = None
         self._is_modified = False
+        # Last toHtml() of the document as (revision, html), reused by saves
+        # that follow no edit. Reset whenever the document is replaced.
+        self._html_cache = (-1, "")
+
+        # The word count reads the whole document; refresh it once typing
+        # pauses rather than on every keystroke
+        self._stats_timer = QTimer(self)
+        self._stats_timer.setSingleShot(True)
+        self._stats_timer.timeout.connect(self._update_word_count)
+
+        # Live markdown runs once per event-loop turn, so a paste or IME
+        # burst of text changes is converted once instead of per change.
+        # A typed whitespace character can close a span, so that edit is
+        # converted immediately; queued keystrokes would otherwise move the
+        # cursor past it before the timer fires.
+        self._live_markdown_now = False
+        self._live_markdown_timer = QTimer(self)
+        self._live_markdown_timer.setSingleShot(True)
+        self._live_markdown_timer.setInterval(0)
+        self._live_markdown_timer.timeout.connect(self._apply_live_markdown)
+
+        # Merge formats for the toolbar toggles as (on, off) pairs
+        self._fmt_bold = self._char_format_pair(QTextCharFormat.setFontWeight, QFont.Weight.Bold, QFont.Weight.Normal)
+        self._fmt_italic = self._char_format_pair(QTextCharFormat.setFontItalic, True, False)
+        self._fmt_underline = self._char_format_pair(QTextCharFormat.setFontUnderline, True, False)
+        self._fmt_strike = self._char_format_pair(QTextCharFormat.setFontStrikeOut, True, False)
+
+        # Live markdown conversion for each named group of the live patterns
+        self._live_formatters = {
+            "header": self._format_header,
+            "hr": self._format_horizontal_rule,
+            "quote": self._format_quote,
+            "bullet": self._format_bullet,
+            "bold": self._format_bold,
+            "italic": self._format_italic,
+            "strike": self._format_strikethrough,
+            "code": self._format_inline_code,
+        }
+
         self._setup_ui()
 
+    @staticmethod
+    def _char_format_pair(setter, on_value, off_value):
+        """Build the (on, off) char formats a toolbar toggle merges."""
+        fmt_on = QTextCharFormat()
+        setter(fmt_on, on_value)
+        fmt_off = QTextCharFormat()
+        setter(fmt_off, off_value)
+        return fmt_on, fmt_off
+
     def _setup_ui(self):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -2015,12 +3003,7 @@ class MarkdownNotebookTab(QWidget):
 
         # Create toolbar container for two rows
         toolbar_container = QFrame()
-        toolbar_container.setStyleSheet(f"""
-            QFrame {{
-                background-color: {DARK_THEME['surface']};
-                border-bottom: 1px solid {DARK_THEME['border']};
-            }}
-        """)
+        toolbar_container.setStyleSheet(_STYLE_HEADER)
         toolbar_container_layout = QVBoxLayout(toolbar_container)
         toolbar_container_layout.setContentsMargins(0, 0, 0, 0)
         toolbar_container_layout.setSpacing(0)
@@ -2051,13 +3034,21 @@ class MarkdownNotebookTab(QWidget):
         row1_layout.addWidget(self.underline_btn)
         row1_layout.addWidget(self.strike_btn)
 
+        # Toggle buttons paired with the char format state they mirror
+        self._format_buttons = (
+            (self.bold_btn, lambda fmt: fmt.fontWeight() == QFont.Weight.Bold),
+            (self.italic_btn, QTextCharFormat.fontItalic),
+            (self.underline_btn, QTextCharFormat.fontUnderline),
+            (self.strike_btn, QTextCharFormat.fontStrikeOut),
+        )
+
         row1_layout.addWidget(self._create_separator())
 
         row1_layout.addStretch()
 
         # Status label
         self.status_label = QLabel("Ready")
-        self.status_label.setStyleSheet(f"color: {DARK_THEME['text_secondary']}; font-size: 11px;")
+        self.status_label.setStyleSheet(_STYLE_MUTED)
         row1_layout.addWidget(self.status_label)
 
         toolbar_container_layout.addWidget(row1)
@@ -2084,22 +3075,7 @@ class MarkdownNotebookTab(QWidget):
 
         self.create_prompt_btn = QPushButton("Create Prompt")
         self.create_prompt_btn.setFixedHeight(26)
-        self.create_prompt_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {DARK_THEME['surface_light']};
-                color: {DARK_THEME['text_primary']};
-                border: 1px solid {DARK_THEME['border']};
-                border-radius: 4px;
-                padding: 2px 10px;
-                font-size: 11px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: #9C27B0;
-                color: white;
-                border-color: #9C27B0;
-            }}
-        """)
+        self.create_prompt_btn.setStyleSheet(_STYLE_PROMPT_BUTTON)
         self.create_prompt_btn.clicked.connect(self._create_prompt_from_notebook)
         row2_layout.addWidget(self.create_prompt_btn)
 
@@ -2111,78 +3087,36 @@ class MarkdownNotebookTab(QWidget):
 
         # Title input
         title_frame = QFrame()
-        title_frame.setStyleSheet(f"background-color: {DARK_THEME['surface']}; border-bottom: 1px solid {DARK_THEME['border']};")
+        title_frame.setStyleSheet(_STYLE_TITLE_FRAME)
         title_layout = QHBoxLayout(title_frame)
         title_layout.setContentsMargins(12, 8, 12, 8)
 
         title_label = QLabel("Title:")
-        title_label.setStyleSheet(f"color: {DARK_THEME['text_secondary']}; font-size: 12px;")
+        title_label.setStyleSheet(_STYLE_CAPTION)
         title_layout.addWidget(title_label)
 
-        self.title_input = QLineEdit()
-        self.title_input.setPlaceholderText("Untitled Note")
-        self.title_input.setStyleSheet(f"""
-            QLineEdit {{
-                background-color: {DARK_THEME['surface_light']};
-                color: {DARK_THEME['text_primary']};
-                border: 1px solid {DARK_THEME['border']};
-                border-radius: 4px;
-                padding: 6px 12px;
-                font-size: 14px;
-                font-weight: bold;
-            }}
-            QLineEdit:focus {{
-                border-color: {DARK_THEME['accent']};
-            }}
-        """)
-        self.title_input.textChanged.connect(self._on_content_changed)
-        title_layout.addWidget(self.title_input)
-
-        layout.addWidget(title_frame)
-
-        # Rich text editor
-        self.editor = QTextEdit()
-        self.editor.setStyleSheet(f"""
-            QTextEdit {{
-                background-color: {DARK_THEME['background']};
-                color: {DARK_THEME['text_primary']};
-                border: none;
-                padding: 16px;
-                font-size: 14px;
-                line-height: 1.6;
-            }}
-            QScrollBar:vertical {{
-                background-color: {DARK_THEME['surface']};
-                width: 10px;
-                border-radius: 5px;
-            }}
-            QScrollBar::handle:vertical {{
-                background-color: {DARK_THEME['border']};
-                border-radius: 5px;
-                min-height: 20px;
-            }}
-            QScrollBar::handle:vertical:hover {{
-                background-color: {DARK_THEME['text_secondary']};
-            }}
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
-                height: 0px;
-            }}
-        """)
+        self.title_input = QLineEdit()
+        self.title_input.setPlaceholderText("Untitled Note")
+        self.title_input.setStyleSheet(_STYLE_TITLE_INPUT)
+        self.title_input.textChanged.connect(self._on_content_changed)
+        title_layout.addWidget(self.title_input)
+
+        layout.addWidget(title_frame)
+
+        # Rich text editor
+        self.editor = QTextEdit()
+        self.editor.setStyleSheet(_STYLE_EDITOR)
         self.editor.setPlaceholderText("Start writing your notes here...")
         self.editor.setFont(QFont("Georgia", 14))
 
         doc = self.editor.document()
-        doc.setDefaultStyleSheet(f"""
-            body {{ line-height: 1.3; }}
-            hr {{ border: none; border-top: 1px solid {DARK_THEME['border']}; margin: 8px 0; }}
-            blockquote {{
-                border-left: 3px solid {DARK_THEME['border']};
-                padding-left: 12px;
-                color: {DARK_THEME['text_secondary']};
-                font-style: italic;
-                margin: 8px 0;
-            }}
-        """)
+        doc.setDefaultStyleSheet(_STYLE_EDITOR_DOCUMENT)
+
+        # Word counts are kept per block and patched from contentsChange, so
+        # an edit only re-splits the blocks it touched
+        self._block_words = [0] * doc.blockCount()
+        self._word_count = 0
+        doc.contentsChange.connect(self._on_contents_change)
 
         self.editor.textChanged.connect(self._on_content_changed)
         self.editor.cursorPositionChanged.connect(self._update_format_buttons)
@@ -2194,18 +3128,18 @@ class MarkdownNotebookTab(QWidget):
 
         # Word count footer
         footer = QFrame()
-        footer.setStyleSheet(f"background-color: {DARK_THEME['surface']}; border-top: 1px solid {DARK_THEME['border']};")
+        footer.setStyleSheet(_STYLE_FOOTER)
         footer_layout = QHBoxLayout(footer)
         footer_layout.setContentsMargins(12, 4, 12, 4)
 
         self.word_count_label = QLabel("Words: 0 | Characters: 0")
-        self.word_count_label.setStyleSheet(f"color: {DARK_THEME['text_secondary']}; font-size: 11px;")
+        self.word_count_label.setStyleSheet(_STYLE_MUTED)
         footer_layout.addWidget(self.word_count_label)
 
         footer_layout.addStretch()
 
         self.file_label = QLabel("New Document")
-        self.file_label.setStyleSheet(f"color: {DARK_THEME['text_secondary']}; font-size: 11px;")
+        self.file_label.setStyleSheet(_STYLE_MUTED)
         footer_layout.addWidget(self.file_label)
 
         layout.addWidget(footer)
@@ -2214,7 +3148,7 @@ class MarkdownNotebookTab(QWidget):
         """Create a vertical separator line."""
         sep = QFrame()
         sep.setFrameShape(QFrame.Shape.VLine)
-        sep.setStyleSheet(f"background-color: {DARK_THEME['border']};")
+        sep.setStyleSheet(_STYLE_SEPARATOR)
         sep.setFixedWidth(1)
         return sep
 
@@ -2234,88 +3168,62 @@ class MarkdownNotebookTab(QWidget):
         if strike:
             font_style += "text-decoration: line-through;"
 
-        btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {DARK_THEME['surface_light']};
-                color: {DARK_THEME['text_primary']};
-                border: 1px solid {DARK_THEME['border']};
-                border-radius: 3px;
-                padding: 2px 8px;
-                font-size: 11px;
-                {font_style}
-            }}
-            QPushButton:hover {{
-                background-color: {DARK_THEME['accent']};
-                border-color: {DARK_THEME['accent']};
-            }}
-            QPushButton:checked {{
-                background-color: {DARK_THEME['accent']};
-                border-color: {DARK_THEME['accent']};
-            }}
-        """)
+        btn.setStyleSheet(_toolbar_button_style(font_style))
         btn.setCheckable(bold or italic or underline or strike)
         btn.clicked.connect(callback)
         return btn
 
+    @pyqtSlot()
     def _toggle_bold(self):
         """Toggle bold formatting on selected text."""
-        fmt = QTextCharFormat()
         cursor = self.editor.textCursor()
-        current_weight = cursor.charFormat().fontWeight()
-        if current_weight == QFont.Weight.Bold:
-            fmt.setFontWeight(QFont.Weight.Normal)
-        else:
-            fmt.setFontWeight(QFont.Weight.Bold)
-        cursor.mergeCharFormat(fmt)
+        fmt_on, fmt_off = self._fmt_bold
+        is_bold = cursor.charFormat().fontWeight() == QFont.Weight.Bold
+        cursor.mergeCharFormat(fmt_off if is_bold else fmt_on)
 
+    @pyqtSlot()
     def _toggle_italic(self):
         """Toggle italic formatting on selected text."""
-        fmt = QTextCharFormat()
         cursor = self.editor.textCursor()
-        fmt.setFontItalic(not cursor.charFormat().fontItalic())
-        cursor.mergeCharFormat(fmt)
+        fmt_on, fmt_off = self._fmt_italic
+        cursor.mergeCharFormat(fmt_off if cursor.charFormat().fontItalic() else fmt_on)
 
+    @pyqtSlot()
     def _toggle_underline(self):
         """Toggle underline formatting on selected text."""
-        fmt = QTextCharFormat()
         cursor = self.editor.textCursor()
-        fmt.setFontUnderline(not cursor.charFormat().fontUnderline())
-        cursor.mergeCharFormat(fmt)
+        fmt_on, fmt_off = self._fmt_underline
+        cursor.mergeCharFormat(fmt_off if cursor.charFormat().fontUnderline() else fmt_on)
 
+    @pyqtSlot()
     def _toggle_strikethrough(self):
         """Toggle strikethrough formatting on selected text."""
-        fmt = QTextCharFormat()
         cursor = self.editor.textCursor()
-        fmt.setFontStrikeOut(not cursor.charFormat().fontStrikeOut())
-        cursor.mergeCharFormat(fmt)
+        fmt_on, fmt_off = self._fmt_strike
+        cursor.mergeCharFormat(fmt_off if cursor.charFormat().fontStrikeOut() else fmt_on)
 
     def _set_heading(self, level: int):
         """Set the current paragraph as a heading using block-level heading format."""
         cursor = self.editor.textCursor()
+        # One edit block: a single layout pass and a single undo step
+        cursor.beginEditBlock()
 
         # Set block-level heading with extra spacing
-        block_fmt = cursor.blockFormat()
-        block_fmt.setHeadingLevel(level)
-        block_fmt.setTopMargin(16)
-        block_fmt.setBottomMargin(8)
-        block_fmt.setLineHeight(150, 1)
-        cursor.setBlockFormat(block_fmt)
+        cursor.mergeBlockFormat(self._HEADING_BLOCK_FORMATS[level])
 
         # Select only block text, not the block separator
         cursor.movePosition(QTextCursor.MoveOperation.StartOfBlock)
         cursor.movePosition(QTextCursor.MoveOperation.EndOfBlock, QTextCursor.MoveMode.KeepAnchor)
 
-        fmt = QTextCharFormat()
-        sizes = {1: 24, 2: 20, 3: 16}
-        fmt.setFontPointSize(sizes.get(level, 14))
-        fmt.setFontWeight(QFont.Weight.Bold)
-
-        cursor.mergeCharFormat(fmt)
+        cursor.mergeCharFormat(self._HEADING_FORMATS[level])
+        cursor.endEditBlock()
         self.editor.setFocus()
 
+    @pyqtSlot()
     def _set_normal(self):
         """Reset all formatting to normal text."""
         cursor = self.editor.textCursor()
+        cursor.beginEditBlock()
 
         # If there's a selection, reset the selection; otherwise reset current block
         if not cursor.hasSelection():
@@ -2323,10 +3231,12 @@ class MarkdownNotebookTab(QWidget):
             cursor.movePosition(QTextCursor.MoveOperation.EndOfBlock, QTextCursor.MoveMode.KeepAnchor)
 
         # Clear all character formatting back to editor defaults
-        cursor.setCharFormat(QTextCharFormat())
+        cursor.setCharFormat(self._PLAIN_CHAR_FORMAT)
 
-        # Reset block format
-        block_fmt = cursor.blockFormat()
+        # Reset block format. A plain single block already matches, and
+        # setBlockFormat would relayout it for nothing.
+        current_fmt = cursor.blockFormat()
+        block_fmt = QTextBlockFormat(current_fmt)
         block_fmt.setIndent(0)
         block_fmt.setLeftMargin(0)
         block_fmt.setTopMargin(0)
@@ -2334,19 +3244,25 @@ class MarkdownNotebookTab(QWidget):
         block_fmt.setHeadingLevel(0)
         block_fmt.setProperty(QTextFormat.Property.BlockQuoteLevel, 0)
         block_fmt.setAlignment(Qt.AlignmentFlag.AlignLeft)
-        cursor.setBlockFormat(block_fmt)
+        doc = self.editor.document()
+        single_block = (doc.findBlock(cursor.selectionStart()) == doc.findBlock(cursor.selectionEnd()))
+        if not single_block or block_fmt != current_fmt:
+            cursor.setBlockFormat(block_fmt)
 
         # Remove from list if in one
         current_list = cursor.currentList()
         if current_list:
             current_list.remove(cursor.block())
 
+        cursor.endEditBlock()
         self.editor.setTextCursor(cursor)
         self.editor.setFocus()
 
+    @pyqtSlot()
     def _toggle_bullet_list(self):
         """Toggle bullet list for current line."""
         cursor = self.editor.textCursor()
+        cursor.beginEditBlock()
         current_list = cursor.currentList()
 
         if current_list and current_list.format().style() == QTextListFormat.Style.ListDisc:
@@ -2365,12 +3281,15 @@ class MarkdownNotebookTab(QWidget):
             list_fmt.setStyle(QTextListFormat.Style.ListDisc)
             cursor.createList(list_fmt)
 
+        cursor.endEditBlock()
         self.editor.setTextCursor(cursor)
         self.editor.setFocus()
 
+    @pyqtSlot()
     def _toggle_number_list(self):
         """Toggle numbered list for current line."""
         cursor = self.editor.textCursor()
+        cursor.beginEditBlock()
         current_list = cursor.currentList()
 
         if current_list and current_list.format().style() == QTextListFormat.Style.ListDecimal:
@@ -2389,55 +3308,96 @@ class MarkdownNotebookTab(QWidget):
             list_fmt.setStyle(QTextListFormat.Style.ListDecimal)
             cursor.createList(list_fmt)
 
+        cursor.endEditBlock()
         self.editor.setTextCursor(cursor)
         self.editor.setFocus()
 
+    @pyqtSlot()
     def _update_format_buttons(self):
         """Update toolbar button checked states to reflect formatting at cursor."""
         # Only read format state here, never modify document content
         cursor = self.editor.textCursor()
         fmt = cursor.charFormat()
 
-        self.bold_btn.blockSignals(True)
-        self.bold_btn.setChecked(fmt.fontWeight() == QFont.Weight.Bold)
-        self.bold_btn.blockSignals(False)
-
-        self.italic_btn.blockSignals(True)
-        self.italic_btn.setChecked(fmt.fontItalic())
-        self.italic_btn.blockSignals(False)
-
-        self.underline_btn.blockSignals(True)
-        self.underline_btn.setChecked(fmt.fontUnderline())
-        self.underline_btn.blockSignals(False)
-
-        self.strike_btn.blockSignals(True)
-        self.strike_btn.setChecked(fmt.fontStrikeOut())
-        self.strike_btn.blockSignals(False)
+        for btn, is_active in self._format_buttons:
+            checked = is_active(fmt)
+            if btn.isChecked() != checked:
+                with QSignalBlocker(btn):
+                    btn.setChecked(checked)
 
+    @pyqtSlot()
     def _on_content_changed(self):
         """Handle content changes and apply live markdown formatting."""
         self._is_modified = True
-        self._update_status()
-        self._update_word_count()
-
-        # Apply live markdown formatting (Notion-like)
-        self._apply_live_markdown()
+        # Restyle the status only when it isn't already showing the edit;
+        # explicit statuses (Opened, Saving...) stay until the next edit
+        if self.status_label.text() != "Modified":
+            self._update_status()
+        self._stats_timer.start(150)
+
+        # Apply live markdown formatting (Notion-like) right away for a typed
+        # whitespace, otherwise on the next event-loop turn; changes made by
+        # the conversion itself don't schedule another
+        if not getattr(self, '_applying_markdown', False):
+            if self._live_markdown_now:
+                self._live_markdown_now = False
+                self._live_markdown_timer.stop()
+                self._apply_live_markdown()
+            else:
+                self._live_markdown_timer.start()
 
     def _update_status(self):
         """Update status label."""
         if self._is_modified:
             self.status_label.setText("Modified")
-            self.status_label.setStyleSheet(f"color: {DARK_THEME['warning']}; font-size: 11px;")
+            self.status_label.setStyleSheet(_STYLE_WARN)
         else:
             self.status_label.setText("Saved")
-            self.status_label.setStyleSheet(f"color: {DARK_THEME['success']}; font-size: 11px;")
+            self.status_label.setStyleSheet(_STYLE_OK)
+
+    @pyqtSlot(int, int, int)
+    def _on_contents_change(self, position, removed, added):
+        """Recount words only in the blocks covered by an edit."""
+        doc = self.editor.document()
+        self._live_markdown_now = removed == 0 and added == 1 and doc.characterAt(position).isspace()
+        end = min(position + added, doc.characterCount() - 1)
+        first = doc.findBlock(position).blockNumber()
+        last = doc.findBlock(end).blockNumber()
+        # Blocks the edited region spanned before the change
+        old_span = (last - first + 1) - (doc.blockCount() - len(self._block_words))
+        if first < 0 or last < first or old_span < 1 or first + old_span > len(self._block_words):
+            self._recount_words()
+            return
+
+        counts = []
+        block = doc.findBlockByNumber(first)
+        for _ in range(last - first + 1):
+            counts.append(len(block.text().split()))
+            block = block.next()
+        old_counts = self._block_words[first:first + old_span]
+        self._word_count += sum(counts) - sum(old_counts)
+        self._block_words[first:first + old_span] = counts
+
+    def _recount_words(self):
+        """Rebuild the per-block word counts from scratch."""
+        doc = self.editor.document()
+        counts = []
+        block = doc.begin()
+        while block.isValid():
+            counts.append(len(block.text().split()))
+            block = block.next()
+        self._block_words = counts
+        self._word_count = sum(counts)
 
+    @pyqtSlot()
     def _update_word_count(self):
         """Update word and character count."""
-        text = self.editor.toPlainText()
-        words = len(text.split()) if text.strip() else 0
-        chars = len(text)
-        self.word_count_label.setText(f"Words: {words} | Characters: {chars}")
+        doc = self.editor.document()
+        if len(self._block_words) != doc.blockCount():
+            self._recount_words()
+        # characterCount() includes the final paragraph separator
+        chars = doc.characterCount() - 1
+        self.word_count_label.setText(f"Words: {self._word_count} | Characters: {chars}")
 
     def eventFilter(self, obj, event):
         """Handle Enter key to reset formatting for new lines."""
@@ -2463,18 +3423,16 @@ class MarkdownNotebookTab(QWidget):
 
                 # Reset formatting for the new line
                 new_cursor = self.editor.textCursor()
-                new_cursor.setCharFormat(QTextCharFormat())
-                new_block_fmt = QTextBlockFormat()
-                new_cursor.setBlockFormat(new_block_fmt)
+                new_cursor.setCharFormat(self._PLAIN_CHAR_FORMAT)
+                new_cursor.setBlockFormat(self._PLAIN_BLOCK_FORMAT)
                 self.editor.setTextCursor(new_cursor)
                 return True
 
         return super().eventFilter(obj, event)
 
+    @pyqtSlot()
     def _apply_live_markdown(self):
         """Apply Notion-like live markdown formatting when patterns are completed."""
-
-
         # Prevent recursion
         if getattr(self, '_applying_markdown', False):
             return
@@ -2500,64 +3458,62 @@ class MarkdownNotebookTab(QWidget):
             if pos_in_block == 0:
                 return
 
+            # Block patterns start with one of #>-* and a closed span that can
+            # end next to the cursor has its closing marker in the last three
+            # characters; skip the regexes for everything else
+            if text[0] not in '#>-*' and not any(c in '*~`' for c in text[max(0, pos_in_block - 3):pos_in_block]):
+                return
+
             # Check for completed patterns that should trigger conversion
             block_start = block.position()
             self._applying_markdown = True
 
-            # Patterns that trigger on space after completion
-            space_patterns = [
-                # Headers at start of line with content
-                (r'^(#{1,3})\s+(.+)\s$', self._format_header),
-                # Horizontal rule (exactly --- followed by space or at end)
-                (r'^---\s*$', self._format_horizontal_rule),
-                # Quote > text
-                (r'^>\s+(.+)\s$', self._format_quote),
-                # Bullet list
-                (r'^[-*]\s+(.+)\s$', self._format_bullet),
-            ]
-
-            # Patterns that trigger when closed (e.g., **text** )
-            closed_patterns = [
-                # Bold **text** followed by space
-                (r'\*\*([^*]+)\*\*\s', self._format_bold),
-                # Italic *text* followed by space (not part of bold)
-                (r'(?<!\*)\*([^*]+)\*(?!\*)\s', self._format_italic),
-                # Strikethrough ~~text~~ followed by space
-                (r'~~([^~]+)~~\s', self._format_strikethrough),
-                # Inline code `text` followed by space
-                (r'`([^`]+)`\s', self._format_inline_code),
-            ]
-
-            # Try space-triggered patterns
-            for pattern, format_func in space_patterns:
-                match = re.match(pattern, text)
+            # Space-triggered block patterns: headers, horizontal rule
+            # (exactly --- followed by space or at end), quote, bullet list
+            match = _RE_LIVE_SPACE.match(text)
+            if match:
+                start = block_start + match.start()
+                end = block_start + match.end()
+                self._run_live_format(self._live_formatters[match.lastgroup], start, end, match)
+                return  # Only process one pattern per change
+
+            # Closed inline patterns (e.g., **text** ): bold, italic (not part
+            # of bold), strikethrough, inline code; take the one ending near
+            # the cursor. Only the text just behind the cursor is searched, and
+            # only when the span would end on whitespace.
+            scan_start = max(0, pos_in_block - _LIVE_CLOSED_LOOKBACK)
+            for match_end in (pos_in_block, pos_in_block - 1, pos_in_block + 1):
+                if match_end < 2 or match_end > len(text) or not text[match_end - 1].isspace():
+                    continue
+                match = _RE_LIVE_CLOSED.search(text, scan_start, match_end)
                 if match:
                     start = block_start + match.start()
-                    end = block_start + match.end()
-                    format_func(start, end, match)
+                    end = block_start + match.end() - 1  # Exclude trailing space
+                    self._run_live_format(self._live_formatters[match.lastgroup], start, end, match)
                     return  # Only process one pattern per change
 
-            # Try closed patterns
-            for pattern, format_func in closed_patterns:
-                # Search for pattern ending near cursor position
-                for match in re.finditer(pattern, text):
-                    match_end = match.end()
-                    # Check if this match ends near cursor
-                    if abs(pos_in_block - match_end) <= 1:
-                        start = block_start + match.start()
-                        end = block_start + match.end() - 1  # Exclude trailing space
-                        format_func(start, end, match)
-                        return  # Only process one pattern per change
-
         except Exception:
             pass
         finally:
             self._applying_markdown = False
 
+    def _run_live_format(self, format_func, start, end, match):
+        """Run one live-markdown conversion as a single edit block.
+
+        The remove/format/insert steps then lay out once and undo as one step
+        back to the typed markdown.
+        """
+        cursor = self.editor.textCursor()
+        cursor.beginEditBlock()
+        try:
+            format_func(start, end, match)
+        finally:
+            cursor.endEditBlock()
+
     def _format_header(self, start, end, match):
         """Format header (# ## ###)."""
-        level = len(match.group(1))
-        content = match.group(2)
+        level = len(match.group('hashes'))
+        content = match.group('header_text')
 
         cursor = self.editor.textCursor()
         cursor.setPosition(start)
@@ -2567,76 +3523,52 @@ class MarkdownNotebookTab(QWidget):
         cursor.removeSelectedText()
 
         # Set block-level heading with spacing
-        block_fmt = cursor.blockFormat()
-        block_fmt.setHeadingLevel(level)
-        block_fmt.setTopMargin(16)
-        block_fmt.setBottomMargin(8)
-        block_fmt.setLineHeight(150, 1)
-        cursor.setBlockFormat(block_fmt)
-
-        fmt = QTextCharFormat()
-        sizes = {1: 24, 2: 20, 3: 16}
-        fmt.setFontPointSize(sizes.get(level, 14))
-        fmt.setFontWeight(QFont.Weight.Bold)
-
-        cursor.insertText(content, fmt)
+        cursor.mergeBlockFormat(self._HEADING_BLOCK_FORMATS[level])
+        cursor.insertText(content, self._HEADING_FORMATS[level])
 
     def _format_bold(self, start, end, match):
         """Format bold **text**."""
-        content = match.group(1)
+        content = match.group('bold_text')
 
         cursor = self.editor.textCursor()
         cursor.setPosition(start)
         cursor.setPosition(end, QTextCursor.MoveMode.KeepAnchor)
 
         cursor.removeSelectedText()
-
-        fmt = QTextCharFormat()
-        fmt.setFontWeight(QFont.Weight.Bold)
-        cursor.insertText(content, fmt)
+        cursor.insertText(content, self._BOLD_FORMAT)
 
     def _format_italic(self, start, end, match):
         """Format italic *text*."""
-        content = match.group(1)
+        content = match.group('italic_text')
 
         cursor = self.editor.textCursor()
         cursor.setPosition(start)
         cursor.setPosition(end, QTextCursor.MoveMode.KeepAnchor)
 
         cursor.removeSelectedText()
-
-        fmt = QTextCharFormat()
-        fmt.setFontItalic(True)
-        cursor.insertText(content, fmt)
+        cursor.insertText(content, self._ITALIC_FORMAT)
 
     def _format_strikethrough(self, start, end, match):
         """Format strikethrough ~~text~~."""
-        content = match.group(1)
+        content = match.group('strike_text')
 
         cursor = self.editor.textCursor()
         cursor.setPosition(start)
         cursor.setPosition(end, QTextCursor.MoveMode.KeepAnchor)
 
         cursor.removeSelectedText()
-
-        fmt = QTextCharFormat()
-        fmt.setFontStrikeOut(True)
-        cursor.insertText(content, fmt)
+        cursor.insertText(content, self._STRIKE_FORMAT)
 
     def _format_inline_code(self, start, end, match):
         """Format inline code `text`."""
-        content = match.group(1)
+        content = match.group('code_text')
 
         cursor = self.editor.textCursor()
         cursor.setPosition(start)
         cursor.setPosition(end, QTextCursor.MoveMode.KeepAnchor)
 
         cursor.removeSelectedText()
-
-        fmt = QTextCharFormat()
-        fmt.setFontFamily("Courier New")
-        fmt.setBackground(QColor(DARK_THEME['surface_light']))
-        cursor.insertText(content, fmt)
+        cursor.insertText(content, self._CODE_FORMAT)
 
     def _format_horizontal_rule(self, start, end, _match):
         """Format horizontal rule --- using HTML hr for proper markdown round-trip."""
@@ -2645,11 +3577,11 @@ class MarkdownNotebookTab(QWidget):
         cursor.setPosition(end, QTextCursor.MoveMode.KeepAnchor)
 
         cursor.removeSelectedText()
-        cursor.insertHtml(f'<hr style="border: none; border-top: 1px solid {DARK_THEME["border"]};" />')
+        cursor.insertHtml(_HR_HTML)
 
     def _format_quote(self, start, end, match):
         """Format quote > text using proper blockquote for markdown round-trip."""
-        content = match.group(1)
+        content = match.group('quote_text')
 
         cursor = self.editor.textCursor()
         cursor.setPosition(start)
@@ -2658,20 +3590,14 @@ class MarkdownNotebookTab(QWidget):
         cursor.removeSelectedText()
 
         # Use proper blockquote property so toMarkdown() serializes as >
-        block_fmt = cursor.blockFormat()
-        block_fmt.setProperty(QTextFormat.Property.BlockQuoteLevel, 1)
-        block_fmt.setLeftMargin(20)
-        cursor.setBlockFormat(block_fmt)
+        cursor.mergeBlockFormat(self._QUOTE_BLOCK_FORMAT)
 
         # Set character format for visual styling
-        fmt = QTextCharFormat()
-        fmt.setForeground(QColor(DARK_THEME['text_secondary']))
-        fmt.setFontItalic(True)
-        cursor.insertText(content, fmt)
+        cursor.insertText(content, self._QUOTE_FORMAT)
 
     def _format_bullet(self, start, end, match):
         """Format bullet list - item."""
-        content = match.group(1)
+        content = match.group('bullet_text')
 
         cursor = self.editor.textCursor()
         cursor.setPosition(start)
@@ -2703,6 +3629,7 @@ class MarkdownNotebookTab(QWidget):
 
         cursor.insertText(content)
 
+    @pyqtSlot()
     def _new_document(self):
         """Create a new document."""
         if self._is_modified:
@@ -2719,52 +3646,13 @@ class MarkdownNotebookTab(QWidget):
 
         self.title_input.clear()
         self.editor.clear()
+        self._html_cache = (-1, "")
         self._current_file = None
         self._is_modified = False
         self.file_label.setText("New Document")
         self._update_status()
         self.status_label.setText("Ready")
-        self.status_label.setStyleSheet(f"color: {DARK_THEME['text_secondary']}; font-size: 11px;")
-
-    def _apply_post_load_styling(self):
-        """Re-apply visual styling after loading markdown content."""
-        doc = self.editor.document()
-        block = doc.begin()
-        while block.isValid():
-            cursor = QTextCursor(block)
-            block_fmt = block.blockFormat()
-
-            modified = False
-            new_fmt = QTextBlockFormat(block_fmt)
-
-            heading_level = block_fmt.headingLevel()
-            if heading_level > 0:
-                new_fmt.setTopMargin(16)
-                new_fmt.setBottomMargin(8)
-                new_fmt.setLineHeight(150, 1)
-                # Select only block text content, not the block separator
-                sizes = {1: 24, 2: 20, 3: 16}
-                char_fmt = QTextCharFormat()
-                char_fmt.setFontPointSize(sizes.get(heading_level, 14))
-                char_fmt.setFontWeight(QFont.Weight.Bold)
-                cursor.movePosition(QTextCursor.MoveOperation.StartOfBlock)
-                cursor.movePosition(QTextCursor.MoveOperation.EndOfBlock, QTextCursor.MoveMode.KeepAnchor)
-                cursor.mergeCharFormat(char_fmt)
-                modified = True
-
-            quote_level = block_fmt.property(QTextFormat.Property.BlockQuoteLevel)
-            if quote_level and quote_level > 0:
-                new_fmt.setLeftMargin(20)
-                char_fmt = QTextCharFormat()
-                char_fmt.setForeground(QColor(DARK_THEME['text_secondary']))
-                char_fmt.setFontItalic(True)
-                cursor.movePosition(QTextCursor.MoveOperation.StartOfBlock)
-                cursor.movePosition(QTextCursor.MoveOperation.EndOfBlock, QTextCursor.MoveMode.KeepAnchor)
-                cursor.mergeCharFormat(char_fmt)
-                modified = True
-
-            cursor.setBlockFormat(new_fmt)
-            block = block.next()
+        self.status_label.setStyleSheet(_STYLE_MUTED)
 
     def _load_markdown_content(self, content):
         """Load markdown content into the editor, preserving blank lines.
@@ -2772,8 +3660,6 @@ class MarkdownNotebookTab(QWidget):
         Parses markdown line by line and builds the document directly so
         blank lines are preserved as empty blocks.
         """
-
-
         self.editor.clear()
         cursor = self.editor.textCursor()
         lines = content.split('\n')
@@ -2781,13 +3667,28 @@ class MarkdownNotebookTab(QWidget):
         if lines and lines[-1] == '':
             lines = lines[:-1]
 
+        # Build the document as one edit block so it is laid out once, with
+        # undo off so the load leaves no history to undo back through
+        doc = self.editor.document()
+        doc.setUndoRedoEnabled(False)
+        cursor.beginEditBlock()
+        try:
+            self._insert_markdown_lines(cursor, lines)
+        finally:
+            cursor.endEditBlock()
+            doc.setUndoRedoEnabled(True)
+            # The revision doesn't advance while undo is off
+            self._html_cache = (-1, "")
+
+    def _insert_markdown_lines(self, cursor, lines):
+        """Insert markdown lines at cursor as formatted blocks."""
         first_block = True
         current_list = None
         current_list_type = None
 
         # Default formats to reset to between blocks
-        default_block_fmt = QTextBlockFormat()
-        default_char_fmt = QTextCharFormat()
+        default_block_fmt = self._PLAIN_BLOCK_FORMAT
+        default_char_fmt = self._PLAIN_CHAR_FORMAT
 
         for line in lines:
             if not first_block:
@@ -2804,56 +3705,33 @@ class MarkdownNotebookTab(QWidget):
                 current_list_type = None
                 continue
 
+            kind, level, text = _classify_markdown_line(stripped)
+
             # Heading: # ## ###
-            heading_match = re.match(r'^(#{1,3})\s+(.+)$', stripped)
-            if heading_match:
-                level = len(heading_match.group(1))
-                text = heading_match.group(2)
-                block_fmt = cursor.blockFormat()
-                block_fmt.setHeadingLevel(level)
-                block_fmt.setTopMargin(16)
-                block_fmt.setBottomMargin(8)
-                block_fmt.setLineHeight(150, 1)
-                cursor.setBlockFormat(block_fmt)
-                fmt = QTextCharFormat()
-                sizes = {1: 24, 2: 20, 3: 16}
-                fmt.setFontPointSize(sizes.get(level, 14))
-                fmt.setFontWeight(QFont.Weight.Bold)
-                self._insert_inline_markdown(cursor, text, base_fmt=fmt)
+            if kind == "heading":
+                cursor.mergeBlockFormat(self._HEADING_BLOCK_FORMATS[level])
+                self._insert_inline_markdown(cursor, text, level=level)
                 current_list = None
                 current_list_type = None
                 continue
 
             # Blockquote: > text
-            quote_match = re.match(r'^>\s*(.*)$', stripped)
-            if quote_match:
-                text = quote_match.group(1)
-                block_fmt = cursor.blockFormat()
-                block_fmt.setProperty(QTextFormat.Property.BlockQuoteLevel, 1)
-                block_fmt.setLeftMargin(20)
-                cursor.setBlockFormat(block_fmt)
-                fmt = QTextCharFormat()
-                fmt.setForeground(QColor(DARK_THEME['text_secondary']))
-                fmt.setFontItalic(True)
-                fmt.setFontPointSize(14)
-                cursor.insertText(text, fmt)
+            if kind == "quote":
+                cursor.mergeBlockFormat(self._QUOTE_BLOCK_FORMAT)
+                cursor.insertText(text, self._QUOTE_LOAD_FORMAT)
                 current_list = None
                 current_list_type = None
                 continue
 
             # Horizontal rule: ---
-            if re.match(r'^-{3,}$', stripped):
-                cursor.insertHtml(
-                    f'<hr style="border: none; border-top: 1px solid {DARK_THEME["border"]};" />'
-                )
+            if kind == "hr":
+                cursor.insertHtml(_HR_HTML)
                 current_list = None
                 current_list_type = None
                 continue
 
             # Unordered list: - or * item
-            bullet_match = re.match(r'^[-*]\s+(.+)$', stripped)
-            if bullet_match:
-                text = bullet_match.group(1)
+            if kind == "bullet":
                 if current_list and current_list_type == 'ul':
                     current_list.add(cursor.block())
                 else:
@@ -2865,9 +3743,7 @@ class MarkdownNotebookTab(QWidget):
                 continue
 
             # Ordered list: 1. item
-            num_match = re.match(r'^\d+\.\s+(.+)$', stripped)
-            if num_match:
-                text = num_match.group(1)
+            if kind == "number":
                 if current_list and current_list_type == 'ol':
                     current_list.add(cursor.block())
                 else:
@@ -2883,56 +3759,37 @@ class MarkdownNotebookTab(QWidget):
             current_list_type = None
             # Only apply inline markdown parsing if line has markdown syntax
 
-            if re.search(r'\*\*|__|\*|_|~~|`|<u>|</u>', stripped):
+            if _RE_INLINE_SYNTAX.search(stripped):
                 self._insert_inline_markdown(cursor, stripped)
             else:
                 cursor.insertText(stripped)
 
-    def _insert_inline_markdown(self, cursor, text, base_fmt=None):
-        """Parse inline markdown (bold, italic, strikethrough) and insert formatted text."""
+    def _insert_inline_markdown(self, cursor, text, level=0):
+        """Parse inline markdown (bold, italic, strikethrough) and insert formatted text.
 
-
-        if base_fmt is None:
-            base_fmt = QTextCharFormat()
+        level is the heading level whose format the text is inserted over,
+        or 0 for body text.
+        """
+        base_fmt = self._HEADING_FORMATS[level] if level else self._PLAIN_CHAR_FORMAT
+        code_fmt, bold_fmt, italic_fmt, strike_fmt, underline_fmt = self._INLINE_FORMATS[level]
 
         # Pattern matches inline markdown formats or plain text
-        pattern = re.compile(
-            r'(`([^`]+)`)'            # inline code
-            r'|(\*\*(.+?)\*\*)'      # bold
-            r'|(\*(.+?)\*)'          # italic
-            r'|(~~(.+?)~~)'          # strikethrough
-            r'|(<u>(.+?)</u>)'       # underline
-            r'|([^*~`<]+)'           # plain text
-            r'|([*~`<])'            # leftover markers
-        )
-
-        for m in pattern.finditer(text):
+        for m in _RE_INLINE_MARKDOWN.finditer(text):
             if m.group(2) is not None:
                 # Inline code
-                fmt = QTextCharFormat(base_fmt)
-                fmt.setFontFamily("Courier New")
-                fmt.setBackground(QColor(DARK_THEME['surface_light']))
-                cursor.insertText(m.group(2), fmt)
+                cursor.insertText(m.group(2), code_fmt)
             elif m.group(4) is not None:
                 # Bold
-                fmt = QTextCharFormat(base_fmt)
-                fmt.setFontWeight(QFont.Weight.Bold)
-                cursor.insertText(m.group(4), fmt)
+                cursor.insertText(m.group(4), bold_fmt)
             elif m.group(6) is not None:
                 # Italic
-                fmt = QTextCharFormat(base_fmt)
-                fmt.setFontItalic(True)
-                cursor.insertText(m.group(6), fmt)
+                cursor.insertText(m.group(6), italic_fmt)
             elif m.group(8) is not None:
                 # Strikethrough
-                fmt = QTextCharFormat(base_fmt)
-                fmt.setFontStrikeOut(True)
-                cursor.insertText(m.group(8), fmt)
+                cursor.insertText(m.group(8), strike_fmt)
             elif m.group(10) is not None:
                 # Underline
-                fmt = QTextCharFormat(base_fmt)
-                fmt.setFontUnderline(True)
-                cursor.insertText(m.group(10), fmt)
+                cursor.insertText(m.group(10), underline_fmt)
             elif m.group(11) is not None:
                 # Plain text
                 cursor.insertText(m.group(11), base_fmt)
@@ -2940,6 +3797,7 @@ class MarkdownNotebookTab(QWidget):
                 # Leftover marker char
                 cursor.insertText(m.group(12), base_fmt)
 
+    @pyqtSlot()
     def _open_document(self):
         """Open an existing document (supports .md and .txt)."""
         if self._is_modified:
@@ -2971,10 +3829,15 @@ class MarkdownNotebookTab(QWidget):
                 with open(file_path, 'r', encoding='utf-8') as f:
                     content = f.read()
 
-                # Block signals during load to prevent _apply_live_markdown interference
+                # Block signals during load to prevent _apply_live_markdown
+                # interference, and skip repaints until the document is built
                 self.editor.blockSignals(True)
-                self._load_markdown_content(content)
-                self.editor.blockSignals(False)
+                self.editor.setUpdatesEnabled(False)
+                try:
+                    self._load_markdown_content(content)
+                finally:
+                    self.editor.setUpdatesEnabled(True)
+                    self.editor.blockSignals(False)
 
                 # Extract title from filename
 
@@ -2983,7 +3846,7 @@ class MarkdownNotebookTab(QWidget):
                 self._is_modified = False
                 self.file_label.setText(Path(file_path).name)
                 self.status_label.setText("Opened")
-                self.status_label.setStyleSheet(f"color: {DARK_THEME['success']}; font-size: 11px;")
+                self.status_label.setStyleSheet(_STYLE_OK)
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to open file: {str(e)}")
 
@@ -2994,149 +3857,38 @@ class MarkdownNotebookTab(QWidget):
         causes segfaults in PyQt6. Uses toHtml() (safe) and converts
         the HTML to markdown by walking block-level elements in order.
         """
-
-
-
-        html = self.editor.toHtml()
+        html = self._document_html()
 
         # Extract body content
-        body_match = re.search(r'<body[^>]*>(.*)</body>', html, re.DOTALL)
+        body_match = _RE_BODY.search(html)
         if not body_match:
             return self.editor.toPlainText() + '\n'
 
-        body = body_match.group(1).strip()
-        lines = []
-
-        # Match all block-level elements in document order
-        block_re = re.compile(
-            r'<(h[1-3])([^>]*)>(.*?)</\1>'
-            r'|<(blockquote)[^>]*>(.*?)</\4>'
-            r'|<(ol)[^>]*>(.*?)</\6>'
-            r'|<(ul)[^>]*>(.*?)</\8>'
-            r'|<(hr)[^>]*/?\s*>'
-            r'|<(p)([^>]*)>(.*?)</p>',
-            re.DOTALL
-        )
-
-        for m in block_re.finditer(body):
-            # Heading h1-h3
-            if m.group(1):
-                tag = m.group(1)
-                level = int(tag[1])
-                inner = self._html_inline_to_md(m.group(3), skip_bold=True)
-                lines.append(f'{"#" * level} {inner}')
-
-            # Blockquote
-            elif m.group(4):
-                inner_html = m.group(5)
-                paragraphs = re.findall(r'<p[^>]*>(.*?)</p>', inner_html, re.DOTALL)
-                if paragraphs:
-                    for p in paragraphs:
-                        inner = self._html_inline_to_md(p, skip_italic=True)
-                        if inner:
-                            lines.append(f'> {inner}')
-                else:
-                    inner = self._html_inline_to_md(inner_html, skip_italic=True)
-                    if inner:
-                        lines.append(f'> {inner}')
-
-            # Ordered list
-            elif m.group(6):
-                items = re.findall(r'<li[^>]*>(.*?)</li>', m.group(7), re.DOTALL)
-                for i, item in enumerate(items, 1):
-                    inner = self._html_inline_to_md(item)
-                    lines.append(f'{i}. {inner}')
-
-            # Unordered list
-            elif m.group(8):
-                items = re.findall(r'<li[^>]*>(.*?)</li>', m.group(9), re.DOTALL)
-                for item in items:
-                    inner = self._html_inline_to_md(item)
-                    lines.append(f'- {inner}')
-
-            # Horizontal rule
-            elif m.group(10):
-                lines.append('---')
-
-            # Paragraph
-            elif m.group(11):
-                inner = m.group(13)
-
-                # Empty paragraph = blank line
-                if not inner.strip() or inner.strip() in ('<br />', '<br/>', '<br>'):
-                    lines.append('')
-                    continue
-
-                # Horizontal rule unicode
-                plain = re.sub(r'<[^>]+>', '', inner).strip()
-                if plain and all(c in '\u2500\u2501\u2502\u2503' for c in plain):
-                    lines.append('---')
-                    continue
-
-                inner_md = self._html_inline_to_md(inner)
-                lines.append(inner_md)
+        parser = _MarkdownHtmlParser()
+        parser.feed(body_match.group(1))
+        parser.close()
+        lines = parser.lines
 
         if not lines:
             return self.editor.toPlainText() + '\n'
 
-        # Strip trailing empty lines
-        while lines and lines[-1] == '':
-            lines.pop()
-
-        return '\n'.join(lines) + '\n'
-
-    def _html_inline_to_md(self, html_text, skip_bold=False, skip_italic=False):
-        """Convert inline HTML formatting to markdown syntax."""
-
-
-
-        text = html_text
-
-        # Inline code (font-family monospace/courier)
-        def code_repl(m):
-            inner = re.sub(r'<[^>]+>', '', m.group(1))
-            return f'`{inner}`'
-        text = re.sub(r'<span[^>]*font-family:[^>]*[Cc]ourier[^>]*>(.*?)</span>', code_repl, text)
-
-        # Bold
-        if not skip_bold:
-            def bold_repl(m):
-                inner = re.sub(r'<[^>]+>', '', m.group(1))
-                return f'**{inner}**'
-            text = re.sub(r'<span[^>]*font-weight:(?:bold|[6-9]\d\d)[^>]*>(.*?)</span>', bold_repl, text)
-            text = re.sub(r'<b>(.*?)</b>', bold_repl, text)
-            text = re.sub(r'<strong>(.*?)</strong>', bold_repl, text)
-
-        # Italic
-        if not skip_italic:
-            def italic_repl(m):
-                inner = re.sub(r'<[^>]+>', '', m.group(1))
-                return f'*{inner}*'
-            text = re.sub(r'<span[^>]*font-style:italic[^>]*>(.*?)</span>', italic_repl, text)
-            text = re.sub(r'<i>(.*?)</i>', italic_repl, text)
-            text = re.sub(r'<em>(.*?)</em>', italic_repl, text)
-
-        # Strikethrough
-        def strike_repl(m):
-            inner = re.sub(r'<[^>]+>', '', m.group(1))
-            return f'~~{inner}~~'
-        text = re.sub(r'<span[^>]*text-decoration:[^>]*line-through[^>]*>(.*?)</span>', strike_repl, text)
-        text = re.sub(r'<s>(.*?)</s>', strike_repl, text)
-        text = re.sub(r'<del>(.*?)</del>', strike_repl, text)
-
-        # Underline
-        def underline_repl(m):
-            inner = re.sub(r'<[^>]+>', '', m.group(1))
-            return f'<u>{inner}</u>'
-        text = re.sub(r'<span[^>]*text-decoration:[^>]*underline[^>]*>(.*?)</span>', underline_repl, text)
-
-        # Strip remaining span tags
-        text = re.sub(r'</?span[^>]*>', '', text)
-        # Strip br tags
-        text = re.sub(r'<br\s*/?>', '', text)
-
-        text = unescape(text)
-        return text.strip()
+        # Drop trailing empty lines and end with a single newline
+        end = len(lines)
+        while end and lines[end - 1] == '':
+            end -= 1
+        if not end:
+            return '\n'
+        if end != len(lines):
+            lines = lines[:end]
+        lines.append('')
+        return '\n'.join(lines)
+
+    def _document_html(self):
+        """Return editor.toHtml(), reused while the document revision is unchanged."""
+        revision = self.editor.document().revision()
+        if self._html_cache[0] != revision:
+            self._html_cache = (revision, self.editor.toHtml())
+        return self._html_cache[1]
 
     def _strip_formatted_spaces(self):
         """Strip leading/trailing spaces from bold/italic/strikethrough runs.
@@ -3145,10 +3897,16 @@ class MarkdownNotebookTab(QWidget):
         bolds ' hello ', toMarkdown() produces '** hello **' which is invalid.
         This trims spaces so it becomes ' **hello** ' instead.
         """
+        # Nothing to trim without a bold, italic or strikethrough run. The
+        # HTML is the one the following save reuses if nothing changes here.
+        if not _RE_STYLED_RUN.search(self._document_html()):
+            return
+
         doc = self.editor.document()
-        cursor = QTextCursor(doc)
-        cursor.beginEditBlock()
 
+        # Collect the space runs first; formatting while the fragment
+        # iterator walks the document would shift the fragments ahead of it
+        ranges = []
         block = doc.begin()
         while block.isValid():
             it = block.begin()
@@ -3169,37 +3927,32 @@ class MarkdownNotebookTab(QWidget):
                             trail = len(text) - len(text.rstrip())
                             frag_start = fragment.position()
                             frag_end = frag_start + fragment.length()
-
-                            # Remove formatting from leading spaces
                             if lead > 0:
-                                cursor.setPosition(frag_start)
-                                cursor.setPosition(frag_start + lead, QTextCursor.MoveMode.KeepAnchor)
-                                plain_fmt = QTextCharFormat()
-                                plain_fmt.setFontWeight(QFont.Weight.Normal)
-                                plain_fmt.setFontItalic(False)
-                                plain_fmt.setFontStrikeOut(False)
-                                cursor.setCharFormat(plain_fmt)
-
-                            # Remove formatting from trailing spaces
+                                ranges.append((frag_start, frag_start + lead))
                             if trail > 0:
-                                cursor.setPosition(frag_end - trail)
-                                cursor.setPosition(frag_end, QTextCursor.MoveMode.KeepAnchor)
-                                plain_fmt = QTextCharFormat()
-                                plain_fmt.setFontWeight(QFont.Weight.Normal)
-                                plain_fmt.setFontItalic(False)
-                                plain_fmt.setFontStrikeOut(False)
-                                cursor.setCharFormat(plain_fmt)
+                                ranges.append((frag_end - trail, frag_end))
                 it += 1
             block = block.next()
 
+        if not ranges:
+            return
+
+        # Remove formatting from the collected spaces, last first
+        cursor = QTextCursor(doc)
+        cursor.beginEditBlock()
+        for start, end in reversed(ranges):
+            cursor.setPosition(start)
+            cursor.setPosition(end, QTextCursor.MoveMode.KeepAnchor)
+            cursor.setCharFormat(self._UNSTYLED_FORMAT)
         cursor.endEditBlock()
 
+    @pyqtSlot()
     def _create_prompt_from_notebook(self):
         """Create a prompt pill from the current notebook content."""
         content = self._document_to_markdown()
         if not content or not content.strip():
             self.status_label.setText("Nothing to create")
-            self.status_label.setStyleSheet(f"color: {DARK_THEME['warning']}; font-size: 11px;")
+            self.status_label.setStyleSheet(_STYLE_WARN)
             return
 
         title = self.title_input.text().strip() or content[:80].replace("\n", " ").strip()
@@ -3208,8 +3961,9 @@ class MarkdownNotebookTab(QWidget):
 
         self.createPromptRequested.emit(title, content)
         self.status_label.setText("Prompt created")
-        self.status_label.setStyleSheet(f"color: {DARK_THEME['success']}; font-size: 11px;")
+        self.status_label.setStyleSheet(_STYLE_OK)
 
+    @pyqtSlot()
     def _save_document(self):
         """Save the current document as Markdown."""
         notes_dir = CONFIG_DIR / "notes"
@@ -3232,39 +3986,132 @@ class MarkdownNotebookTab(QWidget):
             save_dialog_path("notebook_save", file_path)
             try:
                 content = self._document_to_markdown()
+            except Exception as e:
+                QMessageBox.critical(self, "Error", f"Failed to save file: {str(e)}")
+                return
 
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(content)
-
-                self._current_file = file_path
-                self._is_modified = False
+            # The document is taken as saved now, so opening or starting
+            # another one right after doesn't wait for the disk; a failed
+            # write marks it modified again
+            self._current_file = file_path
+            self._is_modified = False
 
-                self.file_label.setText(Path(file_path).name)
-                # Update title box if it was empty
-                if not self.title_input.text().strip():
+            self.file_label.setText(Path(file_path).name)
+            # Update title box if it was empty; naming the note isn't an edit
+            if not self.title_input.text().strip():
+                with QSignalBlocker(self.title_input):
                     self.title_input.setText(Path(file_path).stem)
-                self.status_label.setText("Saved")
-                self.status_label.setStyleSheet(f"color: {DARK_THEME['success']}; font-size: 11px;")
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to save file: {str(e)}")
+            self.status_label.setText("Saving...")
+            self.status_label.setStyleSheet(_STYLE_MUTED)
+            self._write_note(file_path, content)
+
+    def _write_note(self, file_path, content):
+        """Write a note in the background, after any write already queued."""
+        worker = NoteSaveWorker(file_path, content)
+        worker.signals.saveComplete.connect(self._on_note_saved)
+        worker.signals.saveError.connect(self._on_note_save_failed)
+        note_save_pool().start(worker)
+
+    @pyqtSlot(str)
+    def _on_note_saved(self, file_path):
+        if file_path == self._current_file and not self._is_modified:
+            self.status_label.setText("Saved")
+            self.status_label.setStyleSheet(_STYLE_OK)
+
+    @pyqtSlot(str, str, str)
+    def _on_note_save_failed(self, file_path, error, content):
+        if file_path == self._current_file:
+            # Still open, so marking it modified keeps the unsaved-changes prompt
+            self._is_modified = True
+            self._update_status()
+            QMessageBox.critical(self, "Error", f"Failed to save file: {error}")
+            return
+
+        # Another note was opened since; the failed write holds the only copy
+        # of this one, so offer to retry or save it elsewhere
+        reply = QMessageBox.critical(
+            self,
+            "Error",
+            f"Failed to save {Path(file_path).name}: {error}\n\n"
+            "The note is no longer open. Retry, or save it to another file?",
+            QMessageBox.StandardButton.Retry | QMessageBox.StandardButton.Save | QMessageBox.StandardButton.Discard,
+            QMessageBox.StandardButton.Retry
+        )
+        if reply == QMessageBox.StandardButton.Retry:
+            self._write_note(file_path, content)
+        elif reply == QMessageBox.StandardButton.Save:
+            new_path, _ = QFileDialog.getSaveFileName(
+                self,
+                "Save Note",
+                file_path,
+                "Markdown Files (*.md);;Text Files (*.txt)"
+            )
+            if new_path:
+                self._write_note(new_path, content)
+            else:
+                # Cancelled: ask again rather than drop the text
+                self._on_note_save_failed(file_path, error, content)
 
 class DownloadEntry(QFrame):
     """Single download item widget showing filename, progress, and actions."""
 
+    _STYLE_FRAME = f"""
+        QFrame {{
+            background-color: {DARK_THEME['surface']};
+            border-radius: 4px;
+            border: 1px solid {DARK_THEME['border']};
+        }}
+    """
+    _STYLE_NAME = f"font-size: 11px; font-weight: bold; color: {DARK_THEME['text_primary']}; border: none;"
+    _STYLE_BUTTON = f"""
+        QPushButton {{
+            background-color: {DARK_THEME['surface_light']};
+            color: {DARK_THEME['text_primary']};
+            border: 1px solid {DARK_THEME['border']};
+            border-radius: 3px;
+            padding: 2px 8px;
+            font-size: 10px;
+        }}
+        QPushButton:hover {{
+            background-color: {DARK_THEME['accent']};
+            border-color: {DARK_THEME['accent']};
+        }}
+    """
+    # Per state: (progress bar style or None to keep it, status dot style,
+    # status label style)
+    _STATE_STYLES = {
+        state: (
+            f"""
+            QProgressBar {{
+                background-color: {DARK_THEME['background']};
+                border: none;
+                border-radius: 2px;
+            }}
+            QProgressBar::chunk {{
+                background-color: {color};
+                border-radius: 2px;
+            }}
+            """ if restyle_bar else None,
+            f"background-color: {color}; border-radius: 6px; border: none;",
+            f"font-size: 10px; color: {label_color or color}; border: none;",
+        )
+        for state, color, label_color, restyle_bar in (
+            ("downloading", "#2196F3", DARK_THEME['text_secondary'], True),
+            ("completed", "#4CAF50", None, True),
+            ("failed", "#F44336", None, True),
+            ("cancelled", "#FF9800", None, False),
+        )
+    }
+
     def __init__(self, filename: str, directory: str, parent=None):
         super().__init__(parent)
         self.filename = filename
         self.directory = directory
         self.filepath = os.path.join(directory, filename)
+        self.is_finished = False  # Completed, failed or cancelled
 
         self.setFixedHeight(48)
-        self.setStyleSheet(f"""
-            QFrame {{
-                background-color: {DARK_THEME['surface']};
-                border-radius: 4px;
-                border: 1px solid {DARK_THEME['border']};
-            }}
-        """)
+        self.setStyleSheet(self._STYLE_FRAME)
 
         layout = QHBoxLayout(self)
         layout.setContentsMargins(10, 6, 10, 6)
@@ -3273,7 +4120,6 @@ class DownloadEntry(QFrame):
         # Status icon
         self.status_icon = QLabel()
         self.status_icon.setFixedSize(12, 12)
-        self.status_icon.setStyleSheet("background-color: #2196F3; border-radius: 6px; border: none;")
         layout.addWidget(self.status_icon)
 
         # Info column
@@ -3282,7 +4128,7 @@ class DownloadEntry(QFrame):
         info_layout.setSpacing(2)
 
         self.name_label = QLabel(filename)
-        self.name_label.setStyleSheet(f"font-size: 11px; font-weight: bold; color: {DARK_THEME['text_primary']}; border: none;")
+        self.name_label.setStyleSheet(self._STYLE_NAME)
         info_layout.addWidget(self.name_label)
 
         self.progress_bar = QProgressBar()
@@ -3290,51 +4136,25 @@ class DownloadEntry(QFrame):
         self.progress_bar.setRange(0, 100)
         self.progress_bar.setValue(0)
         self.progress_bar.setTextVisible(False)
-        self.progress_bar.setStyleSheet(f"""
-            QProgressBar {{
-                background-color: {DARK_THEME['background']};
-                border: none;
-                border-radius: 2px;
-            }}
-            QProgressBar::chunk {{
-                background-color: #2196F3;
-                border-radius: 2px;
-            }}
-        """)
         info_layout.addWidget(self.progress_bar)
 
         self.status_label = QLabel("Downloading... 0%")
-        self.status_label.setStyleSheet(f"font-size: 10px; color: {DARK_THEME['text_secondary']}; border: none;")
         info_layout.addWidget(self.status_label)
+        self._apply_state_style("downloading")
 
         layout.addLayout(info_layout, 1)
 
         # Action buttons
-        btn_style = f"""
-            QPushButton {{
-                background-color: {DARK_THEME['surface_light']};
-                color: {DARK_THEME['text_primary']};
-                border: 1px solid {DARK_THEME['border']};
-                border-radius: 3px;
-                padding: 2px 8px;
-                font-size: 10px;
-            }}
-            QPushButton:hover {{
-                background-color: {DARK_THEME['accent']};
-                border-color: {DARK_THEME['accent']};
-            }}
-        """
-
         self.open_file_btn = QPushButton("Open")
         self.open_file_btn.setFixedHeight(22)
-        self.open_file_btn.setStyleSheet(btn_style)
+        self.open_file_btn.setStyleSheet(self._STYLE_BUTTON)
         self.open_file_btn.clicked.connect(self._open_file)
         self.open_file_btn.hide()
         layout.addWidget(self.open_file_btn)
 
         self.open_folder_btn = QPushButton("Folder")
         self.open_folder_btn.setFixedHeight(22)
-        self.open_folder_btn.setStyleSheet(btn_style)
+        self.open_folder_btn.setStyleSheet(self._STYLE_BUTTON)
         self.open_folder_btn.clicked.connect(self._open_folder)
         self.open_folder_btn.hide()
         layout.addWidget(self.open_folder_btn)
@@ -3351,70 +4171,64 @@ class DownloadEntry(QFrame):
     def set_completed(self):
         """Mark as completed."""
         self.progress_bar.setValue(100)
-        self.progress_bar.setStyleSheet(f"""
-            QProgressBar {{
-                background-color: {DARK_THEME['background']};
-                border: none;
-                border-radius: 2px;
-            }}
-            QProgressBar::chunk {{
-                background-color: #4CAF50;
-                border-radius: 2px;
-            }}
-        """)
-        self.status_icon.setStyleSheet("background-color: #4CAF50; border-radius: 6px; border: none;")
+        self._apply_state_style("completed")
+        self.is_finished = True
         self.status_label.setText("Completed")
-        self.status_label.setStyleSheet("font-size: 10px; color: #4CAF50; border: none;")
         self.open_file_btn.show()
         self.open_folder_btn.show()
 
     def set_failed(self):
         """Mark as failed."""
         self.progress_bar.setRange(0, 100)
-        self.progress_bar.setStyleSheet(f"""
-            QProgressBar {{
-                background-color: {DARK_THEME['background']};
-                border: none;
-                border-radius: 2px;
-            }}
-            QProgressBar::chunk {{
-                background-color: #F44336;
-                border-radius: 2px;
-            }}
-        """)
-        self.status_icon.setStyleSheet("background-color: #F44336; border-radius: 6px; border: none;")
+        self._apply_state_style("failed")
+        self.is_finished = True
         self.status_label.setText("Failed")
-        self.status_label.setStyleSheet("font-size: 10px; color: #F44336; border: none;")
         self.open_folder_btn.show()
 
     def set_cancelled(self):
         """Mark as cancelled."""
         self.progress_bar.setRange(0, 100)
-        self.status_icon.setStyleSheet("background-color: #FF9800; border-radius: 6px; border: none;")
+        self._apply_state_style("cancelled")
+        self.is_finished = True
         self.status_label.setText("Cancelled")
-        self.status_label.setStyleSheet("font-size: 10px; color: #FF9800; border: none;")
+
+    def _apply_state_style(self, state: str):
+        """Apply the prebuilt bar, dot and label stylesheets for a state."""
+        bar_style, dot_style, label_style = self._STATE_STYLES[state]
+        if bar_style is not None:
+            self.progress_bar.setStyleSheet(bar_style)
+        self.status_icon.setStyleSheet(dot_style)
+        self.status_label.setStyleSheet(label_style)
 
     def _open_file(self):
         """Open the downloaded file with the system default app."""
-
         if os.path.exists(self.filepath):
-            subprocess.Popen(["open", self.filepath])
+            QDesktopServices.openUrl(QUrl.fromLocalFile(self.filepath))
 
     def _open_folder(self):
-        """Reveal the file in Finder."""
-
-        if os.path.exists(self.filepath):
+        """Reveal the file in Finder, or open its folder elsewhere."""
+        if sys.platform == "darwin" and os.path.exists(self.filepath):
+            # Qt can't select a file in the file manager; Finder can
             subprocess.Popen(["open", "-R", self.filepath])
         elif os.path.isdir(self.directory):
-            subprocess.Popen(["open", self.directory])
+            QDesktopServices.openUrl(QUrl.fromLocalFile(self.directory))
 
 
 class DownloadsTab(QWidget):
     """Downloads manager tab with list of downloads and folder settings."""
 
+    _MAX_ENTRIES = 50  # Oldest finished rows are dropped past this
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._entries: Dict[str, DownloadEntry] = {}
+
+        # Timer coalescing bursts of progress ticks into one update per entry
+        self._pending_progress: Dict[str, int] = {}
+        self._progress_flush_timer = QTimer(self)
+        self._progress_flush_timer.setSingleShot(True)
+        self._progress_flush_timer.timeout.connect(self._flush_download_progress)
+
         self._setup_ui()
         PlatformBrowser.add_download_listener(self._on_download_event)
 
@@ -3425,49 +4239,23 @@ class DownloadsTab(QWidget):
 
         # Header
         header = QFrame()
-        header.setStyleSheet(f"background-color: {DARK_THEME['surface']};")
+        header.setStyleSheet(_STYLE_SURFACE)
         header_layout = QHBoxLayout(header)
         header_layout.setContentsMargins(12, 8, 12, 8)
 
         title = QLabel("Downloads")
-        title.setStyleSheet(f"color: {DARK_THEME['text_primary']}; font-weight: bold;")
+        title.setStyleSheet(_STYLE_TITLE)
         header_layout.addWidget(title)
 
         header_layout.addStretch()
 
         change_folder_btn = QPushButton("Change Folder")
-        change_folder_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {DARK_THEME['surface_light']};
-                color: {DARK_THEME['text_primary']};
-                border: 1px solid {DARK_THEME['border']};
-                border-radius: 4px;
-                padding: 4px 12px;
-                font-size: 11px;
-            }}
-            QPushButton:hover {{
-                background-color: {DARK_THEME['accent']};
-                border-color: {DARK_THEME['accent']};
-            }}
-        """)
+        change_folder_btn.setStyleSheet(_STYLE_DOWNLOADS_BUTTON)
         change_folder_btn.clicked.connect(self._change_folder)
         header_layout.addWidget(change_folder_btn)
 
         clear_btn = QPushButton("Clear")
-        clear_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {DARK_THEME['surface_light']};
-                color: {DARK_THEME['text_primary']};
-                border: 1px solid {DARK_THEME['border']};
-                border-radius: 4px;
-                padding: 4px 12px;
-                font-size: 11px;
-            }}
-            QPushButton:hover {{
-                background-color: {DARK_THEME['accent']};
-                border-color: {DARK_THEME['accent']};
-            }}
-        """)
+        clear_btn.setStyleSheet(_STYLE_DOWNLOADS_BUTTON)
         clear_btn.clicked.connect(self._clear_all)
         header_layout.addWidget(clear_btn)
 
@@ -3475,21 +4263,16 @@ class DownloadsTab(QWidget):
 
         # Folder path display
         folder_frame = QFrame()
-        folder_frame.setStyleSheet(f"""
-            QFrame {{
-                background-color: {DARK_THEME['background']};
-                border-bottom: 1px solid {DARK_THEME['border']};
-            }}
-        """)
+        folder_frame.setStyleSheet(_STYLE_DOWNLOADS_FOLDER_FRAME)
         folder_layout = QHBoxLayout(folder_frame)
         folder_layout.setContentsMargins(12, 6, 12, 6)
 
         folder_icon = QLabel("Folder:")
-        folder_icon.setStyleSheet(f"font-size: 11px; color: {DARK_THEME['text_secondary']};")
+        folder_icon.setStyleSheet(_STYLE_DOWNLOADS_FOLDER_CAPTION)
         folder_layout.addWidget(folder_icon)
 
         self.folder_label = QLabel(PlatformBrowser.get_download_directory())
-        self.folder_label.setStyleSheet(f"font-size: 11px; color: {DARK_THEME['text_primary']};")
+        self.folder_label.setStyleSheet(_STYLE_DOWNLOAD_LABEL)
         folder_layout.addWidget(self.folder_label, 1)
 
         layout.addWidget(folder_frame)
@@ -3498,31 +4281,10 @@ class DownloadsTab(QWidget):
         self.scroll_area = QScrollArea()
         self.scroll_area.setWidgetResizable(True)
         self.scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        self.scroll_area.setStyleSheet(f"""
-            QScrollArea {{
-                border: none;
-                background-color: {DARK_THEME['background']};
-            }}
-            QScrollBar:vertical {{
-                background-color: {DARK_THEME['surface']};
-                width: 8px;
-                border-radius: 4px;
-            }}
-            QScrollBar::handle:vertical {{
-                background-color: {DARK_THEME['border']};
-                border-radius: 4px;
-                min-height: 20px;
-            }}
-            QScrollBar::handle:vertical:hover {{
-                background-color: {DARK_THEME['text_secondary']};
-            }}
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
-                height: 0px;
-            }}
-        """)
+        self.scroll_area.setStyleSheet(_STYLE_DOWNLOADS_SCROLL)
 
         self.scroll_content = QWidget()
-        self.scroll_content.setStyleSheet(f"background-color: {DARK_THEME['background']};")
+        self.scroll_content.setStyleSheet(_STYLE_BACKGROUND)
         self.entries_layout = QVBoxLayout(self.scroll_content)
         self.entries_layout.setContentsMargins(8, 8, 8, 8)
         self.entries_layout.setSpacing(6)
@@ -3531,7 +4293,7 @@ class DownloadsTab(QWidget):
         # Empty state label
         self.empty_label = QLabel("No downloads yet")
         self.empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.empty_label.setStyleSheet(f"color: {DARK_THEME['text_secondary']}; font-size: 12px; padding: 40px;")
+        self.empty_label.setStyleSheet(_STYLE_DOWNLOADS_EMPTY)
         self.entries_layout.addWidget(self.empty_label)
 
         self.scroll_area.setWidget(self.scroll_content)
@@ -3548,11 +4310,20 @@ class DownloadsTab(QWidget):
             self._entries[filename] = entry
             # Insert at top (index 0)
             self.entries_layout.insertWidget(0, entry)
+            self._trim_entries()
 
-        elif state == "progress" and filename in self._entries:
-            self._entries[filename].update_progress(percent)
+        elif state == "progress":
+            # Only the latest tick per download matters; show them every 100ms
+            if filename in self._entries:
+                self._pending_progress[filename] = percent
+                if not self._progress_flush_timer.isActive():
+                    self._progress_flush_timer.start(100)
+            return
 
-        elif state == "completed" and filename in self._entries:
+        # A final state supersedes any progress still waiting to be shown
+        self._pending_progress.pop(filename, None)
+
+        if state == "completed" and filename in self._entries:
             self._entries[filename].set_completed()
 
         elif state == "failed" and filename in self._entries:
@@ -3561,11 +4332,30 @@ class DownloadsTab(QWidget):
         elif state == "cancelled" and filename in self._entries:
             self._entries[filename].set_cancelled()
 
+    @pyqtSlot()
+    def _flush_download_progress(self):
+        """Show the most recent coalesced progress tick of each download."""
+        pending, self._pending_progress = self._pending_progress, {}
+        for filename, percent in pending.items():
+            entry = self._entries.get(filename)
+            if entry is not None:
+                entry.update_progress(percent)
+
+    def _trim_entries(self):
+        """Drop the oldest finished rows so the list holds at most _MAX_ENTRIES."""
+        excess = len(self._entries) - self._MAX_ENTRIES
+        if excess <= 0:
+            return
+        stale = [name for name, entry in self._entries.items() if entry.is_finished][:excess]
+        for name in stale:
+            self._entries.pop(name).deleteLater()
+
     def _change_folder(self):
         """Open folder picker to change download directory."""
         current = PlatformBrowser.get_download_directory()
         folder = QFileDialog.getExistingDirectory(self, "Select Download Folder", current)
-        if folder:
+        # Picking the current folder again leaves the saved setting as is
+        if folder and folder != current:
             PlatformBrowser.set_download_directory(folder)
             self.folder_label.setText(folder)
             # Persist the setting
@@ -3582,11 +4372,13 @@ class DownloadsTab(QWidget):
     def load_saved_directory(self):
         """Load the saved download directory from config."""
         settings_file = CONFIG_DIR / "download_settings.txt"
-        if settings_file.exists():
+        try:
             saved_dir = settings_file.read_text().strip()
-            if saved_dir and os.path.isdir(saved_dir):
-                PlatformBrowser.set_download_directory(saved_dir)
-                self.folder_label.setText(saved_dir)
+        except FileNotFoundError:
+            return
+        if saved_dir and os.path.isdir(saved_dir):
+            PlatformBrowser.set_download_directory(saved_dir)
+            self.folder_label.setText(saved_dir)
 
 
 class BrowserTabs(QWidget):
@@ -3595,6 +4387,9 @@ class BrowserTabs(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.platform_tabs: Dict[str, PlatformTab] = {}
+        # Platform tabs occupy the first tab indexes, in insertion order
+        self._platform_order: List[str] = []
+        self._platform_index: Dict[str, int] = {}
         self.log_tab: Optional[LogTab] = None
         self._setup_ui()
 
@@ -3628,19 +4423,13 @@ class BrowserTabs(QWidget):
             }}
         """)
 
-        platform_names = {
-            "chatgpt": "ChatGPT",
-            "gemini": "Gemini",
-            "perplexity": "Perplexity",
-            "claude": "Claude",
-            "google": "Google"
-        }
-
-        for platform, url in PLATFORMS.items():
-            tab = PlatformTab(platform, url)
-            tab.openInGoogleTab.connect(self._open_in_google_tab)
-            self.platform_tabs[platform] = tab
-            self.tabs.addTab(tab, platform_names.get(platform, platform.title()))
+        # Build only the first platform tab synchronously; the rest are
+        # constructed one per event loop tick so the UI stays responsive
+        # while each QWebEngineView attaches to its Chromium helpers.
+        self._pending_tabs = list(PLATFORMS.items())
+        self._pending_focus: Optional[str] = None
+        if self._pending_tabs:
+            self._add_platform_tab(*self._pending_tabs.pop(0))
 
         # Add Downloads tab
         self.downloads_tab = DownloadsTab()
@@ -3653,12 +4442,93 @@ class BrowserTabs(QWidget):
 
         layout.addWidget(self.tabs)
 
+        if self._pending_tabs:
+            QTimer.singleShot(0, self._build_next_tab)
+
+    def _add_platform_tab(self, platform: str, url: str):
+        """Create a platform tab and insert it after the existing platform tabs."""
+        platform_names = {
+            "chatgpt": "ChatGPT",
+            "gemini": "Gemini",
+            "perplexity": "Perplexity",
+            "claude": "Claude",
+            "google": "Google"
+        }
+
+        tab = PlatformTab(platform, url)
+        tab.openInGoogleTab.connect(self._open_in_google_tab)
+        index = len(self.platform_tabs)
+        self.platform_tabs[platform] = tab
+        self._platform_index[platform] = index
+        self._platform_order.append(platform)
+        self.tabs.insertTab(index, tab, platform_names.get(platform, platform.title()))
+        return index
+
+    def _build_next_tab(self):
+        """Construct the next queued platform tab and schedule the one after it."""
+        if not self._pending_tabs:
+            return
+
+        platform, url = self._pending_tabs.pop(0)
+        index = self._add_platform_tab(platform, url)
+
+        # Honor a show_platform_tab() request made before this tab existed
+        if self._pending_focus == platform:
+            self._pending_focus = None
+            self.tabs.setCurrentIndex(index)
+
+        if self._pending_tabs:
+            QTimer.singleShot(0, self._build_next_tab)
+
     def get_browser(self, platform: str) -> Optional[PlatformBrowser]:
         """Get the browser for a platform."""
         if platform in self.platform_tabs:
-            return self.platform_tabs[platform].browser
+            return self.platform_tabs[platform].ensure_browser()
         return None
 
+    def fill_all(self, text: str, on_all_done=None, send: bool = False):
+        """Fill (and optionally send) text on every AI platform at once.
+
+        All fills are dispatched back-to-back so the pages work in parallel;
+        on_all_done receives a {platform: result} dict after the last callback.
+        """
+        # Tabs never shown have no browser yet; build them now. Any browser
+        # still on its first load holds its fill until pageLoaded, or the
+        # script runs against a page with no input yet
+        browsers = {
+            platform: tab.ensure_browser()
+            for platform, tab in self.platform_tabs.items()
+            if platform != "google"
+        }
+        results: Dict[str, object] = {}
+
+        if not browsers:
+            if on_all_done:
+                on_all_done(results)
+            return
+
+        def make_callback(platform):
+            def on_result(result):
+                results[platform] = result
+                if len(results) == len(browsers) and on_all_done:
+                    on_all_done(results)
+            return on_result
+
+        def make_fill(platform, browser):
+            def fill(*_):
+                if send:
+                    browser.fill_input_and_send(text, make_callback(platform))
+                else:
+                    browser.fill_input_only(text, make_callback(platform))
+            return fill
+
+        for platform, browser in browsers.items():
+            fill = make_fill(platform, browser)
+            if not browser.has_loaded:
+                browser.pageLoaded.connect(fill, Qt.ConnectionType.SingleShotConnection)
+            else:
+                fill()
+
     def append_log(self, message: str, level: str = "INFO"):
         """Append a log message to the log tab."""
         if self.log_tab:
@@ -3671,25 +4541,27 @@ class BrowserTabs(QWidget):
 
     def show_platform_tab(self, platform: str):
         """Switch to a specific platform tab."""
-        if platform in self.platform_tabs:
-            index = list(self.platform_tabs.keys()).index(platform)
-            self.tabs.setCurrentIndex(index)
+        if platform in self._platform_index:
+            self.tabs.setCurrentIndex(self._platform_index[platform])
+        elif platform in PLATFORMS:
+            # Tab not constructed yet; focus it once it is built
+            self._pending_focus = platform
 
     def _open_in_google_tab(self, url: str):
         """Open a URL in the Google tab browser."""
-        print(f"[GOOGLE TAB] Opening: {url[:100]}")
+        logger.debug("[GOOGLE TAB] Opening: %s", url[:100])
         if "google" in self.platform_tabs:
             google_tab = self.platform_tabs["google"]
-            google_tab.browser.navigate(url)
+            google_tab.ensure_browser().navigate(url)
             self.show_platform_tab("google")
 
     def show_log_tab(self):
         """Switch to the log tab (at the end)."""
-        self.tabs.setCurrentIndex(len(self.platform_tabs) + 1)
+        self.tabs.setCurrentWidget(self.log_tab)
 
     def show_downloads_tab(self):
         """Switch to the downloads tab."""
-        self.tabs.setCurrentIndex(len(self.platform_tabs))
+        self.tabs.setCurrentWidget(self.downloads_tab)
 
     def clear_logs(self):
         """Clear the log output."""
@@ -3699,10 +4571,8 @@ class BrowserTabs(QWidget):
     def get_active_platform(self) -> str:
         """Return the name of the currently visible platform tab."""
         current_index = self.tabs.currentIndex()
-        platform_list = list(self.platform_tabs.keys())
-
-        if current_index < len(platform_list):
-            return platform_list[current_index]
+        if 0 <= current_index < len(self._platform_order):
+            return self._platform_order[current_index]
         return ""
 
     def get_active_browser(self) -> Optional[PlatformBrowser]:
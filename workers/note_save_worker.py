@@ -0,0 +1,55 @@
+"""Background worker for writing notebook files."""
+
+import os
+from typing import Optional
+
+from PyQt6.QtCore import QCoreApplication, QObject, QRunnable, QThreadPool, pyqtSignal
+
+_save_pool: Optional[QThreadPool] = None
+
+
+def note_save_pool() -> QThreadPool:
+    """Return the pool notes are written on.
+
+    One thread, so writes land in the order they were started. The pool is
+    parented to the application, whose teardown waits for writes still queued
+    or running, so closing a notebook mid-write can't abort the process.
+    """
+    global _save_pool
+    if _save_pool is None:
+        _save_pool = QThreadPool(QCoreApplication.instance())
+        _save_pool.setMaxThreadCount(1)
+    return _save_pool
+
+
+class NoteSaveSignals(QObject):
+    """Signals a NoteSaveWorker reports its result on."""
+
+    saveComplete = pyqtSignal(str)  # file path
+    saveError = pyqtSignal(str, str, str)  # file path, error message, unsaved content
+
+
+class NoteSaveWorker(QRunnable):
+    """Writes a note's markdown to disk on the note save pool."""
+
+    def __init__(self, file_path: str, content: str):
+        super().__init__()
+        self.file_path = file_path
+        self.content = content
+        self.signals = NoteSaveSignals()
+
+    def run(self):
+        # Write beside the target and swap it in, so an interrupted write
+        # never leaves the note truncated
+        temp_path = f"{self.file_path}.tmp"
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                f.write(self.content)
+            os.replace(temp_path, self.file_path)
+            self.signals.saveComplete.emit(self.file_path)
+        except Exception as e:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            self.signals.saveError.emit(self.file_path, str(e), self.content)